@@ -11,6 +11,15 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = 'django-insecure-your-secret-key-here-change-in-production'
 
+# Clave del índice ciego de la clave del cliente (HMAC). Si cambia, ejecutar
+# python manage.py indexar_claves_cliente
+BLIND_INDEX_KEY = os.environ.get('BLIND_INDEX_KEY', SECRET_KEY)
+
+# Claves Fernet de la clave del cliente, separadas por comas: la primera cifra y
+# todas descifran. Para rotar, anteponer la nueva y ejecutar
+# python manage.py recifrar_claves_cliente. Sin valor se deriva de SECRET_KEY.
+ENCRYPTION_KEYS = [clave for clave in os.environ.get('ENCRYPTION_KEYS', '').split(',') if clave]
+
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
 
@@ -70,6 +79,26 @@ DATABASES = {
     }
 }
 
+# Caché: con REDIS_URL se comparte entre el proceso web, procesar_estados y
+# procesar_exportaciones (docker-compose levanta el servicio redis). La memoria
+# local es solo para desarrollo: cada proceso tiene la suya, por lo que los
+# fragmentos del dashboard y las listas de ids no se cachean (ver
+# plazos.utils.cache_dashboard.cache_compartido)
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'calendario-judicial',
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -0,0 +1,32 @@
+# language: es
+# encoding: utf-8
+
+Característica: Búsqueda por clave del cliente
+  Como abogado
+  Quiero encontrar mis plazos por la clave del cliente
+  Para ubicar las causas de un cliente aunque su clave se guarde cifrada
+
+  Antecedentes:
+    Dado que estoy autenticado como "abogado"
+    Y que tengo plazos con las claves de cliente
+      | rol        | clave_cliente |
+      | C-101-2030 | Árbol-Norte   |
+      | C-102-2030 | arbusto-sur   |
+      | C-103-2030 | Roble-Este    |
+    Y que otro abogado tiene un plazo con la clave de cliente "arbol-norte"
+
+  Escenario: Buscar por el comienzo de la clave
+    Cuando busco la clave "arb"
+    Entonces debería encontrar los roles "C-101-2030, C-102-2030"
+
+  Escenario: La búsqueda no distingue tildes ni mayúsculas
+    Cuando busco la clave "ARBOL-N"
+    Entonces debería encontrar los roles "C-101-2030"
+
+  Escenario: Buscar por la clave completa
+    Cuando busco la clave "roble-este"
+    Entonces debería encontrar los roles "C-103-2030"
+
+  Escenario: Un prefijo demasiado corto no busca por clave
+    Cuando busco la clave "ar"
+    Entonces no debería encontrar plazos
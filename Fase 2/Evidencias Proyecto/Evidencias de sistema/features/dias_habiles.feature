@@ -0,0 +1,20 @@
+# language: es
+# encoding: utf-8
+
+Característica: Cálculo de días hábiles con cierres de tribunal
+  Como abogado
+  Quiero que los vencimientos consideren los cierres de tribunal registrados
+  Para no contar como hábiles los días en que el tribunal no funciona
+
+  Escenario: Un cierre de tribunal registrado desplaza los vencimientos nuevos
+    Dado que estoy autenticado como "abogado"
+    Cuando creo un plazo de 10 días hábiles desde "2031-06-02"
+    Entonces la fecha de vencimiento debería ser "2031-06-16"
+    Cuando se registra un cierre de tribunal del "2031-06-04" al "2031-06-06"
+    Y creo un plazo de 10 días hábiles desde "2031-06-02"
+    Entonces la fecha de vencimiento debería ser "2031-06-19"
+    Y debería haber 7 días hábiles entre "2031-06-02" y "2031-06-13"
+    Cuando se elimina el cierre de tribunal
+    Y creo un plazo de 10 días hábiles desde "2031-06-02"
+    Entonces la fecha de vencimiento debería ser "2031-06-16"
+    Y debería haber 10 días hábiles entre "2031-06-02" y "2031-06-13"
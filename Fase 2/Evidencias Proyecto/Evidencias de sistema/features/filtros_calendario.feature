@@ -0,0 +1,54 @@
+# language: es
+# encoding: utf-8
+
+Característica: Compilación de los filtros del calendario
+  Como abogado
+  Quiero que el calendario y las exportaciones apliquen los mismos filtros
+  Para obtener siempre los mismos plazos con los mismos parámetros
+
+  Escenario: Los filtros combinados encuentran solo los plazos que cumplen todos
+    Dado que estoy autenticado como "abogado"
+    Y que tengo varios plazos judiciales creados
+    Cuando compilo los filtros del calendario
+      | parametro      | valor     |
+      | estado         | corriendo |
+      | tipo_documento | demanda   |
+    Y aplico el filtro a mis plazos
+    Entonces debería encontrar los roles "222222222"
+
+  Escenario: Solo urgentes se intersecta con el estado elegido
+    Cuando compilo los filtros del calendario
+      | parametro     | valor     |
+      | estado        | corriendo |
+      | solo_urgentes | on        |
+    Entonces el filtro debería permitir solo los estados "corriendo"
+    Y el filtro debería limitar el vencimiento a los próximos días urgentes
+
+  Escenario: Estados contradictorios no consultan la base de datos
+    Dado que estoy autenticado como "abogado"
+    Cuando compilo los filtros del calendario
+      | parametro     | valor     |
+      | estado        | corriendo |
+      | solo_vencidos | on        |
+    Entonces el filtro debería estar vacío
+    Y aplicar el filtro no debería consultar la base de datos
+
+  Escenario: Un rango de fechas invertido no coincide con ningún plazo
+    Cuando compilo los filtros del calendario
+      | parametro   | valor      |
+      | fecha_desde | 2030-06-30 |
+      | fecha_hasta | 2030-06-01 |
+    Entonces el filtro debería estar vacío
+
+  Escenario: La clave del filtro no depende de la forma de los parámetros
+    Cuando compilo los filtros del calendario
+      | parametro | valor      |
+      | busqueda  | C-101-2030 |
+      | estado    | corriendo  |
+    Y compilo otros filtros del calendario
+      | parametro       | valor      |
+      | estado          | corriendo  |
+      | busqueda        | c-101-2030 |
+      | direccion_orden | desc       |
+    Entonces ambos filtros deberían tener la misma clave
+    Y ambos filtros deberían tener distinta clave de orden
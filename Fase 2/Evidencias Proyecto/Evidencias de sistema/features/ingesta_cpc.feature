@@ -0,0 +1,22 @@
+# language: es
+# encoding: utf-8
+
+Característica: Ingesta del texto completo del CPC
+  Como administrador del sistema
+  Quiero dividir una exportación de LeyChile en artículos
+  Para tener los plazos de cada artículo del Código de Procedimiento Civil
+
+  Escenario: Las remisiones al inicio de un párrafo no abren artículos
+    Dado el extracto del CPC "cpc_extracto.html"
+    Cuando divido el extracto en artículos
+    Entonces debería obtener los artículos
+      | articulo | dias_plazo | titulo                        |
+      | 253      |            | TITULO I - DE LA DEMANDA      |
+      | 254      |            | TITULO I - DE LA DEMANDA      |
+      | 254 bis  | 5          | TITULO I - DE LA DEMANDA      |
+      | 255      |            | TITULO I - DE LA DEMANDA      |
+      | 256      |            | TITULO I - DE LA DEMANDA      |
+      | 258      | 15         | TITULO II - DEL EMPLAZAMIENTO |
+      | 259      | 18         | TITULO II - DEL EMPLAZAMIENTO |
+    Y el artículo "255" debería contener "Art. 258 dispone que"
+    Y el artículo "255" debería contener "Art. 254 establece"
@@ -0,0 +1,44 @@
+# language: es
+# encoding: utf-8
+
+Característica: Paginación del calendario por cursor
+  Como abogado con muchos plazos
+  Quiero avanzar y retroceder por las páginas del calendario
+  Para revisar todos mis plazos sin que las páginas se repitan ni se salten
+
+  Escenario: Avanzar y retroceder con los cursores
+    Dado que estoy autenticado como "abogado"
+    Y que tengo 25 plazos con vencimientos distintos
+    Cuando pido la primera página de 10 plazos
+    Entonces la página debería mostrar los plazos 1 a 10 de 25
+    Cuando avanzo a la página siguiente
+    Entonces la página debería mostrar los plazos 11 a 20 de 25
+    Cuando avanzo a la página siguiente
+    Entonces la página debería mostrar los plazos 21 a 25 de 25
+    Y no debería haber página siguiente
+    Cuando retrocedo a la página anterior
+    Entonces la página debería mostrar los plazos 11 a 20 de 25
+    Cuando retrocedo a la página anterior
+    Entonces la página debería mostrar los plazos 1 a 10 de 25
+    Y no debería haber página anterior
+
+  Escenario: Avanzar en orden descendente
+    Dado que estoy autenticado como "abogado"
+    Y que tengo 25 plazos con vencimientos distintos
+    Cuando pido la primera página de 10 plazos en orden descendente
+    Y avanzo a la página siguiente
+    Entonces la página debería mostrar los plazos 11 a 20 de 25
+
+  Escenario: Un cursor alterado vuelve a la primera página
+    Dado que estoy autenticado como "abogado"
+    Y que tengo 25 plazos con vencimientos distintos
+    Cuando pido la primera página de 10 plazos
+    Y avanzo a la página siguiente con el cursor alterado
+    Entonces la página debería mostrar los plazos 1 a 10 de 25
+
+  Escenario: Un cursor de otro orden vuelve a la primera página
+    Dado que estoy autenticado como "abogado"
+    Y que tengo 25 plazos con vencimientos distintos
+    Cuando pido la primera página de 10 plazos
+    Y cambio a orden descendente con el cursor de la página siguiente
+    Entonces la página debería mostrar los plazos 1 a 10 de 25
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Pasos para la búsqueda por clave del cliente (índice ciego)
+"""
+import random
+import time
+from behave import given, when, then
+from datetime import date
+from django.contrib.auth import get_user_model
+from plazos.models import PlazoJudicial
+from plazos.utils.busqueda import buscar_plazos
+
+User = get_user_model()
+
+
+def _crear_plazo(usuario, rol, clave_cliente):
+    return PlazoJudicial.objects.create(
+        usuario=usuario,
+        tipo_documento='contestacion',
+        procedimiento='ordinario',
+        dias_plazo=15,
+        tipo_dia='habil',
+        fecha_inicio=date(2030, 3, 4),
+        rol=rol,
+        clave_cliente=clave_cliente,
+        estado='corriendo'
+    )
+
+
+@given('que tengo plazos con las claves de cliente')
+def step_tengo_plazos_con_claves(context):
+    """Crear un plazo por fila de la tabla"""
+    for row in context.table:
+        _crear_plazo(context.current_user, row['rol'], row['clave_cliente'])
+
+@given('que otro abogado tiene un plazo con la clave de cliente "{clave_cliente}"')
+def step_otro_abogado_tiene_plazo(context, clave_cliente):
+    """Crear un plazo con la misma clave para otro usuario"""
+    timestamp = str(int(time.time() * 1000))[-8:]
+    random_suffix = str(random.randint(100, 999))
+    otro = User.objects.create_user(
+        username=f'otro_abogado_{timestamp}_{random_suffix}',
+        email=f'otro_abogado_{timestamp}_{random_suffix}@example.com',
+        password='testpass123',
+        tipo_usuario='abogado',
+        rut=f'{timestamp}{random_suffix}-{random.randint(0, 9)}'
+    )
+    _crear_plazo(otro, 'C-900-2030', clave_cliente)
+
+@when('busco la clave "{texto}"')
+def step_busco_la_clave(context, texto):
+    """Buscar con la búsqueda rápida del calendario"""
+    context.resultados = buscar_plazos(context.current_user, texto)
+
+@then('debería encontrar los roles "{roles}"')
+def step_deberia_encontrar_roles(context, roles):
+    """Verificar los roles encontrados (solo del usuario autenticado)"""
+    encontrados = sorted(plazo.rol for plazo in context.resultados)
+    assert encontrados == sorted(rol.strip() for rol in roles.split(',')), encontrados
+
+@then('no debería encontrar plazos')
+def step_no_deberia_encontrar_plazos(context):
+    """Verificar que la búsqueda no devolvió resultados"""
+    assert context.resultados == [], context.resultados
@@ -14,6 +14,18 @@ import time
 
 User = get_user_model()
 
+
+def exportar_en_segundo_plano(context, url):
+    """Encola la exportación, ejecuta el procesador y descarga el archivo generado"""
+    from django.core.management import call_command
+    
+    respuesta = context.client.get(url, HTTP_ACCEPT='application/json')
+    assert respuesta.status_code in (200, 202)
+    call_command('procesar_exportaciones', una_vez=True)
+    estado = context.client.get(respuesta.json()['url_estado']).json()
+    assert estado['url_descarga'], estado
+    context.response = context.client.get(estado['url_descarga'])
+
 # ============================================================================
 # PASOS GENÉRICOS - GIVEN
 # ============================================================================
@@ -282,11 +294,11 @@ def step_ordeno_por(context, criterio):
 def step_exporto_plazos(context, formato):
     """Exportar plazos a formato específico"""
     if formato == 'PDF':
-        context.response = context.client.get('/exportar/pdf/')
+        exportar_en_segundo_plano(context, '/exportar/pdf/')
     elif formato == 'ICS':
         context.response = context.client.get('/exportar/ics/')
     elif formato == 'Excel':
-        context.response = context.client.get('/exportar/excel/')
+        exportar_en_segundo_plano(context, '/exportar/excel/')
     elif formato == 'CSV':
         context.response = context.client.get('/exportar/csv/')
 
@@ -590,7 +602,7 @@ def step_selecciono_periodo_ultimo_mes(context):
 def step_exporto_plazos_seleccionados(context, formato):
     """Exportar plazos seleccionados"""
     if formato == 'PDF':
-        context.response = context.client.get('/exportar/pdf/')
+        exportar_en_segundo_plano(context, '/exportar/pdf/')
     elif formato == 'ICS':
         context.response = context.client.get('/exportar/ics/')
 
@@ -603,7 +615,7 @@ def step_filtro_plazos_estado_corriendo(context):
 def step_exporto_plazos_filtrados(context, formato):
     """Exportar plazos filtrados"""
     if formato == 'PDF':
-        context.response = context.client.get('/exportar/pdf/')
+        exportar_en_segundo_plano(context, '/exportar/pdf/')
     elif formato == 'ICS':
         context.response = context.client.get('/exportar/ics/')
 
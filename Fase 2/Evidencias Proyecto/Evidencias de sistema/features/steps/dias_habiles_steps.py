@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Pasos para el cálculo de días hábiles con cierres de tribunal
+"""
+from behave import when, then
+from datetime import date
+from plazos.models import FeriadoJudicial, PlazoJudicial
+from plazos.utils.dias_habiles import obtener_calendario_habil
+
+
+@when('creo un plazo de {dias:d} días hábiles desde "{fecha}"')
+def step_creo_plazo_dias_habiles(context, dias, fecha):
+    """Crear un plazo de días hábiles (su vencimiento se calcula al guardar)"""
+    context.plazo = PlazoJudicial.objects.create(
+        usuario=context.current_user,
+        tipo_documento='contestacion',
+        procedimiento='ordinario',
+        dias_plazo=dias,
+        tipo_dia='habil',
+        fecha_inicio=date.fromisoformat(fecha),
+        rol='C-100-2031',
+        estado='corriendo'
+    )
+
+@when('se registra un cierre de tribunal del "{fecha_inicio}" al "{fecha_fin}"')
+def step_registra_cierre_tribunal(context, fecha_inicio, fecha_fin):
+    """Registrar un cierre; la señal de FeriadoJudicial cambia la versión de feriados"""
+    context.feriado = FeriadoJudicial.objects.create(
+        nombre='Cierre de prueba',
+        tipo='cierre_tribunal',
+        fecha_inicio=date.fromisoformat(fecha_inicio),
+        fecha_fin=date.fromisoformat(fecha_fin),
+    )
+    context.add_cleanup(FeriadoJudicial.objects.filter(pk=context.feriado.pk).delete)
+
+@when('se elimina el cierre de tribunal')
+def step_elimina_cierre_tribunal(context):
+    """Eliminar el cierre registrado en el escenario"""
+    context.feriado.delete()
+
+@then('debería haber {cantidad:d} días hábiles entre "{fecha_inicio}" y "{fecha_fin}"')
+def step_deberia_haber_dias_habiles(context, cantidad, fecha_inicio, fecha_fin):
+    """Contar días hábiles con el calendario compartido del proceso"""
+    contados = obtener_calendario_habil().contar_dias_habiles(
+        date.fromisoformat(fecha_inicio), date.fromisoformat(fecha_fin)
+    )
+    assert contados == cantidad, contados
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Pasos para la compilación de los filtros del calendario
+"""
+from behave import when, then
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from plazos.utils.estados import fecha_hoy_tribunales
+from plazos.utils.filtros import DIAS_URGENCIA, compilar_parametros
+
+
+def _parametros(context):
+    parametros = {}
+    for row in context.table:
+        parametros.setdefault(row['parametro'], []).append(row['valor'])
+    return parametros
+
+
+@when('compilo los filtros del calendario')
+def step_compilo_filtros(context):
+    """Compilar los parámetros como los recibe el calendario"""
+    context.filtro = compilar_parametros(_parametros(context))
+
+@when('compilo otros filtros del calendario')
+def step_compilo_otros_filtros(context):
+    """Compilar un segundo conjunto de parámetros para compararlos"""
+    context.otro_filtro = compilar_parametros(_parametros(context))
+
+@when('aplico el filtro a mis plazos')
+def step_aplico_filtro(context):
+    """Consultar los plazos del usuario con el filtro compilado"""
+    context.resultados = list(context.filtro.queryset(context.current_user.pk))
+
+@then('el filtro debería estar vacío')
+def step_filtro_deberia_estar_vacio(context):
+    """Verificar que los filtros no pueden coincidir con ningún plazo"""
+    assert context.filtro.vacio
+
+@then('aplicar el filtro no debería consultar la base de datos')
+def step_filtro_no_consulta(context):
+    """Evaluar el queryset contando las consultas"""
+    with CaptureQueriesContext(connection) as consultas:
+        assert list(context.filtro.queryset(context.current_user.pk)) == []
+    assert len(consultas) == 0, consultas.captured_queries
+
+@then('el filtro debería permitir solo los estados "{estados}"')
+def step_filtro_estados(context, estados):
+    """Verificar la intersección de estados"""
+    assert not context.filtro.vacio
+    assert context.filtro.criterios['estados'] == sorted(estado.strip() for estado in estados.split(','))
+
+@then('el filtro debería limitar el vencimiento a los próximos días urgentes')
+def step_filtro_limite_urgencia(context):
+    """Verificar el límite superior de vencimiento de solo_urgentes"""
+    limite = fecha_hoy_tribunales() + timedelta(days=DIAS_URGENCIA)
+    assert context.filtro.criterios['vencimiento_hasta'] == limite.isoformat()
+
+@then('ambos filtros deberían tener la misma clave')
+def step_filtros_misma_clave(context):
+    """Verificar que la clave no depende del orden ni de las mayúsculas"""
+    assert context.filtro.clave == context.otro_filtro.clave
+
+@then('ambos filtros deberían tener distinta clave de orden')
+def step_filtros_distinta_clave_orden(context):
+    """Verificar que la clave de orden sí incluye la dirección"""
+    assert context.filtro.clave_orden != context.otro_filtro.clave_orden
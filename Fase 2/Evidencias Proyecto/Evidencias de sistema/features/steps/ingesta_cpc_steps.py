@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Pasos para la ingesta del texto completo del CPC
+"""
+from behave import given, when, then
+from plazos.scrapers.ingesta_cpc import iterar_articulos
+from plazos.scrapers.servidor_leychile import DIRECTORIO_FIXTURES
+
+
+def _nombre_articulo(articulo):
+    return f"{articulo['numero']} {articulo['sufijo']}".strip()
+
+
+@given('el extracto del CPC "{archivo}"')
+def step_extracto_cpc(context, archivo):
+    """Archivo de fixtures_leychile con un extracto del CPC"""
+    context.ruta_cpc = DIRECTORIO_FIXTURES / archivo
+
+@when('divido el extracto en artículos')
+def step_divido_extracto(context):
+    """Dividir el extracto como lo hace el comando ingestar_cpc"""
+    context.articulos_cpc = {
+        _nombre_articulo(articulo): articulo for articulo in iterar_articulos(context.ruta_cpc)
+    }
+
+@then('debería obtener los artículos')
+def step_deberia_obtener_articulos(context):
+    """Verificar los artículos, sus plazos y su título"""
+    assert list(context.articulos_cpc) == [row['articulo'] for row in context.table], list(context.articulos_cpc)
+    for row in context.table:
+        articulo = context.articulos_cpc[row['articulo']]
+        dias_plazo = int(row['dias_plazo']) if row['dias_plazo'] else None
+        assert articulo['dias_plazo'] == dias_plazo, (row['articulo'], articulo['dias_plazo'])
+        assert articulo['titulo'] == row['titulo'], (row['articulo'], articulo['titulo'])
+
+@then('el artículo "{nombre}" debería contener "{texto}"')
+def step_articulo_deberia_contener(context, nombre, texto):
+    """Verificar que un párrafo quedó en el artículo indicado"""
+    assert texto in context.articulos_cpc[nombre]['texto']
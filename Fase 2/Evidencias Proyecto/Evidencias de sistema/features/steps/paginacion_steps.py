@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Pasos para la paginación por cursor del calendario
+"""
+from behave import given, when, then
+from datetime import date, timedelta
+from plazos.models import PlazoJudicial
+from plazos.utils.filtros import ordenar_plazos
+from plazos.utils.paginacion import paginar_por_cursor
+
+
+def _pedir_pagina(context, cursor=None):
+    plazos = PlazoJudicial.objects.filter(usuario=context.current_user)
+    context.pagina = paginar_por_cursor(
+        plazos, direccion=context.direccion, cursor=cursor,
+        por_pagina=context.por_pagina, total=plazos.count(),
+    )
+    context.ids_esperados = list(
+        ordenar_plazos(plazos, direccion=context.direccion).values_list('id', flat=True)
+    )
+
+
+@given('que tengo {cantidad:d} plazos con vencimientos distintos')
+def step_tengo_plazos_vencimientos_distintos(context, cantidad):
+    """Crear plazos de días corridos que vencen en días consecutivos"""
+    for numero in range(cantidad):
+        PlazoJudicial.objects.create(
+            usuario=context.current_user,
+            tipo_documento='contestacion',
+            procedimiento='ordinario',
+            dias_plazo=10,
+            tipo_dia='corrido',
+            fecha_inicio=date(2030, 3, 1) + timedelta(days=numero),
+            rol=f'C-{numero + 1:03d}-2030',
+            estado='corriendo'
+        )
+
+@when('pido la primera página de {por_pagina:d} plazos')
+def step_pido_primera_pagina(context, por_pagina):
+    """Pedir la primera página en orden ascendente"""
+    context.por_pagina = por_pagina
+    context.direccion = 'asc'
+    _pedir_pagina(context)
+
+@when('pido la primera página de {por_pagina:d} plazos en orden descendente')
+def step_pido_primera_pagina_descendente(context, por_pagina):
+    """Pedir la primera página en orden descendente"""
+    context.por_pagina = por_pagina
+    context.direccion = 'desc'
+    _pedir_pagina(context)
+
+@when('avanzo a la página siguiente')
+def step_avanzo_pagina_siguiente(context):
+    """Pedir la página siguiente con su cursor"""
+    assert context.pagina.has_next()
+    _pedir_pagina(context, context.pagina.cursor_siguiente)
+
+@when('retrocedo a la página anterior')
+def step_retrocedo_pagina_anterior(context):
+    """Pedir la página anterior con su cursor"""
+    assert context.pagina.has_previous()
+    _pedir_pagina(context, context.pagina.cursor_anterior)
+
+@when('avanzo a la página siguiente con el cursor alterado')
+def step_avanzo_cursor_alterado(context):
+    """Cambiar un carácter de los datos del cursor, conservando la firma"""
+    cursor = context.pagina.cursor_siguiente
+    posicion = cursor.index(':') // 2
+    alterado = cursor[:posicion] + ('A' if cursor[posicion] != 'A' else 'B') + cursor[posicion + 1:]
+    _pedir_pagina(context, alterado)
+
+@when('cambio a orden descendente con el cursor de la página siguiente')
+def step_cambio_orden_con_cursor(context):
+    """Usar un cursor firmado para el orden ascendente en el descendente"""
+    cursor = context.pagina.cursor_siguiente
+    context.direccion = 'desc'
+    _pedir_pagina(context, cursor)
+
+@then('la página debería mostrar los plazos {inicio:d} a {fin:d} de {total:d}')
+def step_pagina_deberia_mostrar(context, inicio, fin, total):
+    """Verificar las filas de la página contra el orden completo del calendario"""
+    pagina = context.pagina
+    assert (pagina.start_index(), pagina.end_index(), pagina.total) == (inicio, fin, total), \
+        (pagina.start_index(), pagina.end_index(), pagina.total)
+    assert [plazo.id for plazo in pagina] == context.ids_esperados[inicio - 1:fin]
+
+@then('no debería haber página siguiente')
+def step_no_deberia_haber_siguiente(context):
+    """Verificar que es la última página"""
+    assert not context.pagina.has_next()
+
+@then('no debería haber página anterior')
+def step_no_deberia_haber_anterior(context):
+    """Verificar que es la primera página"""
+    assert not context.pagina.has_previous()
@@ -81,7 +81,7 @@ class AdvancedSearch {
             this.showLoadingIndicator();
             
             // Realizar búsqueda AJAX
-            const response = await fetch(`/calendario/?busqueda=${encodeURIComponent(query)}&ajax=1`);
+            const response = await fetch(`/api/buscar/?q=${encodeURIComponent(query)}`);
             const data = await response.json();
             
             // Procesar resultados
@@ -49,9 +49,6 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     });
 
-    // Actualizar estados automáticamente cada 5 minutos
-    setInterval(updatePlazoStates, 300000); // 5 minutos
-
     // Efectos de hover en cards
     var cards = document.querySelectorAll('.card-stat');
     cards.forEach(function(card) {
@@ -108,27 +105,6 @@ function validateRUT(rut) {
     return dv === calculatedDV;
 }
 
-// Función para actualizar estados de plazos
-function updatePlazoStates() {
-    fetch('/api/actualizar-estados/', {
-        method: 'POST',
-        headers: {
-            'X-CSRFToken': getCSRFToken(),
-            'Content-Type': 'application/json',
-        },
-    })
-    .then(response => response.json())
-    .then(data => {
-        if (data.success && data.actualizados > 0) {
-            console.log(`Estados actualizados: ${data.actualizados} plazos`);
-            showNotification(`Se actualizaron ${data.actualizados} plazos`, 'info');
-        }
-    })
-    .catch(error => {
-        console.error('Error actualizando estados:', error);
-    });
-}
-
 // Función para obtener el token CSRF
 function getCSRFToken() {
     var token = document.querySelector('[name=csrfmiddlewaretoken]');
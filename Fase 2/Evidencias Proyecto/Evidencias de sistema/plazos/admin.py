@@ -2,8 +2,9 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
-from .models import PlazoJudicial
+from .models import PlazoJudicial, FeriadoJudicial
 from .utils.plazos import es_plazo_urgente, formatear_fecha_chilena
+from .utils.estados import aplicar_transiciones_estado
 
 
 @admin.register(PlazoJudicial)
@@ -148,12 +149,8 @@ class PlazoJudicialAdmin(admin.ModelAdmin):
         """
         Acción para actualizar estados de plazos.
         """
-        actualizados = 0
-        for plazo in queryset:
-            estado_anterior = plazo.estado
-            plazo.actualizar_estado()
-            if plazo.estado != estado_anterior:
-                actualizados += 1
+        resultado = aplicar_transiciones_estado(queryset)
+        actualizados = resultado['total']
         
         self.message_user(
             request,
@@ -175,6 +172,20 @@ class PlazoJudicialAdmin(admin.ModelAdmin):
         js = ('admin/js/plazos_admin.js',)
 
 
+@admin.register(FeriadoJudicial)
+class FeriadoJudicialAdmin(admin.ModelAdmin):
+    """
+    Configuración del admin para FeriadoJudicial.
+    Los cambios invalidan el caché de feriados mediante señales.
+    """
+    
+    list_display = ['nombre', 'tipo', 'fecha_inicio', 'fecha_fin', 'activo']
+    list_filter = ['tipo', 'activo', 'fecha_inicio']
+    search_fields = ['nombre', 'observaciones']
+    ordering = ['-fecha_inicio']
+    readonly_fields = ['created_at', 'updated_at']
+
+
 # Configuración del sitio admin
 admin.site.site_header = "Calendario Judicial - Administración"
 admin.site.site_title = "Calendario Judicial"
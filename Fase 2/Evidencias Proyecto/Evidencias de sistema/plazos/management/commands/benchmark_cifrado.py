@@ -0,0 +1,72 @@
+"""
+Comando de Django para medir el rendimiento del descifrado de claves de cliente.
+"""
+import random
+import string
+import time
+
+from cryptography.fernet import Fernet
+from django.core.management.base import BaseCommand, CommandError
+
+from plazos.utils.cifrado import cifrar, descifrar, descifrar_lote, obtener_claves, obtener_cifrador
+
+
+class Command(BaseCommand):
+    help = 'Compara el descifrado construyendo Fernet por fila contra el cifrador compartido y por lotes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--filas',
+            type=int,
+            default=10000,
+            help='Número de claves cifradas a descifrar (por defecto 10000)',
+        )
+        parser.add_argument(
+            '--semilla',
+            type=int,
+            default=42,
+            help='Semilla para generar los datos de prueba',
+        )
+
+    def handle(self, *args, **options):
+        filas = options['filas']
+        if filas <= 0:
+            raise CommandError('--filas debe ser mayor que cero')
+
+        aleatorio = random.Random(options['semilla'])
+        textos = [
+            ''.join(aleatorio.choices(string.ascii_letters + string.digits, k=aleatorio.randint(6, 20)))
+            for _ in range(filas)
+        ]
+        obtener_cifrador()
+        tokens = [cifrar(texto) for texto in textos]
+
+        self.stdout.write(self.style.SUCCESS(f'Benchmark de descifrado con {filas} claves'))
+
+        # Comportamiento anterior: obtener la clave y construir Fernet en cada llamada
+        inicio = time.perf_counter()
+        por_fila = [Fernet(obtener_claves()[0]).decrypt(token.encode()).decode() for token in tokens]
+        tiempo_por_fila = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        compartido = [descifrar(token) for token in tokens]
+        tiempo_compartido = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        lote = descifrar_lote(tokens)
+        tiempo_lote = time.perf_counter() - inicio
+
+        if not (por_fila == compartido == lote == textos):
+            raise CommandError('Los resultados del descifrado no coinciden')
+
+        self.stdout.write('')
+        for nombre, tiempo in [
+            ('Fernet por fila', tiempo_por_fila),
+            ('Cifrador compartido', tiempo_compartido),
+            ('descifrar_lote', tiempo_lote),
+        ]:
+            self.stdout.write(
+                f'  {nombre:<20} {tiempo:.3f} s ({filas / tiempo:,.0f} filas/s, '
+                f'{tiempo * 10000 / filas * 1000:.1f} ms por 10k)'
+            )
+        self.stdout.write(f'  Aceleración lote:    {tiempo_por_fila / tiempo_lote:.1f}x')
@@ -0,0 +1,136 @@
+"""
+Comando de Django para medir el tiempo y la memoria de la exportación a PDF.
+"""
+import multiprocessing
+import resource
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Count
+
+from plazos.models import PlazoJudicial
+from plazos.utils.export import generar_pdf
+
+
+def _generar_pdf_tabla_unica(plazos, destino, titulo):
+    """
+    Implementación anterior: una sola tabla con todas las filas y un comando
+    de estilo por cada fila alternada.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
+
+    plazos = list(plazos)
+    doc = SimpleDocTemplate(destino, pagesize=landscape(A4) if len(plazos) > 10 else A4,
+                            rightMargin=50, leftMargin=50, topMargin=72, bottomMargin=50)
+    data = [['Doc.', 'Procedimiento', 'Inicio', 'Vencimiento', 'Estado', 'RUT']]
+    for plazo in plazos:
+        data.append([
+            plazo.get_tipo_documento_display(),
+            plazo.get_procedimiento_display(),
+            plazo.fecha_inicio.strftime("%d/%m/%Y") if plazo.fecha_inicio else "-",
+            plazo.fecha_vencimiento.strftime("%d/%m/%Y") if plazo.fecha_vencimiento else "-",
+            plazo.get_estado_display(),
+            plazo.rut_cliente,
+        ])
+    table = Table(data, colWidths=[1.5*inch, 2.5*inch, 1.2*inch, 1.2*inch, 1*inch, 1.5*inch])
+    table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ])
+    for i in range(1, len(data)):
+        if i % 2 == 0:
+            table_style.add('BACKGROUND', (0, i), (-1, i), colors.lightgrey)
+    table.setStyle(table_style)
+    doc.build([table])
+    return len(plazos)
+
+
+IMPLEMENTACIONES = {
+    'tabla_unica': _generar_pdf_tabla_unica,
+    'por_paginas': generar_pdf,
+}
+
+
+def _medir(nombre, usuario_id, filas, salida):
+    """Ejecuta una implementación en un proceso hijo y reporta tiempo y memoria."""
+    inicial = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    plazos = PlazoJudicial.objects.filter(usuario_id=usuario_id).order_by('fecha_vencimiento', 'fecha_inicio')[:filas]
+    inicio = time.perf_counter()
+    with tempfile.TemporaryFile() as destino:
+        total = IMPLEMENTACIONES[nombre](plazos, destino, 'Benchmark')
+        tamano = destino.tell()
+    tiempo = time.perf_counter() - inicio
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    connections.close_all()
+    salida.send((total, tiempo, pico / 1024, (pico - inicial) / 1024, tamano / 1024 / 1024))
+
+
+class Command(BaseCommand):
+    help = 'Mide tiempo y memoria máxima (RSS) de la exportación a PDF para distintas cantidades de plazos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--filas',
+            default='1000,10000,50000',
+            help='Cantidades de plazos separadas por comas (por defecto 1000,10000,50000)',
+        )
+        parser.add_argument(
+            '--usuario',
+            type=int,
+            help='Id del usuario cuyos plazos se exportan (por defecto el que tiene más)',
+        )
+        parser.add_argument(
+            '--limite-anterior',
+            type=int,
+            default=10000,
+            help='Máximo de plazos con los que se mide la implementación anterior (por defecto 10000)',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            cantidades = [int(valor) for valor in options['filas'].split(',')]
+        except ValueError:
+            raise CommandError('--filas debe ser una lista de enteros separados por comas')
+        if any(cantidad <= 0 for cantidad in cantidades):
+            raise CommandError('--filas debe contener cantidades mayores que cero')
+
+        usuario_id = options['usuario'] or (
+            PlazoJudicial.objects.values('usuario_id').annotate(total=Count('id'))
+            .order_by('-total').values_list('usuario_id', flat=True).first()
+        )
+        if usuario_id is None:
+            raise CommandError('No hay plazos para exportar')
+        disponibles = PlazoJudicial.objects.filter(usuario_id=usuario_id).count()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Benchmark de exportación PDF (usuario {usuario_id}, {disponibles} plazos disponibles)'
+        ))
+        self.stdout.write('')
+        self.stdout.write(
+            f"  {'Implementación':<14} {'Plazos':>8} {'Tiempo':>9} {'Plazos/s':>9} "
+            f"{'RSS máx.':>10} {'Incremento':>11} {'Archivo':>9}"
+        )
+
+        # Cada medición en un proceso nuevo: el RSS máximo no se contamina entre corridas
+        contexto = multiprocessing.get_context('fork')
+        connections.close_all()
+        for cantidad in cantidades:
+            for nombre in IMPLEMENTACIONES:
+                if nombre == 'tabla_unica' and cantidad > options['limite_anterior']:
+                    self.stdout.write(f'  {nombre:<14} {cantidad:>8} {"(omitido)":>9}')
+                    continue
+                receptor, emisor = contexto.Pipe(duplex=False)
+                proceso = contexto.Process(target=_medir, args=(nombre, usuario_id, cantidad, emisor))
+                proceso.start()
+                total, tiempo, pico, incremento, tamano = receptor.recv()
+                proceso.join()
+                self.stdout.write(
+                    f'  {nombre:<14} {total:>8} {tiempo:>8.2f}s {total / tiempo:>9,.0f} '
+                    f'{pico:>7.0f} MB {incremento:>8.0f} MB {tamano:>6.1f} MB'
+                )
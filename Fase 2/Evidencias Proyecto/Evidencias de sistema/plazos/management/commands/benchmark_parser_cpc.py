@@ -0,0 +1,251 @@
+"""
+Comando de Django para medir el parser de artículos del CPC (artículos/segundo)
+sobre las páginas grabadas de LeyChile.
+
+Se mide por separado la velocidad por página de cada implementación (efecto de
+las expresiones compiladas) y la de la extracción completa página × término,
+donde además influye reutilizar el análisis de cada página entre términos.
+"""
+import re
+import time
+
+from bs4 import BeautifulSoup
+from django.core.management.base import BaseCommand, CommandError
+
+from plazos.scrapers.cpc_scraper import CPCScraper, PARSER_HTML, TERMINOS_BUSQUEDA
+from plazos.scrapers.servidor_leychile import DIRECTORIO_FIXTURES
+
+
+class _CPCScraperAnterior(CPCScraper):
+    """
+    Implementación anterior: cada regla vuelve a recorrer el texto (tres
+    expresiones para el número, cuatro para los días y una búsqueda por palabra).
+    """
+
+    def _parsear_articulo(self, soup, termino):
+        numero_articulo = self._extraer_numero_articulo(soup)
+        if not numero_articulo:
+            return None
+        texto_articulo = self._extraer_texto_articulo(soup)
+        tipo_info = self._determinar_tipo_documento(termino, texto_articulo)
+        return {
+            'codigo': f"ART. {numero_articulo} CPC",
+            'tipo_documento': tipo_info['tipo_documento'],
+            'tipo_procedimiento': tipo_info['tipo_procedimiento'],
+            'dias_plazo': self._extraer_dias_plazo(texto_articulo),
+            'tipo_dia': self._determinar_tipo_dia(texto_articulo),
+            'observaciones': f"Se cuenta desde {self._extraer_observaciones(texto_articulo)}",
+        }
+
+    def _extraer_numero_articulo(self, soup):
+        texto = soup.get_text()
+        for patron in [r'Artículo\s+(\d+)', r'Art\.\s*(\d+)', r'Art\s+(\d+)']:
+            match = re.search(patron, texto, re.IGNORECASE)
+            if match:
+                return match.group(1)
+        return None
+
+    def _determinar_tipo_documento(self, termino, texto):
+        termino_lower = termino.lower()
+        texto_lower = texto.lower()
+        tipos_documento = {
+            'contestacion': ['contestación', 'contestar', 'contestar'],
+            'replica': ['réplica', 'replicar', 'replica'],
+            'duplica': ['dúplica', 'duplicar', 'duplica'],
+            'recurso_apelacion': ['recurso de apelación', 'apelación', 'apelar'],
+            'recurso_casacion': ['recurso de casación', 'casación', 'casar'],
+            'recurso_revision': ['recurso de revisión', 'revisión', 'revisar'],
+            'recurso_queja': ['recurso de queja', 'queja', 'quejar'],
+            'recurso_proteccion': ['recurso de protección', 'protección', 'proteger'],
+            'recurso_amparo': ['recurso de amparo', 'amparo', 'amparar'],
+            'incidente': ['incidente', 'incidentes'],
+            'excepcion': ['excepción', 'excepciones', 'exceptuar'],
+            'medida_cautelar': ['medida cautelar', 'cautelar', 'cautelas'],
+            'embargo': ['embargo', 'embargar', 'embargos']
+        }
+        tipo_documento = 'otro'
+        for tipo, palabras in tipos_documento.items():
+            if any(palabra in termino_lower or palabra in texto_lower for palabra in palabras):
+                tipo_documento = tipo
+                break
+        tipo_procedimiento = 'ordinario'
+        if 'sumario' in texto_lower:
+            tipo_procedimiento = 'sumario'
+        elif 'ejecutivo' in texto_lower:
+            tipo_procedimiento = 'ejecutivo'
+        elif 'monitorio' in texto_lower:
+            tipo_procedimiento = 'monitorio'
+        elif 'constitucional' in texto_lower or 'protección' in texto_lower or 'amparo' in texto_lower:
+            tipo_procedimiento = 'constitucional'
+        return {'tipo_documento': tipo_documento, 'tipo_procedimiento': tipo_procedimiento}
+
+    def _extraer_dias_plazo(self, texto):
+        for patron in [r'(\d+)\s*días?\s*hábiles?', r'(\d+)\s*días?\s*corridos?',
+                       r'(\d+)\s*días?', r'plazo\s*de\s*(\d+)\s*días?']:
+            match = re.search(patron, texto, re.IGNORECASE)
+            if match:
+                return int(match.group(1))
+        if 'contestación' in texto.lower():
+            return 15
+        elif 'réplica' in texto.lower():
+            return 6
+        elif 'dúplica' in texto.lower():
+            return 3
+        elif 'recurso' in texto.lower():
+            return 5
+        return 30
+
+    def _determinar_tipo_dia(self, texto):
+        texto_lower = texto.lower()
+        if 'hábil' in texto_lower or 'hábiles' in texto_lower:
+            return 'habil'
+        elif 'corrido' in texto_lower or 'corridos' in texto_lower:
+            return 'corrido'
+        elif 'recurso de protección' in texto_lower or 'recurso de amparo' in texto_lower:
+            return 'corrido'
+        return 'habil'
+
+    def _extraer_observaciones(self, texto):
+        texto_lower = texto.lower()
+        if 'notificación' in texto_lower:
+            return 'la notificación'
+        elif 'presentación' in texto_lower:
+            return 'la presentación'
+        elif 'conocimiento' in texto_lower:
+            return 'el conocimiento del hecho'
+        return 'la fecha correspondiente'
+
+
+def _extraer_anterior(sopas):
+    """Recorrido anterior: cada par (página, término) se parsea por completo."""
+    scraper = _CPCScraperAnterior()
+    return [scraper._parsear_articulo(sopa, termino) for sopa in sopas for termino in TERMINOS_BUSQUEDA]
+
+
+def _extraer_compilado_por_par(sopas):
+    """Implementación compilada sin reutilizar el análisis: una página completa por par (página, término)."""
+    scraper = CPCScraper()
+    return [scraper._parsear_articulo(sopa, termino) for sopa in sopas for termino in TERMINOS_BUSQUEDA]
+
+
+def _extraer_compilado(sopas):
+    """Recorrido de ``CPCScraperAsincrono``: un análisis por página y solo el tipo de documento por término."""
+    scraper = CPCScraper()
+    analisis = [scraper._analizar_articulo(sopa) for sopa in sopas]
+    return [scraper._armar_articulo(datos, termino) for datos in analisis for termino in TERMINOS_BUSQUEDA]
+
+
+def _pagina_anterior(sopas):
+    """Implementación anterior, una vez por página (primer término)."""
+    scraper = _CPCScraperAnterior()
+    return [scraper._parsear_articulo(sopa, TERMINOS_BUSQUEDA[0]) for sopa in sopas]
+
+
+def _pagina_compilado(sopas):
+    """Implementación compilada, una vez por página (primer término)."""
+    scraper = CPCScraper()
+    return [scraper._parsear_articulo(sopa, TERMINOS_BUSQUEDA[0]) for sopa in sopas]
+
+
+# (implementación, recorrido, función): primero una vez por página, luego la extracción completa
+IMPLEMENTACIONES = [
+    ('anterior', 'página', _pagina_anterior),
+    ('compilado', 'página', _pagina_compilado),
+    ('anterior', 'página × término', _extraer_anterior),
+    ('compilado', 'página × término', _extraer_compilado_por_par),
+    ('compilado + análisis reutilizado', 'página × término', _extraer_compilado),
+]
+
+MEDICIONES = 3
+
+
+def _velocidad(ejecutar, vueltas, articulos_por_vuelta):
+    """Artículos/segundo de la mejor de ``MEDICIONES`` mediciones de ``vueltas`` ejecuciones."""
+    mejor = float('inf')
+    for _ in range(MEDICIONES):
+        inicio = time.perf_counter()
+        for _ in range(vueltas):
+            ejecutar()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return articulos_por_vuelta * vueltas / mejor
+
+
+CAMPOS_COMPARADOS = ['codigo', 'tipo_documento', 'tipo_procedimiento', 'dias_plazo', 'tipo_dia', 'observaciones']
+
+
+class Command(BaseCommand):
+    help = 'Mide artículos/segundo del parser de artículos del CPC sobre las páginas grabadas de LeyChile'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeticiones',
+            type=int,
+            default=200,
+            help='Veces que se recorre el corpus (por defecto 200)',
+        )
+
+    def handle(self, *args, **options):
+        repeticiones = options['repeticiones']
+        if repeticiones < 1:
+            raise CommandError('--repeticiones debe ser mayor que cero')
+
+        paginas = [ruta.read_bytes() for ruta in sorted((DIRECTORIO_FIXTURES / 'normas').glob('*.html'))]
+        if not paginas:
+            raise CommandError(f'No hay páginas en {DIRECTORIO_FIXTURES / "normas"}')
+
+        parsers = ['html.parser'] + (['lxml'] if PARSER_HTML == 'lxml' else [])
+        self.stdout.write(self.style.SUCCESS(
+            f'Benchmark del parser del CPC ({len(paginas)} páginas x {len(TERMINOS_BUSQUEDA)} términos, '
+            f'{repeticiones} repeticiones, mejor de {MEDICIONES} mediciones)'
+        ))
+        if PARSER_HTML != 'lxml':
+            self.stdout.write('  lxml no está instalado: se mide solo html.parser')
+
+        resultados = {}
+        for parser in parsers:
+            sopas = [BeautifulSoup(pagina, parser) for pagina in paginas]
+            self.stdout.write('')
+            self.stdout.write(f'  Parser HTML: {parser}')
+            self.stdout.write(
+                f"  {'Implementación':<34} {'Recorrido':<18} {'Extracción':>14} {'Con parseo HTML':>17}"
+            )
+            velocidades = {}
+            for nombre, recorrido, extraer in IMPLEMENTACIONES:
+                articulos = extraer(sopas)
+                # Solo la extracción, sobre sopas ya construidas
+                extraccion = _velocidad(lambda: extraer(sopas), repeticiones, len(articulos))
+                # Parseo HTML más extracción
+                completo = _velocidad(
+                    lambda: extraer([BeautifulSoup(pagina, parser) for pagina in paginas]),
+                    max(1, repeticiones // 10), len(articulos),
+                )
+
+                velocidades[(nombre, recorrido)] = (extraccion, completo)
+                resultados.setdefault(recorrido, {})[(nombre, parser)] = [
+                    tuple(articulo[campo] for campo in CAMPOS_COMPARADOS) for articulo in articulos
+                ]
+                self.stdout.write(
+                    f'  {nombre:<34} {recorrido:<18} {extraccion:>10,.0f} a/s {completo:>13,.0f} a/s'
+                )
+
+            # Las expresiones compiladas se comparan por página; la reutilización del
+            # análisis solo existe al cruzar cada página con varios términos
+            for titulo, base, mejora in (
+                ('Expresiones compiladas (por página)',
+                 ('anterior', 'página'), ('compilado', 'página')),
+                ('Expresiones compiladas (página × término)',
+                 ('anterior', 'página × término'), ('compilado', 'página × término')),
+                ('Reutilizar el análisis por página',
+                 ('compilado', 'página × término'), ('compilado + análisis reutilizado', 'página × término')),
+            ):
+                aceleraciones = [velocidades[mejora][i] / velocidades[base][i] for i in range(2)]
+                self.stdout.write(
+                    f'  Aceleración, {titulo}: {aceleraciones[0]:.1f}x extracción, '
+                    f'{aceleraciones[1]:.1f}x con parseo HTML'
+                )
+
+        self.stdout.write('')
+        if all(len(set(map(tuple, por_impl.values()))) == 1 for por_impl in resultados.values()):
+            self.stdout.write(self.style.SUCCESS('Todas las implementaciones extrajeron los mismos datos'))
+        else:
+            self.stdout.write(self.style.ERROR('Las implementaciones extrajeron datos distintos'))
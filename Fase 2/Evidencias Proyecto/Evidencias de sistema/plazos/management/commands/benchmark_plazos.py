@@ -0,0 +1,95 @@
+"""
+Comando de Django para medir el rendimiento del cálculo de plazos.
+"""
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from plazos.utils.plazos import (
+    calcular_fecha_vencimiento,
+    calcular_fechas_vencimiento_lote,
+    calcular_dias_habiles_entre_fechas,
+    calcular_dias_habiles_entre_fechas_lote,
+)
+
+
+class Command(BaseCommand):
+    help = 'Compara el cálculo de vencimientos fila por fila contra el cálculo por lotes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--filas',
+            type=int,
+            default=100000,
+            help='Número de plazos sintéticos a calcular (por defecto 100000)',
+        )
+        parser.add_argument(
+            '--semilla',
+            type=int,
+            default=42,
+            help='Semilla para generar los datos de prueba',
+        )
+
+    def handle(self, *args, **options):
+        filas = options['filas']
+        if filas <= 0:
+            raise CommandError('--filas debe ser mayor que cero')
+
+        fechas_inicio, dias_plazo, tipos_dia = self._generar_datos(filas, options['semilla'])
+        fechas_fin = [f + timedelta(days=d) for f, d in zip(fechas_inicio, dias_plazo)]
+
+        self.stdout.write(self.style.SUCCESS(f'Benchmark de vencimientos con {filas} plazos'))
+
+        # Calentar el índice de días hábiles para no medir su construcción
+        calcular_fechas_vencimiento_lote(fechas_inicio[:1], dias_plazo[:1], tipos_dia[:1])
+
+        inicio = time.perf_counter()
+        escalar = [
+            calcular_fecha_vencimiento(f, d, t)
+            for f, d, t in zip(fechas_inicio, dias_plazo, tipos_dia)
+        ]
+        tiempo_escalar = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        lote = calcular_fechas_vencimiento_lote(fechas_inicio, dias_plazo, tipos_dia)
+        tiempo_lote = time.perf_counter() - inicio
+
+        if escalar != lote:
+            raise CommandError('El cálculo por lotes no coincide con el cálculo fila por fila')
+
+        self._mostrar_resultado('calcular_fecha_vencimiento', tiempo_escalar, tiempo_lote, filas)
+
+        inicio = time.perf_counter()
+        escalar = [
+            calcular_dias_habiles_entre_fechas(f, h)
+            for f, h in zip(fechas_inicio, fechas_fin)
+        ]
+        tiempo_escalar = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        lote = calcular_dias_habiles_entre_fechas_lote(fechas_inicio, fechas_fin)
+        tiempo_lote = time.perf_counter() - inicio
+
+        if escalar != lote:
+            raise CommandError('El conteo por lotes no coincide con el conteo fila por fila')
+
+        self._mostrar_resultado('calcular_dias_habiles_entre_fechas', tiempo_escalar, tiempo_lote, filas)
+
+    def _generar_datos(self, filas, semilla):
+        """Genera plazos sintéticos reproducibles."""
+        aleatorio = random.Random(semilla)
+        base = date.today() - timedelta(days=365)
+        fechas_inicio = [base + timedelta(days=aleatorio.randint(0, 730)) for _ in range(filas)]
+        dias_plazo = [aleatorio.randint(1, 60) for _ in range(filas)]
+        tipos_dia = [aleatorio.choice(['habil', 'habil', 'corrido']) for _ in range(filas)]
+        return fechas_inicio, dias_plazo, tipos_dia
+
+    def _mostrar_resultado(self, nombre, tiempo_escalar, tiempo_lote, filas):
+        """Muestra la comparación de tiempos."""
+        self.stdout.write(f'\n{nombre}:')
+        self.stdout.write(f'  Fila por fila: {tiempo_escalar:.3f} s ({filas / tiempo_escalar:,.0f} filas/s)')
+        self.stdout.write(f'  Por lotes:     {tiempo_lote:.3f} s ({filas / tiempo_lote:,.0f} filas/s)')
+        if tiempo_lote > 0:
+            self.stdout.write(f'  Aceleración:   {tiempo_escalar / tiempo_lote:.1f}x')
@@ -0,0 +1,94 @@
+"""
+Comando de Django para comparar el scraper del CPC secuencial con el asíncrono
+contra un servidor local con páginas grabadas de LeyChile.
+"""
+import contextlib
+import io
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from plazos.scrapers.cpc_scraper import CPCScraper, CPCScraperAsincrono, TERMINOS_BUSQUEDA
+from plazos.scrapers.servidor_leychile import ServidorLeyChile
+
+
+class Command(BaseCommand):
+    help = 'Mide el scraper del CPC secuencial y el asíncrono (en frío y con caché) contra un LeyChile local'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--latencia',
+            type=float,
+            default=0.2,
+            help='Latencia simulada de cada respuesta en segundos (por defecto 0.2)',
+        )
+        parser.add_argument(
+            '--concurrencia',
+            type=int,
+            default=8,
+            help='Peticiones simultáneas del scraper asíncrono (por defecto 8)',
+        )
+        parser.add_argument(
+            '--tasa',
+            type=float,
+            default=10.0,
+            help='Peticiones por segundo al host del scraper asíncrono (por defecto 10)',
+        )
+        parser.add_argument(
+            '--error-cada',
+            type=int,
+            default=0,
+            help='El servidor responde 503 a una de cada N peticiones (por defecto nunca)',
+        )
+
+    def handle(self, *args, **options):
+        if options['concurrencia'] < 1 or options['tasa'] <= 0:
+            raise CommandError('--concurrencia y --tasa deben ser mayores que cero')
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Benchmark del scraper del CPC ({len(TERMINOS_BUSQUEDA)} términos, "
+            f"latencia {options['latencia']}s)"
+        ))
+        self.stdout.write('')
+        self.stdout.write(
+            f"  {'Modo':<22} {'Tiempo':>9} {'Peticiones':>11} {'304':>5} {'Reintentos':>11} {'Artículos':>10}"
+        )
+
+        # Un solo servidor para todos los modos: el caché en disco se indexa por URL
+        with tempfile.TemporaryDirectory() as directorio_cache, \
+                ServidorLeyChile(latencia=options['latencia'], error_cada=options['error_cada']) as servidor:
+            def asincrono():
+                return CPCScraperAsincrono(
+                    base_url=servidor.url,
+                    concurrencia=options['concurrencia'],
+                    peticiones_por_segundo=options['tasa'],
+                    directorio_cache=directorio_cache,
+                )
+
+            modos = [
+                ('secuencial', lambda: CPCScraper(base_url=servidor.url)),
+                ('asíncrono (frío)', asincrono),
+                ('asíncrono (con caché)', asincrono),
+            ]
+            resultados = {}
+            for nombre, crear in modos:
+                servidor.reiniciar_contadores()
+                scraper = crear()
+                inicio = time.perf_counter()
+                # Los scrapers informan su avance con print: se omite en la tabla
+                with contextlib.redirect_stdout(io.StringIO()):
+                    articulos = scraper.buscar_articulos_cpc(TERMINOS_BUSQUEDA)
+                tiempo = time.perf_counter() - inicio
+                resultados[nombre] = [articulo['codigo'] for articulo in articulos]
+                reintentos = getattr(scraper, 'estadisticas', {}).get('reintentos', '-')
+                self.stdout.write(
+                    f'  {nombre:<22} {tiempo:>8.2f}s {servidor.peticiones:>11} '
+                    f'{servidor.no_modificadas:>5} {reintentos:>11} {len(articulos):>10}'
+                )
+
+        self.stdout.write('')
+        if len({tuple(codigos) for codigos in resultados.values()}) == 1:
+            self.stdout.write(self.style.SUCCESS('Todos los modos obtuvieron los mismos artículos'))
+        else:
+            self.stdout.write(self.style.ERROR('Los modos obtuvieron artículos distintos'))
@@ -2,9 +2,9 @@
 Comando de Django para cargar automáticamente códigos del CPC.
 """
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
 from plazos.models import CodigoProcedimiento
-from plazos.scrapers.cpc_database import obtener_articulos_cpc_desde_bd
+from plazos.scrapers.cpc_database import CPCDatabase
+from plazos.utils.sincronizacion_cpc import sincronizar_codigos
 
 
 class Command(BaseCommand):
@@ -38,16 +38,13 @@ class Command(BaseCommand):
         )
 
         try:
-            # Obtener artículos desde la base de datos local
-            articulos = obtener_articulos_cpc_desde_bd()
-            
-            # Filtrar si se especificó tipo
+            # Obtener artículos desde la base de datos local, filtrados si se especificó tipo
+            articulos = CPCDatabase.instancia().obtener_articulos_por_tipo(
+                options['tipo_documento'], options['tipo_procedimiento'],
+            )
             if options['tipo_documento']:
-                articulos = [a for a in articulos if a['tipo_documento'] == options['tipo_documento']]
                 self.stdout.write(f"Filtrando por tipo de documento: {options['tipo_documento']}")
-            
             if options['tipo_procedimiento']:
-                articulos = [a for a in articulos if a['tipo_procedimiento'] == options['tipo_procedimiento']]
                 self.stdout.write(f"Filtrando por tipo de procedimiento: {options['tipo_procedimiento']}")
 
             if options['dry_run']:
@@ -61,47 +58,14 @@ class Command(BaseCommand):
                 CodigoProcedimiento.objects.all().delete()
                 self.stdout.write(self.style.SUCCESS('Códigos existentes eliminados'))
 
-            # Cargar códigos en una transacción
-            with transaction.atomic():
-                codigos_creados = 0
-                codigos_actualizados = 0
-
-                for articulo in articulos:
-                    codigo, created = CodigoProcedimiento.objects.get_or_create(
-                        codigo=articulo['codigo'],
-                        defaults={
-                            'nombre': articulo['nombre'],
-                            'tipo_documento': articulo['tipo_documento'],
-                            'tipo_procedimiento': articulo['tipo_procedimiento'],
-                            'dias_plazo': articulo['dias_plazo'],
-                            'tipo_dia': articulo['tipo_dia'],
-                            'articulo_cpc': articulo['articulo_cpc'],
-                            'descripcion': articulo['descripcion'],
-                            'observaciones': articulo['observaciones'],
-                            'activo': articulo['activo']
-                        }
-                    )
-                    
-                    if created:
-                        codigos_creados += 1
-                        self.stdout.write(f"  + Creado: {codigo.codigo} - {codigo.nombre}")
-                    else:
-                        # Actualizar campos si el código ya existe
-                        codigo.nombre = articulo['nombre']
-                        codigo.tipo_documento = articulo['tipo_documento']
-                        codigo.tipo_procedimiento = articulo['tipo_procedimiento']
-                        codigo.dias_plazo = articulo['dias_plazo']
-                        codigo.tipo_dia = articulo['tipo_dia']
-                        codigo.articulo_cpc = articulo['articulo_cpc']
-                        codigo.descripcion = articulo['descripcion']
-                        codigo.observaciones = articulo['observaciones']
-                        codigo.activo = articulo['activo']
-                        codigo.save()
-                        codigos_actualizados += 1
-                        self.stdout.write(f"  ~ Actualizado: {codigo.codigo} - {codigo.nombre}")
+            resumen = sincronizar_codigos(articulos)
+            for codigo in resumen['codigos_creados']:
+                self.stdout.write(f"  + Creado: {codigo}")
+            for codigo in resumen['codigos_actualizados']:
+                self.stdout.write(f"  ~ Actualizado: {codigo}")
 
             # Mostrar resumen
-            self._mostrar_resumen(codigos_creados, codigos_actualizados, articulos)
+            self._mostrar_resumen(resumen, articulos)
 
         except Exception as e:
             raise CommandError(f'Error al cargar códigos: {e}')
@@ -112,13 +76,14 @@ class Command(BaseCommand):
         for articulo in articulos:
             self.stdout.write(f"  - {articulo['codigo']}: {articulo['nombre']}")
 
-    def _mostrar_resumen(self, creados, actualizados, articulos):
+    def _mostrar_resumen(self, resumen, articulos):
         """Muestra el resumen de la operación."""
         self.stdout.write('\n' + '='*60)
         self.stdout.write(self.style.SUCCESS('CARGA COMPLETADA EXITOSAMENTE'))
         self.stdout.write('='*60)
-        self.stdout.write(f'Códigos creados: {creados}')
-        self.stdout.write(f'Códigos actualizados: {actualizados}')
+        self.stdout.write(f"Códigos creados: {resumen['creados']}")
+        self.stdout.write(f"Códigos actualizados: {resumen['actualizados']}")
+        self.stdout.write(f"Códigos sin cambios: {resumen['sin_cambios']}")
         self.stdout.write(f'Total procesados: {len(articulos)}')
         
         # Mostrar estadísticas por tipo
@@ -0,0 +1,63 @@
+"""
+Comando de Django que calcula el índice ciego de la clave del cliente de todos los plazos.
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from plazos.models import PlazoJudicial
+from plazos.utils.indice_ciego import clave_en_claro, indice_exacto, sincronizar_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        'Calcula (o recalcula) en lotes el índice ciego y los tokens de prefijo de '
+        'la clave del cliente. Ejecutar tras la migración o al cambiar BLIND_INDEX_KEY.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tamano-lote',
+            type=int,
+            default=2000,
+            help='Plazos procesados por lote (por defecto 2000)',
+        )
+
+    def handle(self, *args, **options):
+        tamano_lote = options['tamano_lote']
+        if tamano_lote <= 0:
+            raise CommandError('--tamano-lote debe ser mayor que cero')
+
+        plazos = PlazoJudicial.objects.order_by('id').only('id', 'clave_cliente', 'clave_cliente_hash')
+        inicio = time.perf_counter()
+        procesados = 0
+        no_descifrables = 0
+        ultimo_id = 0
+
+        while True:
+            lote = list(plazos.filter(id__gt=ultimo_id)[:tamano_lote])
+            if not lote:
+                break
+            ultimo_id = lote[-1].id
+
+            claves = {}
+            for plazo in lote:
+                claves[plazo.id] = clave_en_claro(plazo.clave_cliente)
+                plazo.clave_cliente_hash = indice_exacto(claves[plazo.id])
+                if plazo.clave_cliente and not claves[plazo.id]:
+                    no_descifrables += 1
+
+            with transaction.atomic():
+                PlazoJudicial.objects.bulk_update(lote, ['clave_cliente_hash'], batch_size=tamano_lote)
+                sincronizar_tokens(claves)
+
+            procesados += len(lote)
+            self.stdout.write(f'  {procesados} plazos indexados')
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Índice ciego actualizado: {procesados} plazos en {time.perf_counter() - inicio:.1f}s '
+                f'({no_descifrables} con una clave que no se pudo descifrar, sin indexar)'
+            )
+        )
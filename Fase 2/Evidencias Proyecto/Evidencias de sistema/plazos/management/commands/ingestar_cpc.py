@@ -0,0 +1,66 @@
+"""
+Comando de Django para ingerir el texto completo del CPC desde una exportación
+descargada de LeyChile (XML o HTML), sin conexión.
+"""
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from plazos.scrapers.ingesta_cpc import guardar_articulos, iterar_articulos
+
+
+class Command(BaseCommand):
+    help = 'Divide una exportación del CPC en artículos, extrae sus plazos y los guarda en ArticuloCPC'
+
+    def add_arguments(self, parser):
+        parser.add_argument('ruta', help='Archivo XML o HTML con el texto completo del CPC')
+        parser.add_argument(
+            '--formato',
+            choices=['xml', 'html'],
+            help='Formato del archivo (por defecto según la extensión)',
+        )
+        parser.add_argument(
+            '--codificacion',
+            default='utf-8',
+            help='Codificación del HTML (por defecto utf-8)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Solo divide y extrae, sin guardar en la base de datos',
+        )
+
+    def handle(self, *args, **options):
+        ruta = Path(options['ruta'])
+        if not ruta.is_file():
+            raise CommandError(f'No existe el archivo {ruta}')
+
+        articulos = iterar_articulos(ruta, options['formato'], options['codificacion'])
+        inicio = time.perf_counter()
+        try:
+            if options['dry_run']:
+                resumen = {'articulos': 0, 'clausulas': 0}
+                for articulo in articulos:
+                    resumen['articulos'] += 1
+                    resumen['clausulas'] += len(articulo['clausulas_plazo'])
+            else:
+                resumen = guardar_articulos(articulos)
+                resumen['articulos'] = resumen['creados'] + resumen['actualizados'] + resumen['sin_cambios']
+        except (SyntaxError, UnicodeDecodeError) as e:
+            # ET.ParseError es subclase de SyntaxError
+            raise CommandError(f'No se pudo leer {ruta}: {e}')
+        tiempo = time.perf_counter() - inicio
+
+        if not resumen['articulos']:
+            raise CommandError(f'No se encontraron artículos en {ruta}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{resumen['articulos']} artículos y {resumen['clausulas']} cláusulas de plazo en {tiempo:.2f}s "
+            f"({resumen['articulos'] / tiempo:,.0f} artículos/s)"
+        ))
+        if not options['dry_run']:
+            self.stdout.write(
+                f"  Creados: {resumen['creados']}, actualizados: {resumen['actualizados']}, "
+                f"sin cambios: {resumen['sin_cambios']}, códigos vinculados: {resumen['codigos_vinculados']}"
+            )
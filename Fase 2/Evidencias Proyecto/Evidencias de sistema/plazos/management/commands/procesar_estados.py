@@ -0,0 +1,91 @@
+"""
+Comando de Django que aplica en segundo plano las transiciones de estado de los plazos.
+"""
+import logging
+import sched
+import time
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from plazos.utils.estados import procesar_transiciones_pendientes, ZONA_HORARIA_TRIBUNALES
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        'Proceso de larga duración que actualiza los estados de los plazos a medianoche '
+        '(America/Santiago) y de forma incremental durante el día.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--intervalo',
+            type=int,
+            default=15,
+            help='Minutos entre ejecuciones incrementales (por defecto 15)',
+        )
+        parser.add_argument(
+            '--una-vez',
+            action='store_true',
+            help='Ejecutar una sola vez y terminar (para cron o pruebas)',
+        )
+
+    def handle(self, *args, **options):
+        if options['intervalo'] <= 0:
+            raise CommandError('--intervalo debe ser mayor que cero')
+
+        if options['una_vez']:
+            self._ejecutar()
+            return
+
+        self.intervalo = timedelta(minutes=options['intervalo'])
+        self.planificador = sched.scheduler(time.time, time.sleep)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Procesador de estados iniciado (cada {options['intervalo']} min y a medianoche)"
+            )
+        )
+
+        self.planificador.enter(0, 1, self._ciclo)
+        try:
+            self.planificador.run()
+        except KeyboardInterrupt:
+            self.stdout.write('\nProcesador de estados detenido')
+
+    def _ciclo(self):
+        """Ejecuta una pasada y planifica la siguiente."""
+        try:
+            self._ejecutar()
+        except Exception:
+            logger.exception('Error al procesar transiciones de estado')
+
+        siguiente = self._proxima_ejecucion(datetime.now(ZONA_HORARIA_TRIBUNALES))
+        self.planificador.enterabs(siguiente.timestamp(), 1, self._ciclo)
+
+    def _proxima_ejecucion(self, ahora):
+        """
+        Calcula el próximo instante de ejecución: el siguiente intervalo o
+        la medianoche de Santiago, lo que ocurra primero.
+        """
+        medianoche = datetime.combine(
+            ahora.date() + timedelta(days=1),
+            datetime.min.time(),
+            tzinfo=ZONA_HORARIA_TRIBUNALES,
+        )
+        return min(ahora + self.intervalo, medianoche)
+
+    def _ejecutar(self):
+        """Aplica las transiciones pendientes y registra el resultado."""
+        close_old_connections()
+        resultado = procesar_transiciones_pendientes()
+        close_old_connections()
+
+        self.stdout.write(
+            f"[{datetime.now(ZONA_HORARIA_TRIBUNALES):%Y-%m-%d %H:%M:%S}] "
+            f"Vencidos: {resultado['vencido']}, "
+            f"Corriendo: {resultado['corriendo']}"
+        )
@@ -0,0 +1,111 @@
+"""
+Comando de Django que procesa la cola de exportaciones (PDF, iCalendar y Excel)
+y las sincronizaciones de códigos del CPC encoladas desde la web.
+"""
+import logging
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from plazos.utils.cola_exportacion import (
+    eliminar_expirados,
+    liberar_trabajos_atascados,
+    procesar_trabajo,
+    reclamar_siguiente,
+)
+from plazos.utils.sincronizacion_cpc import (
+    liberar_sincronizaciones_atascadas,
+    procesar_sincronizacion,
+    reclamar_sincronizacion,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        'Proceso de larga duración que genera los archivos de las exportaciones '
+        'encoladas, sincroniza los códigos del CPC solicitados y elimina los expirados. '
+        'Se pueden ejecutar varios en paralelo.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--intervalo',
+            type=float,
+            default=2,
+            help='Segundos de espera cuando la cola está vacía (por defecto 2)',
+        )
+        parser.add_argument(
+            '--una-vez',
+            action='store_true',
+            help='Procesar los trabajos pendientes y terminar (para cron o pruebas)',
+        )
+
+    def handle(self, *args, **options):
+        if options['intervalo'] <= 0:
+            raise CommandError('--intervalo debe ser mayor que cero')
+
+        if options['una_vez']:
+            self._mantenimiento()
+            self._vaciar_cola()
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Procesador de exportaciones iniciado (espera {options['intervalo']}s)")
+        )
+        try:
+            while True:
+                try:
+                    self._mantenimiento()
+                    self._vaciar_cola()
+                except Exception:
+                    logger.exception('Error en el procesador de exportaciones')
+                close_old_connections()
+                time.sleep(options['intervalo'])
+        except KeyboardInterrupt:
+            self.stdout.write('\nProcesador de exportaciones detenido')
+
+    def _mantenimiento(self):
+        """Libera trabajos y sincronizaciones abandonados y elimina los archivos expirados."""
+        close_old_connections()
+        liberados = liberar_trabajos_atascados() + liberar_sincronizaciones_atascadas()
+        eliminados = eliminar_expirados()
+        if liberados or eliminados:
+            self.stdout.write(f"{self._ahora()} Liberados: {liberados}, expirados eliminados: {eliminados}")
+
+    def _vaciar_cola(self):
+        """Procesa trabajos hasta que no quede ninguno pendiente."""
+        self._sincronizar_cpc()
+        while True:
+            trabajo = reclamar_siguiente()
+            if trabajo is None:
+                return
+            inicio = time.perf_counter()
+            correcto = procesar_trabajo(trabajo)
+            self.stdout.write(
+                f"{self._ahora()} Exportación #{trabajo.pk} ({trabajo.formato}): "
+                f"{'completada' if correcto else 'fallida'}, {trabajo.total_filas} plazos "
+                f"en {time.perf_counter() - inicio:.1f}s"
+            )
+
+    def _sincronizar_cpc(self):
+        """Ejecuta la sincronización de códigos del CPC pendiente, si la hay."""
+        sincronizacion = reclamar_sincronizacion()
+        if sincronizacion is None:
+            return
+        inicio = time.perf_counter()
+        if procesar_sincronizacion(sincronizacion):
+            self.stdout.write(
+                f"{self._ahora()} Sincronización CPC #{sincronizacion.pk}: creados {sincronizacion.creados}, "
+                f"actualizados {sincronizacion.actualizados}, sin cambios {sincronizacion.sin_cambios} "
+                f"en {time.perf_counter() - inicio:.2f}s"
+            )
+        else:
+            self.stdout.write(f"{self._ahora()} Sincronización CPC #{sincronizacion.pk}: fallida")
+
+    @staticmethod
+    def _ahora():
+        return f"[{datetime.now():%Y-%m-%d %H:%M:%S}]"
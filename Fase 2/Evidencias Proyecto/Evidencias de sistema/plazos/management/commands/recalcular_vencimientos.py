@@ -0,0 +1,92 @@
+"""
+Comando de Django para recalcular vencimientos tras un cambio de feriados.
+"""
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from plazos.utils.recalculo import recalcular_vencimientos, TAMANO_LOTE_DEFECTO
+
+
+class Command(BaseCommand):
+    help = (
+        'Recalcula la fecha de vencimiento de los plazos en días hábiles cuya ventana '
+        'cruza un feriado nuevo o eliminado. Registre primero el feriado en FeriadoJudicial.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'desde',
+            type=str,
+            help='Fecha del feriado (o primer día del cierre) en formato AAAA-MM-DD',
+        )
+        parser.add_argument(
+            '--hasta',
+            type=str,
+            help='Último día del cierre en formato AAAA-MM-DD (por defecto igual a la fecha inicial)',
+        )
+        parser.add_argument(
+            '--incluir-vencidos',
+            action='store_true',
+            help='Revisar también los plazos en estado vencido',
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=TAMANO_LOTE_DEFECTO,
+            help=f'Filas procesadas por lote (por defecto {TAMANO_LOTE_DEFECTO})',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Mostrar qué cambiaría sin guardar',
+        )
+
+    def handle(self, *args, **options):
+        desde = self._parsear_fecha(options['desde'])
+        hasta = self._parsear_fecha(options['hasta']) if options['hasta'] else desde
+
+        if hasta < desde:
+            raise CommandError('--hasta no puede ser anterior a la fecha inicial')
+        if options['lote'] <= 0:
+            raise CommandError('--lote debe ser mayor que cero')
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('MODO DRY-RUN: No se realizarán cambios'))
+
+        self.stdout.write(f'Recalculando plazos afectados entre {desde} y {hasta}...')
+
+        inicio = time.perf_counter()
+        reporte = recalcular_vencimientos(
+            desde,
+            hasta,
+            incluir_vencidos=options['incluir_vencidos'],
+            tamano_lote=options['lote'],
+            dry_run=options['dry_run'],
+        )
+        duracion = time.perf_counter() - inicio
+
+        self._mostrar_resumen(reporte, duracion)
+
+    def _parsear_fecha(self, valor):
+        """Convierte un texto AAAA-MM-DD en fecha."""
+        try:
+            return date.fromisoformat(valor)
+        except ValueError:
+            raise CommandError(f'Fecha inválida: {valor} (use AAAA-MM-DD)')
+
+    def _mostrar_resumen(self, reporte, duracion):
+        """Muestra el resumen de la operación."""
+        self.stdout.write('\n' + '='*60)
+        self.stdout.write(self.style.SUCCESS('RECÁLCULO COMPLETADO'))
+        self.stdout.write('='*60)
+        self.stdout.write(f"Plazos revisados: {reporte['revisados']}")
+        self.stdout.write(f"Plazos actualizados: {reporte['actualizados']}")
+        self.stdout.write(f"Plazos sin cambios: {reporte['sin_cambios']}")
+        self.stdout.write(f'Duración: {duracion:.2f} s')
+
+        if reporte['cambios']:
+            self.stdout.write('\nEjemplos de cambios:')
+            for plazo_id, anterior, nueva in reporte['cambios']:
+                self.stdout.write(f'  Plazo {plazo_id}: {anterior} -> {nueva}')
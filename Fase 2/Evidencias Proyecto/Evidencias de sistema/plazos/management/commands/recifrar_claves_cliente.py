@@ -0,0 +1,95 @@
+"""
+Comando de Django que vuelve a cifrar las claves de cliente con la clave principal.
+"""
+import time
+
+from cryptography.fernet import InvalidToken
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from plazos.models import PlazoJudicial
+from plazos.utils.cifrado import es_token_fernet, obtener_cifrador, invalidar_cifrador
+
+
+class Command(BaseCommand):
+    help = (
+        'Rota las claves de cliente cifradas a la primera clave de ENCRYPTION_KEYS, '
+        'recorriendo los plazos en lotes y guardando con bulk_update.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tamano-lote',
+            type=int,
+            default=2000,
+            help='Plazos procesados por lote (por defecto 2000)',
+        )
+        parser.add_argument(
+            '--cifrar-texto-plano',
+            action='store_true',
+            help='Cifrar también las claves antiguas guardadas sin cifrar',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Contar los cambios sin guardarlos',
+        )
+
+    def handle(self, *args, **options):
+        tamano_lote = options['tamano_lote']
+        if tamano_lote <= 0:
+            raise CommandError('--tamano-lote debe ser mayor que cero')
+
+        invalidar_cifrador()
+        cifrador = obtener_cifrador()
+
+        plazos = (
+            PlazoJudicial.objects
+            .exclude(clave_cliente='')
+            .order_by('id')
+            .only('id', 'clave_cliente')
+        )
+        inicio = time.perf_counter()
+        contadores = {'recifrados': 0, 'texto_plano': 0, 'no_descifrables': 0, 'revisados': 0}
+        ultimo_id = 0
+
+        while True:
+            lote = list(plazos.filter(id__gt=ultimo_id)[:tamano_lote])
+            if not lote:
+                break
+            ultimo_id = lote[-1].id
+            contadores['revisados'] += len(lote)
+
+            modificados = []
+            for plazo in lote:
+                try:
+                    plazo.clave_cliente = cifrador.rotate(plazo.clave_cliente.encode()).decode()
+                    contadores['recifrados'] += 1
+                except InvalidToken:
+                    if es_token_fernet(plazo.clave_cliente):
+                        # Cifrado con una clave retirada: no es texto plano, no se envuelve otra vez
+                        contadores['no_descifrables'] += 1
+                        continue
+                    contadores['texto_plano'] += 1
+                    if not options['cifrar_texto_plano']:
+                        continue
+                    plazo.clave_cliente = cifrador.encrypt(plazo.clave_cliente.encode()).decode()
+                modificados.append(plazo)
+
+            if modificados and not options['dry_run']:
+                # El texto plano no cambia: el índice ciego sigue siendo válido
+                with transaction.atomic():
+                    PlazoJudicial.objects.bulk_update(modificados, ['clave_cliente'], batch_size=tamano_lote)
+
+            self.stdout.write(f"  {contadores['revisados']} plazos revisados")
+
+        prefijo = '[DRY RUN] ' if options['dry_run'] else ''
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefijo}Recifrados: {contadores['recifrados']}, "
+                f"sin cifrar: {contadores['texto_plano']}"
+                f"{' (cifrados)' if options['cifrar_texto_plano'] else ''}, "
+                f"no descifrables (omitidos): {contadores['no_descifrables']}, "
+                f"en {time.perf_counter() - inicio:.1f}s"
+            )
+        )
@@ -0,0 +1,184 @@
+"""
+Comando de Django que verifica con EXPLAIN que las consultas principales usan índices.
+"""
+import random
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from plazos.models import PlazoJudicial
+from plazos.utils.cache_resultados import consulta_ids, plazos_filtrados
+from plazos.utils.estadisticas import agregados_estadisticas
+from plazos.utils.filtros import compilar_filtros
+from plazos.utils.paginacion import POR_PAGINA_DEFECTO, consulta_cursor, paginar_por_cursor
+from plazos.utils.plazos import calcular_fechas_vencimiento_lote
+
+TABLA = PlazoJudicial._meta.db_table
+
+PREFIJO_USUARIOS = 'explain_indices_'
+
+
+class Command(BaseCommand):
+    help = (
+        'Ejecuta EXPLAIN sobre las consultas de calendario, dashboard y exportaciones '
+        'y falla si alguna recorre la tabla de plazos completa.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sembrar',
+            type=int,
+            default=0,
+            help='Crear N plazos sintéticos antes de verificar (ej: 1000000)',
+        )
+        parser.add_argument(
+            '--usuarios',
+            type=int,
+            default=1000,
+            help='Número de usuarios sintéticos entre los que se reparten los plazos',
+        )
+        parser.add_argument(
+            '--limpiar',
+            action='store_true',
+            help='Eliminar los usuarios y plazos sintéticos al terminar',
+        )
+
+    def handle(self, *args, **options):
+        if options['sembrar']:
+            self._sembrar(options['sembrar'], options['usuarios'])
+
+        usuario = self._usuario_de_prueba()
+        if usuario is None:
+            raise CommandError('No hay plazos para verificar; use --sembrar')
+
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE {TABLA}')
+
+        fallidas = []
+        for nombre, queryset in self._consultas(usuario):
+            plan = queryset.explain()
+            usa_indice = self._usa_indice(plan)
+            estado = self.style.SUCCESS('OK') if usa_indice else self.style.ERROR('SCAN')
+            self.stdout.write(f'[{estado}] {nombre}')
+            if options['verbosity'] > 1 or not usa_indice:
+                self.stdout.write('    ' + plan.replace('\n', '\n    '))
+            if not usa_indice:
+                fallidas.append(nombre)
+
+        if options['limpiar']:
+            get_user_model().objects.filter(username__startswith=PREFIJO_USUARIOS).delete()
+
+        if fallidas:
+            raise CommandError(f'Consultas sin índice: {", ".join(fallidas)}')
+
+        self.stdout.write(self.style.SUCCESS('Todas las consultas usan índices'))
+
+    def _consultas(self, usuario):
+        """
+        Consultas de las vistas para el usuario dado, construidas con los mismos
+        helpers (filtro compilado, cursor, lista de ids, estadísticas y exportación).
+        """
+        hoy = date.today()
+        plazos = PlazoJudicial.objects.filter(usuario=usuario)
+
+        sin_filtros = compilar_filtros()
+        por_estado = compilar_filtros({'estado': 'corriendo'})
+        por_fechas = compilar_filtros({'fecha_desde': hoy, 'fecha_hasta': hoy + timedelta(days=30)})
+
+        # Cursor real de la segunda página, para la condición de keyset
+        listado = sin_filtros.queryset(usuario.pk, consumidor='calendario')
+        primera = paginar_por_cursor(listado, sin_filtros.ordenar_por, sin_filtros.direccion)
+
+        return [
+            ('calendario (página 1)', consulta_cursor(
+                listado, sin_filtros.ordenar_por, sin_filtros.direccion,
+            )[:POR_PAGINA_DEFECTO + 1]),
+            ('calendario (página siguiente por cursor)', consulta_cursor(
+                listado, sin_filtros.ordenar_por, sin_filtros.direccion, primera.cursor_siguiente,
+            )[:POR_PAGINA_DEFECTO + 1]),
+            ('calendario: ids del filtro', consulta_ids(usuario.pk, sin_filtros)),
+            ('calendario filtrado por estado', consulta_ids(usuario.pk, por_estado)),
+            ('calendario por rango de fechas', consulta_ids(usuario.pk, por_fechas)),
+            ('index: estadísticas', plazos.order_by().values('usuario').annotate(
+                **agregados_estadisticas(hoy)
+            )),
+            ('index: plazos recientes', plazos.order_by('-created_at')[:10]),
+            ('index: plazos próximos', plazos.filter(
+                fecha_vencimiento__lte=hoy + timedelta(days=7),
+                fecha_vencimiento__gte=hoy,
+                estado__in=['corriendo', 'pendiente'],
+            ).order_by('fecha_vencimiento')[:5]),
+            ('exportación PDF/ICS', plazos_filtrados(usuario.pk, sin_filtros)),
+        ]
+
+    def _usa_indice(self, plan):
+        """Determina si el plan evita recorrer la tabla de plazos completa."""
+        if connection.vendor == 'postgresql':
+            return f'Seq Scan on {TABLA}' not in plan
+        if connection.vendor == 'sqlite':
+            return not any(
+                linea.strip().startswith(f'SCAN {TABLA}') and 'INDEX' not in linea
+                for linea in plan.splitlines()
+            )
+        return 'ALL' not in plan
+
+    def _usuario_de_prueba(self):
+        """Primer usuario sintético con plazos o, si no hay, el dueño de algún plazo."""
+        sintetico = (
+            get_user_model().objects
+            .filter(username__startswith=PREFIJO_USUARIOS, plazos__isnull=False)
+            .first()
+        )
+        if sintetico:
+            return sintetico
+        plazo = PlazoJudicial.objects.only('usuario').first()
+        return plazo.usuario if plazo else None
+
+    def _sembrar(self, total, num_usuarios):
+        """Crea usuarios y plazos sintéticos repartidos uniformemente."""
+        Usuario = get_user_model()
+        num_usuarios = max(1, min(num_usuarios, total))
+        self.stdout.write(f'Sembrando {total} plazos para {num_usuarios} usuarios...')
+
+        # Los usuarios de una siembra anterior se reutilizan
+        Usuario.objects.bulk_create([
+            Usuario(
+                username=f'{PREFIJO_USUARIOS}{i}',
+                email=f'{PREFIJO_USUARIOS}{i}@example.com',
+                rut=f'X{i}',
+            )
+            for i in range(num_usuarios)
+        ], ignore_conflicts=True)
+        usuarios = list(
+            Usuario.objects
+            .filter(username__in=[f'{PREFIJO_USUARIOS}{i}' for i in range(num_usuarios)])
+            .order_by('id')
+        )
+
+        aleatorio = random.Random(0)
+        base = date.today() - timedelta(days=365)
+        estados = ['pendiente', 'corriendo', 'corriendo', 'vencido', 'suspendido']
+        lote = 10000
+
+        for inicio in range(0, total, lote):
+            filas = min(lote, total - inicio)
+            fechas = [base + timedelta(days=aleatorio.randint(0, 730)) for _ in range(filas)]
+            dias = [aleatorio.randint(1, 60) for _ in range(filas)]
+            vencimientos = calcular_fechas_vencimiento_lote(fechas, dias, 'habil')
+            PlazoJudicial.objects.bulk_create([
+                PlazoJudicial(
+                    usuario=usuarios[(inicio + i) % len(usuarios)],
+                    tipo_documento='contestacion',
+                    procedimiento='ordinario',
+                    dias_plazo=dias[i],
+                    tipo_dia='habil',
+                    fecha_inicio=fechas[i],
+                    fecha_vencimiento=vencimientos[i],
+                    estado=aleatorio.choice(estados),
+                )
+                for i in range(filas)
+            ])
+            self.stdout.write(f'  {inicio + filas}/{total}')
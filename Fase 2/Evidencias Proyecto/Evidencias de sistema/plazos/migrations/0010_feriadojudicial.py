@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plazos', '0009_change_rut_causa_to_rol'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeriadoJudicial',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nombre', models.CharField(help_text='Descripción del cierre (ej: Feriado judicial 2026)', max_length=200)),
+                ('tipo', models.CharField(choices=[('feriado_judicial', 'Feriado Judicial (receso de febrero)'), ('cierre_tribunal', 'Cierre de Tribunal'), ('feriado_regional', 'Feriado Regional'), ('otro', 'Otro')], default='cierre_tribunal', max_length=30)),
+                ('fecha_inicio', models.DateField(help_text='Primer día sin funcionamiento')),
+                ('fecha_fin', models.DateField(help_text='Último día sin funcionamiento (inclusive)')),
+                ('activo', models.BooleanField(default=True)),
+                ('observaciones', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Feriado Judicial',
+                'verbose_name_plural': 'Feriados Judiciales',
+                'ordering': ['-fecha_inicio'],
+            },
+        ),
+    ]
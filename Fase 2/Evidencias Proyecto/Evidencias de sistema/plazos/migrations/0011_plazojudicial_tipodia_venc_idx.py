@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plazos', '0010_feriadojudicial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='plazojudicial',
+            index=models.Index(fields=['tipo_dia', 'fecha_vencimiento', 'fecha_inicio'], name='plazo_tipodia_venc_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plazos', '0011_plazojudicial_tipodia_venc_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MarcaProceso',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('proceso', models.CharField(max_length=50, unique=True)),
+                ('fecha_corte', models.DateField(blank=True, help_text='Fecha hasta la cual se aplicaron las transiciones', null=True)),
+                ('ultima_ejecucion', models.DateTimeField(blank=True, help_text='Inicio de la última ejecución completada', null=True)),
+                ('actualizados', models.PositiveIntegerField(default=0, help_text='Filas modificadas en la última ejecución')),
+            ],
+            options={
+                'verbose_name': 'Marca de Proceso',
+                'verbose_name_plural': 'Marcas de Proceso',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='plazojudicial',
+            index=models.Index(fields=['updated_at'], name='plazo_updated_at_idx'),
+        ),
+    ]
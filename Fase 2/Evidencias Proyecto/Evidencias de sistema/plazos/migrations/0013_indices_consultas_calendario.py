@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plazos', '0012_marcaproceso'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='plazojudicial',
+            index=models.Index(fields=['usuario', 'fecha_vencimiento', 'fecha_inicio'], name='plazo_usr_venc_inicio_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='plazojudicial',
+            index=models.Index(fields=['usuario', 'estado', 'fecha_vencimiento'], name='plazo_usr_estado_venc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='plazojudicial',
+            index=models.Index(fields=['usuario', '-created_at'], name='plazo_usr_creado_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='plazojudicial',
+            index=models.Index(condition=models.Q(('estado__in', ['pendiente', 'corriendo'])), fields=['usuario', 'fecha_vencimiento'], name='plazo_usr_abiertos_venc_idx'),
+        ),
+    ]
@@ -0,0 +1,89 @@
+"""
+Índices de texto completo para la búsqueda de plazos (ver plazos.utils.busqueda).
+
+PostgreSQL: GIN sobre tsvector y GIN de trigramas sobre UPPER(rol).
+SQLite: tabla virtual FTS5 sincronizada con triggers.
+"""
+
+from django.db import migrations
+
+TABLA_FTS = 'plazos_plazojudicial_fts'
+
+# Debe coincidir con plazos.utils.busqueda.VECTOR_POSTGRES
+VECTOR_POSTGRES = (
+    "to_tsvector('spanish', coalesce(rol, '') || ' ' || coalesce(observaciones, ''))"
+)
+
+POSTGRES_CREAR = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    f'CREATE INDEX IF NOT EXISTS plazo_busqueda_fts_idx ON plazos_plazojudicial USING GIN ({VECTOR_POSTGRES})',
+    'CREATE INDEX IF NOT EXISTS plazo_rol_trgm_idx ON plazos_plazojudicial USING GIN (UPPER(rol) gin_trgm_ops)',
+]
+
+POSTGRES_ELIMINAR = [
+    'DROP INDEX IF EXISTS plazo_busqueda_fts_idx',
+    'DROP INDEX IF EXISTS plazo_rol_trgm_idx',
+]
+
+SQLITE_CREAR = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {TABLA_FTS} USING fts5(
+        usuario_id, rol, observaciones,
+        content='plazos_plazojudicial', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {TABLA_FTS}_ai AFTER INSERT ON plazos_plazojudicial BEGIN
+        INSERT INTO {TABLA_FTS}(rowid, usuario_id, rol, observaciones)
+        VALUES (new.id, new.usuario_id, new.rol, new.observaciones);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {TABLA_FTS}_ad AFTER DELETE ON plazos_plazojudicial BEGIN
+        INSERT INTO {TABLA_FTS}({TABLA_FTS}, rowid, usuario_id, rol, observaciones)
+        VALUES ('delete', old.id, old.usuario_id, old.rol, old.observaciones);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {TABLA_FTS}_au
+        AFTER UPDATE OF usuario_id, rol, observaciones ON plazos_plazojudicial BEGIN
+        INSERT INTO {TABLA_FTS}({TABLA_FTS}, rowid, usuario_id, rol, observaciones)
+        VALUES ('delete', old.id, old.usuario_id, old.rol, old.observaciones);
+        INSERT INTO {TABLA_FTS}(rowid, usuario_id, rol, observaciones)
+        VALUES (new.id, new.usuario_id, new.rol, new.observaciones);
+    END""",
+    f"INSERT INTO {TABLA_FTS}({TABLA_FTS}) VALUES ('rebuild')",
+]
+
+SQLITE_ELIMINAR = [
+    f'DROP TRIGGER IF EXISTS {TABLA_FTS}_ai',
+    f'DROP TRIGGER IF EXISTS {TABLA_FTS}_ad',
+    f'DROP TRIGGER IF EXISTS {TABLA_FTS}_au',
+    f'DROP TABLE IF EXISTS {TABLA_FTS}',
+]
+
+
+def _ejecutar(schema_editor, sentencias):
+    for sentencia in sentencias:
+        schema_editor.execute(sentencia)
+
+
+def crear_indices(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _ejecutar(schema_editor, POSTGRES_CREAR)
+    elif vendor == 'sqlite':
+        _ejecutar(schema_editor, SQLITE_CREAR)
+
+
+def eliminar_indices(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _ejecutar(schema_editor, POSTGRES_ELIMINAR)
+    elif vendor == 'sqlite':
+        _ejecutar(schema_editor, SQLITE_ELIMINAR)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plazos', '0013_indices_consultas_calendario'),
+    ]
+
+    operations = [
+        migrations.RunPython(crear_indices, eliminar_indices),
+    ]
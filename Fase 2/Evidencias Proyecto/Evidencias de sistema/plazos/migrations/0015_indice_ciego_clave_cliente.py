@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:18
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plazos', '0014_indice_busqueda_plazos'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='plazojudicial',
+            name='clave_cliente_hash',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Índice ciego (HMAC) de la clave del cliente', max_length=32),
+        ),
+        migrations.CreateModel(
+            name='TokenClaveCliente',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=32)),
+                ('plazo', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tokens_clave', to='plazos.plazojudicial')),
+            ],
+            options={
+                'verbose_name': 'Token de Clave de Cliente',
+                'verbose_name_plural': 'Tokens de Clave de Cliente',
+                'indexes': [models.Index(fields=['token', 'plazo'], name='token_clave_plazo_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:26
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('plazos', '0015_indice_ciego_clave_cliente'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SuscripcionCalendario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('usuario', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='suscripcion_calendario', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Suscripción de Calendario',
+                'verbose_name_plural': 'Suscripciones de Calendario',
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:28
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import plazos.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('plazos', '0016_suscripcioncalendario'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrabajoExportacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('formato', models.CharField(choices=[('pdf', 'PDF'), ('ics', 'iCalendar'), ('xlsx', 'Excel')], max_length=10)),
+                ('parametros', models.JSONField(default=dict, help_text='Filtros normalizados de la exportación')),
+                ('huella', models.CharField(help_text='Hash de formato, filtros y versión de los datos', max_length=64)),
+                ('estado', models.CharField(choices=[('pendiente', 'Pendiente'), ('procesando', 'Procesando'), ('completado', 'Completado'), ('error', 'Error')], default='pendiente', max_length=20)),
+                ('archivo', models.FileField(blank=True, null=True, upload_to=plazos.models.ruta_archivo_exportacion)),
+                ('nombre_descarga', models.CharField(blank=True, max_length=120)),
+                ('total_filas', models.PositiveIntegerField(default=0)),
+                ('intentos', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('iniciado_en', models.DateTimeField(blank=True, null=True)),
+                ('finalizado_en', models.DateTimeField(blank=True, null=True)),
+                ('expira_en', models.DateTimeField(blank=True, null=True)),
+                ('usuario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='trabajos_exportacion', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Trabajo de Exportación',
+                'verbose_name_plural': 'Trabajos de Exportación',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['estado', 'created_at'], name='exportacion_estado_idx'), models.Index(fields=['usuario', 'huella'], name='exportacion_huella_idx'), models.Index(fields=['expira_en'], name='exportacion_expira_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='trabajoexportacion',
+            constraint=models.UniqueConstraint(condition=models.Q(('estado__in', ['pendiente', 'procesando'])), fields=('usuario', 'huella'), name='exportacion_activa_unica'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plazos', '0017_trabajoexportacion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticuloCPC',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('numero', models.PositiveIntegerField()),
+                ('sufijo', models.CharField(blank=True, help_text='bis, ter, quáter...', max_length=12)),
+                ('libro', models.CharField(blank=True, max_length=200)),
+                ('titulo', models.CharField(blank=True, max_length=200)),
+                ('texto', models.TextField()),
+                ('dias_plazo', models.PositiveIntegerField(blank=True, help_text='Días del primer plazo que establece el artículo', null=True)),
+                ('tipo_dia', models.CharField(blank=True, choices=[('habil', 'Días Hábiles'), ('corrido', 'Días Corridos')], max_length=10)),
+                ('clausulas_plazo', models.JSONField(blank=True, default=list, help_text='Plazos encontrados: días, tipo de día y texto de la cláusula')),
+                ('huella', models.CharField(help_text='SHA-256 del texto, para detectar cambios', max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Artículo del CPC',
+                'verbose_name_plural': 'Artículos del CPC',
+                'ordering': ['numero', 'sufijo'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='articulocpc',
+            constraint=models.UniqueConstraint(fields=('numero', 'sufijo'), name='articulo_cpc_numero_unico'),
+        ),
+        migrations.AddField(
+            model_name='codigoprocedimiento',
+            name='articulo',
+            field=models.ForeignKey(blank=True, help_text='Artículo del CPC ingestado al que corresponde el código', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='codigos', to='plazos.articulocpc'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plazos', '0019_sincronizacioncpc'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sincronizacioncpc',
+            name='intentos',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:43
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plazos', '0020_sincronizacioncpc_intentos'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='trabajoexportacion',
+            name='exportacion_estado_idx',
+        ),
+        migrations.AddField(
+            model_name='trabajoexportacion',
+            name='disponible_en',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='No se reclama antes de esta fecha (reintentos con espera)'),
+        ),
+        migrations.AddIndex(
+            model_name='trabajoexportacion',
+            index=models.Index(fields=['estado', 'disponible_en'], name='exportacion_disponible_idx'),
+        ),
+    ]
@@ -1,17 +1,13 @@
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
-from cryptography.fernet import Fernet
-from django.conf import settings
+from django.utils import timezone
 from usuarios.models import Usuario
 
-# Generar clave de encriptación si no existe
+# Clave de encriptación principal (ver utils.cifrado para la configuración y rotación)
 def get_encryption_key():
-    key = getattr(settings, 'ENCRYPTION_KEY', None)
-    if not key:
-        key = Fernet.generate_key()
-        # En producción, guardar esta clave de forma segura
-    return key
+    from .utils.cifrado import obtener_claves
+    return obtener_claves()[0]
 
 class CodigoProcedimiento(models.Model):
     """Códigos de procedimiento civil con días automáticos"""
@@ -80,6 +76,14 @@ class CodigoProcedimiento(models.Model):
     articulo_cpc = models.CharField(max_length=50, blank=True, help_text="Artículo del Código Procesal Civil")
     descripcion = models.TextField(blank=True, help_text="Descripción detallada del procedimiento")
     observaciones = models.TextField(blank=True, help_text="Observaciones especiales")
+    articulo = models.ForeignKey(
+        'ArticuloCPC',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='codigos',
+        help_text="Artículo del CPC ingestado al que corresponde el código",
+    )
     activo = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -92,6 +96,67 @@ class CodigoProcedimiento(models.Model):
     def __str__(self):
         return f"{self.codigo} - {self.nombre}"
 
+
+class ArticuloCPC(models.Model):
+    """Artículo del Código de Procedimiento Civil ingestado desde el texto completo (ver ``ingestar_cpc``)"""
+    numero = models.PositiveIntegerField()
+    sufijo = models.CharField(max_length=12, blank=True, help_text="bis, ter, quáter...")
+    libro = models.CharField(max_length=200, blank=True)
+    titulo = models.CharField(max_length=200, blank=True)
+    texto = models.TextField()
+    dias_plazo = models.PositiveIntegerField(null=True, blank=True,
+                                             help_text="Días del primer plazo que establece el artículo")
+    tipo_dia = models.CharField(max_length=10, choices=CodigoProcedimiento.TIPOS_DIA, blank=True)
+    clausulas_plazo = models.JSONField(default=list, blank=True,
+                                       help_text="Plazos encontrados: días, tipo de día y texto de la cláusula")
+    huella = models.CharField(max_length=64, help_text="SHA-256 del texto, para detectar cambios")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Artículo del CPC"
+        verbose_name_plural = "Artículos del CPC"
+        ordering = ['numero', 'sufijo']
+        constraints = [
+            models.UniqueConstraint(fields=['numero', 'sufijo'], name='articulo_cpc_numero_unico'),
+        ]
+
+    def __str__(self):
+        return f"Artículo {self.numero}{' ' + self.sufijo if self.sufijo else ''}"
+
+class FeriadoJudicial(models.Model):
+    """Días en que los tribunales no funcionan, además de los feriados nacionales"""
+    TIPOS = [
+        ('feriado_judicial', 'Feriado Judicial (receso de febrero)'),
+        ('cierre_tribunal', 'Cierre de Tribunal'),
+        ('feriado_regional', 'Feriado Regional'),
+        ('otro', 'Otro'),
+    ]
+
+    nombre = models.CharField(max_length=200, help_text="Descripción del cierre (ej: Feriado judicial 2026)")
+    tipo = models.CharField(max_length=30, choices=TIPOS, default='cierre_tribunal')
+    fecha_inicio = models.DateField(help_text="Primer día sin funcionamiento")
+    fecha_fin = models.DateField(help_text="Último día sin funcionamiento (inclusive)")
+    activo = models.BooleanField(default=True)
+    observaciones = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Feriado Judicial"
+        verbose_name_plural = "Feriados Judiciales"
+        ordering = ['-fecha_inicio']
+
+    def __str__(self):
+        if self.fecha_inicio == self.fecha_fin:
+            return f"{self.nombre} ({self.fecha_inicio})"
+        return f"{self.nombre} ({self.fecha_inicio} - {self.fecha_fin})"
+
+    def clean(self):
+        """Validaciones del modelo"""
+        if self.fecha_inicio and self.fecha_fin and self.fecha_fin < self.fecha_inicio:
+            raise ValidationError("La fecha de término no puede ser anterior a la fecha de inicio")
+
 class PlazoJudicial(models.Model):
     TIPOS_DOCUMENTO = [
         ('demanda', 'Demanda'),
@@ -169,6 +234,8 @@ class PlazoJudicial(models.Model):
     rol = models.CharField(max_length=20, blank=True, help_text="Serie de números para identificar el proceso")
     rut_cliente = models.CharField(max_length=20, blank=True, help_text="RUT del cliente")
     clave_cliente = models.CharField(max_length=200, blank=True)
+    clave_cliente_hash = models.CharField(max_length=32, blank=True, db_index=True, editable=False,
+                                          help_text="Índice ciego (HMAC) de la clave del cliente")
     estado = models.CharField(max_length=20, choices=ESTADOS, default='corriendo')
     observaciones = models.TextField(blank=True, max_length=200)
     documento_adjunto = models.FileField(
@@ -184,6 +251,24 @@ class PlazoJudicial(models.Model):
         verbose_name = "Plazo Judicial"
         verbose_name_plural = "Plazos Judiciales"
         ordering = ['-fecha_vencimiento']
+        indexes = [
+            # Calendario y exportaciones: plazos del usuario ordenados por vencimiento
+            models.Index(fields=['usuario', 'fecha_vencimiento', 'fecha_inicio'], name='plazo_usr_venc_inicio_idx'),
+            # Filtros por estado (dashboard, vencidos) con rango de vencimiento
+            models.Index(fields=['usuario', 'estado', 'fecha_vencimiento'], name='plazo_usr_estado_venc_idx'),
+            # Plazos recientes del dashboard
+            models.Index(fields=['usuario', '-created_at'], name='plazo_usr_creado_idx'),
+            # Urgentes y próximos: solo plazos abiertos
+            models.Index(
+                fields=['usuario', 'fecha_vencimiento'],
+                name='plazo_usr_abiertos_venc_idx',
+                condition=models.Q(estado__in=['pendiente', 'corriendo']),
+            ),
+            # Recálculo de vencimientos al cambiar el calendario de feriados
+            models.Index(fields=['tipo_dia', 'fecha_vencimiento', 'fecha_inicio'], name='plazo_tipodia_venc_idx'),
+            # Filas modificadas desde la última ejecución de procesar_estados
+            models.Index(fields=['updated_at'], name='plazo_updated_at_idx'),
+        ]
 
     def __str__(self):
         fecha_str = str(self.fecha_vencimiento) if self.fecha_vencimiento else "Sin fecha"
@@ -206,32 +291,36 @@ class PlazoJudicial(models.Model):
                 self.tipo_dia
             )
         
-        super().save(*args, **kwargs)
+        # Índice ciego de la clave del cliente (ver utils.indice_ciego)
+        update_fields = kwargs.get('update_fields')
+        actualizar_indice = update_fields is None or 'clave_cliente' in update_fields
+        actualizar_tokens = False
+        if actualizar_indice:
+            from .utils.indice_ciego import clave_en_claro, indice_exacto
+            clave = clave_en_claro(self.clave_cliente)
+            indice = indice_exacto(clave)
+            actualizar_tokens = self._state.adding or indice != self.clave_cliente_hash
+            self.clave_cliente_hash = indice
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'clave_cliente_hash'}
+        
+        # El plazo y sus tokens se guardan juntos: nunca queda un plazo sin tokens
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+            
+            if actualizar_tokens:
+                from .utils.indice_ciego import sincronizar_tokens
+                sincronizar_tokens({self.pk: clave})
 
     def get_clave_cliente_desencriptada(self):
-        """Desencripta la clave del cliente"""
-        if not self.clave_cliente:
-            return ""
-        
-        try:
-            key = get_encryption_key()
-            fernet = Fernet(key)
-            return fernet.decrypt(self.clave_cliente.encode()).decode()
-        except:
-            return "Error al desencriptar"
+        """Desencripta la clave del cliente (las claves antiguas sin cifrar se devuelven tal cual)"""
+        from .utils.cifrado import descifrar
+        return descifrar(self.clave_cliente)
 
     def set_clave_cliente_encriptada(self, valor):
         """Encripta la clave del cliente"""
-        if not valor:
-            self.clave_cliente = ""
-            return
-        
-        try:
-            key = get_encryption_key()
-            fernet = Fernet(key)
-            self.clave_cliente = fernet.encrypt(valor.encode()).decode()
-        except:
-            self.clave_cliente = valor
+        from .utils.cifrado import cifrar
+        self.clave_cliente = cifrar(valor)
 
     @property
     def dias_restantes(self):
@@ -251,4 +340,180 @@ class PlazoJudicial(models.Model):
         """Validaciones del modelo"""
         if self.fecha_inicio and self.fecha_vencimiento:
             if self.fecha_vencimiento <= self.fecha_inicio:
-                raise ValidationError("La fecha de vencimiento debe ser posterior a la fecha de inicio")
\ No newline at end of file
+                raise ValidationError("La fecha de vencimiento debe ser posterior a la fecha de inicio")
+
+
+class TokenClaveCliente(models.Model):
+    """Token ciego (HMAC) de un prefijo de la clave del cliente, para búsqueda por prefijo"""
+    plazo = models.ForeignKey(PlazoJudicial, on_delete=models.CASCADE, related_name='tokens_clave')
+    token = models.CharField(max_length=32)
+
+    class Meta:
+        verbose_name = "Token de Clave de Cliente"
+        verbose_name_plural = "Tokens de Clave de Cliente"
+        indexes = [
+            models.Index(fields=['token', 'plazo'], name='token_clave_plazo_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.plazo_id}: {self.token}"
+
+
+class SuscripcionCalendario(models.Model):
+    """Token secreto de la URL de suscripción iCalendar de un usuario"""
+    usuario = models.OneToOneField(Usuario, on_delete=models.CASCADE, related_name='suscripcion_calendario')
+    token = models.CharField(max_length=64, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Suscripción de Calendario"
+        verbose_name_plural = "Suscripciones de Calendario"
+
+    def __str__(self):
+        return f"Suscripción de {self.usuario}"
+
+    @staticmethod
+    def generar_token():
+        import secrets
+        return secrets.token_urlsafe(32)
+
+    @classmethod
+    def obtener_o_crear(cls, usuario):
+        """Obtiene la suscripción del usuario, creándola si no existe"""
+        suscripcion, _ = cls.objects.get_or_create(
+            usuario=usuario,
+            defaults={'token': cls.generar_token()},
+        )
+        return suscripcion
+
+    def regenerar_token(self):
+        """Invalida la URL anterior generando un token nuevo"""
+        self.token = self.generar_token()
+        self.save(update_fields=['token'])
+
+
+def ruta_archivo_exportacion(instance, filename):
+    """Ruta del archivo generado: un nombre aleatorio por trabajo, fuera de las rutas adivinables"""
+    import uuid
+    extension = filename.rsplit('.', 1)[-1]
+    return f'exportaciones/{instance.usuario_id}/{uuid.uuid4().hex}.{extension}'
+
+
+class TrabajoExportacion(models.Model):
+    """Trabajo de exportación (PDF, iCalendar o Excel) procesado en segundo plano"""
+    FORMATOS = [
+        ('pdf', 'PDF'),
+        ('ics', 'iCalendar'),
+        ('xlsx', 'Excel'),
+    ]
+
+    ESTADOS = [
+        ('pendiente', 'Pendiente'),
+        ('procesando', 'Procesando'),
+        ('completado', 'Completado'),
+        ('error', 'Error'),
+    ]
+
+    ESTADOS_ACTIVOS = ('pendiente', 'procesando')
+
+    usuario = models.ForeignKey(Usuario, on_delete=models.CASCADE, related_name='trabajos_exportacion')
+    formato = models.CharField(max_length=10, choices=FORMATOS)
+    parametros = models.JSONField(default=dict, help_text="Filtros normalizados de la exportación")
+    huella = models.CharField(max_length=64, help_text="Hash de formato, filtros y versión de los datos")
+    estado = models.CharField(max_length=20, choices=ESTADOS, default='pendiente')
+    archivo = models.FileField(upload_to=ruta_archivo_exportacion, null=True, blank=True)
+    nombre_descarga = models.CharField(max_length=120, blank=True)
+    total_filas = models.PositiveIntegerField(default=0)
+    intentos = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    disponible_en = models.DateTimeField(default=timezone.now,
+                                         help_text="No se reclama antes de esta fecha (reintentos con espera)")
+    iniciado_en = models.DateTimeField(null=True, blank=True)
+    finalizado_en = models.DateTimeField(null=True, blank=True)
+    expira_en = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Trabajo de Exportación"
+        verbose_name_plural = "Trabajos de Exportación"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['estado', 'disponible_en'], name='exportacion_disponible_idx'),
+            models.Index(fields=['usuario', 'huella'], name='exportacion_huella_idx'),
+            models.Index(fields=['expira_en'], name='exportacion_expira_idx'),
+        ]
+        constraints = [
+            # Un solo trabajo activo por combinación de filtros: evita encolar duplicados
+            models.UniqueConstraint(
+                fields=['usuario', 'huella'],
+                condition=models.Q(estado__in=['pendiente', 'procesando']),
+                name='exportacion_activa_unica',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_formato_display()} #{self.pk} ({self.estado})"
+
+    @property
+    def descargable(self):
+        """True si el archivo está listo y no ha expirado"""
+        return (
+            self.estado == 'completado'
+            and bool(self.archivo)
+            and (self.expira_en is None or self.expira_en > timezone.now())
+        )
+
+
+class MarcaProceso(models.Model):
+    """Marca de agua de procesos periódicos (última fecha y ejecución procesadas)"""
+    proceso = models.CharField(max_length=50, unique=True)
+    fecha_corte = models.DateField(null=True, blank=True,
+                                   help_text="Fecha hasta la cual se aplicaron las transiciones")
+    ultima_ejecucion = models.DateTimeField(null=True, blank=True,
+                                            help_text="Inicio de la última ejecución completada")
+    actualizados = models.PositiveIntegerField(default=0, help_text="Filas modificadas en la última ejecución")
+
+    class Meta:
+        verbose_name = "Marca de Proceso"
+        verbose_name_plural = "Marcas de Proceso"
+
+    def __str__(self):
+        return f"{self.proceso} ({self.fecha_corte or 'sin ejecutar'})"
+
+
+class SincronizacionCPC(models.Model):
+    """Carga de los códigos del CPC desde la base local, procesada en segundo plano"""
+    ESTADOS = [
+        ('pendiente', 'Pendiente'),
+        ('procesando', 'Procesando'),
+        ('completado', 'Completado'),
+        ('error', 'Error'),
+    ]
+
+    solicitado_por = models.ForeignKey(Usuario, on_delete=models.SET_NULL, null=True, blank=True,
+                                       related_name='sincronizaciones_cpc')
+    estado = models.CharField(max_length=20, choices=ESTADOS, default='pendiente')
+    creados = models.PositiveIntegerField(default=0)
+    actualizados = models.PositiveIntegerField(default=0)
+    sin_cambios = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    intentos = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    iniciado_en = models.DateTimeField(null=True, blank=True)
+    finalizado_en = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Sincronización del CPC"
+        verbose_name_plural = "Sincronizaciones del CPC"
+        ordering = ['-created_at']
+        constraints = [
+            # Una sola sincronización pendiente: las solicitudes repetidas la reutilizan
+            models.UniqueConstraint(
+                fields=['estado'],
+                condition=models.Q(estado='pendiente'),
+                name='sincronizacion_cpc_pendiente_unica',
+            ),
+        ]
+
+    def __str__(self):
+        return f"Sincronización CPC #{self.pk} ({self.estado})"
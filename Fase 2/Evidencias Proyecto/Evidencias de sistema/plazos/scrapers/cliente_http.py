@@ -0,0 +1,241 @@
+"""
+Cliente HTTP asíncrono para los scrapers: concurrencia acotada, límite de tasa
+por host, reintentos con espera exponencial y caché en disco con GET condicional.
+
+Las peticiones se hacen con ``requests`` en un pool de hilos propio, por lo que
+no se agregan dependencias; asyncio solo coordina la concurrencia.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Respuestas que vale la pena reintentar
+ESTADOS_REINTENTABLES = {429, 500, 502, 503, 504}
+
+
+class CubetaTokens:
+    """
+    Limitador de tasa "token bucket".
+
+    Se recargan ``tasa`` fichas por segundo hasta ``capacidad``; cada petición
+    consume una y espera si no hay disponibles.
+    """
+
+    def __init__(self, tasa: float, capacidad: Optional[float] = None):
+        self.tasa = tasa
+        self.capacidad = capacidad or max(1.0, tasa)
+        self._fichas = self.capacidad
+        self._ultima_recarga = time.monotonic()
+        self._candado = asyncio.Lock()
+
+    async def adquirir(self) -> None:
+        """Espera hasta que haya una ficha disponible y la consume."""
+        async with self._candado:
+            while True:
+                ahora = time.monotonic()
+                self._fichas = min(self.capacidad, self._fichas + (ahora - self._ultima_recarga) * self.tasa)
+                self._ultima_recarga = ahora
+                if self._fichas >= 1:
+                    self._fichas -= 1
+                    return
+                await asyncio.sleep((1 - self._fichas) / self.tasa)
+
+
+class CacheHTTP:
+    """
+    Caché en disco de respuestas HTTP para GET condicionales.
+
+    Por cada URL guarda el cuerpo y sus validadores (``ETag`` y
+    ``Last-Modified``); al volver a pedirla se envían como ``If-None-Match`` /
+    ``If-Modified-Since`` y, si el servidor responde 304, se usa el cuerpo guardado.
+    """
+
+    def __init__(self, directorio):
+        self.directorio = Path(directorio)
+        self.directorio.mkdir(parents=True, exist_ok=True)
+
+    def _rutas(self, url: str):
+        nombre = hashlib.sha256(url.encode()).hexdigest()
+        return self.directorio / f'{nombre}.json', self.directorio / f'{nombre}.html'
+
+    def cabeceras_condicionales(self, url: str) -> Dict[str, str]:
+        """Cabeceras de validación para una URL ya guardada (vacío si no lo está)."""
+        ruta_meta, ruta_cuerpo = self._rutas(url)
+        if not ruta_meta.exists() or not ruta_cuerpo.exists():
+            return {}
+        meta = json.loads(ruta_meta.read_text(encoding='utf-8'))
+        cabeceras = {}
+        if meta.get('etag'):
+            cabeceras['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            cabeceras['If-Modified-Since'] = meta['last_modified']
+        return cabeceras
+
+    def cuerpo(self, url: str) -> Optional[bytes]:
+        """Cuerpo guardado de una URL, o None."""
+        _, ruta_cuerpo = self._rutas(url)
+        try:
+            return ruta_cuerpo.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def guardar(self, url: str, cabeceras, contenido: bytes) -> None:
+        """Guarda una respuesta 200 si trae algún validador."""
+        etag = cabeceras.get('ETag')
+        last_modified = cabeceras.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        ruta_meta, ruta_cuerpo = self._rutas(url)
+        # Escritura atómica: primero el cuerpo, luego los validadores
+        for ruta, datos in (
+            (ruta_cuerpo, contenido),
+            (ruta_meta, json.dumps({'url': url, 'etag': etag, 'last_modified': last_modified}).encode()),
+        ):
+            temporal = ruta.with_suffix(ruta.suffix + '.tmp')
+            temporal.write_bytes(datos)
+            os.replace(temporal, ruta)
+
+
+class ClienteHTTPAsincrono:
+    """
+    Descarga URLs en paralelo respetando los límites del servidor.
+
+    Attributes:
+        estadisticas: Peticiones hechas, respuestas 304 servidas desde el
+            caché, reintentos y errores definitivos
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, concurrencia: int = 8,
+                 peticiones_por_segundo: float = 4.0, rafaga: Optional[float] = None,
+                 reintentos: int = 3, espera_base: float = 0.5, timeout: float = 10,
+                 directorio_cache=None):
+        self.concurrencia = concurrencia
+        self.peticiones_por_segundo = peticiones_por_segundo
+        self.rafaga = rafaga
+        self.reintentos = reintentos
+        self.espera_base = espera_base
+        self.timeout = timeout
+        self.cache = CacheHTTP(directorio_cache) if directorio_cache else None
+
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        adaptador = HTTPAdapter(pool_connections=concurrencia, pool_maxsize=concurrencia)
+        self.session.mount('http://', adaptador)
+        self.session.mount('https://', adaptador)
+
+        self.estadisticas = {'peticiones': 0, 'no_modificadas': 0, 'reintentos': 0, 'errores': 0}
+        self._semaforo = None
+        self._cubetas: Dict[str, CubetaTokens] = {}
+        self._ejecutor = None
+
+    async def __aenter__(self):
+        # El semáforo y las cubetas se crean dentro del bucle de eventos que los usa
+        self._semaforo = asyncio.Semaphore(self.concurrencia)
+        self._cubetas = {}
+        self._ejecutor = ThreadPoolExecutor(max_workers=self.concurrencia, thread_name_prefix='scraper')
+        return self
+
+    async def __aexit__(self, *exc):
+        self._ejecutor.shutdown(wait=True)
+        self.session.close()
+
+    def _cubeta(self, url: str) -> CubetaTokens:
+        host = urlsplit(url).netloc
+        if host not in self._cubetas:
+            self._cubetas[host] = CubetaTokens(self.peticiones_por_segundo, self.rafaga)
+        return self._cubetas[host]
+
+    def _espera(self, intento: int, respuesta=None) -> float:
+        """
+        Espera antes de reintentar: exponencial con variación aleatoria, y al
+        menos lo indicado en ``Retry-After`` si el servidor lo envía.
+        """
+        espera = self.espera_base * (2 ** intento) + random.uniform(0, self.espera_base)
+        if respuesta is not None:
+            retry_after = respuesta.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                espera = max(espera, float(retry_after))
+        return espera
+
+    async def obtener(self, url: str, params: Optional[Dict[str, str]] = None) -> bytes:
+        """
+        Descarga una URL (GET) y devuelve su cuerpo.
+
+        Args:
+            url: URL absoluta
+            params: Parámetros de la query string
+
+        Returns:
+            Contenido de la respuesta (el del caché si el servidor respondió 304)
+
+        Raises:
+            requests.RequestException: Si falla tras agotar los reintentos
+        """
+        url_completa = requests.Request('GET', url, params=params).prepare().url
+
+        respuesta = await self._pedir(url_completa, condicional=True)
+        if respuesta.status_code == 304 and self.cache:
+            contenido = self.cache.cuerpo(url_completa)
+            if contenido is not None:
+                self.estadisticas['no_modificadas'] += 1
+                return contenido
+            # Se perdió el cuerpo guardado: se pide completo, sin validadores
+            respuesta = await self._pedir(url_completa, condicional=False)
+
+        try:
+            respuesta.raise_for_status()
+            if respuesta.status_code == 304:
+                raise requests.HTTPError('304 sin cuerpo en caché', response=respuesta)
+        except requests.HTTPError:
+            self.estadisticas['errores'] += 1
+            raise
+        if self.cache:
+            self.cache.guardar(url_completa, respuesta.headers, respuesta.content)
+        return respuesta.content
+
+    async def _pedir(self, url_completa: str, condicional: bool):
+        """
+        Hace el GET con reintentos y devuelve la última respuesta.
+
+        El semáforo solo se ocupa durante cada petición: las esperas entre
+        reintentos no retienen un cupo de concurrencia.
+
+        Raises:
+            requests.ConnectionError, requests.Timeout: Si fallan todos los intentos
+        """
+        loop = asyncio.get_running_loop()
+        respuesta = None
+        for intento in range(self.reintentos + 1):
+            respuesta = None
+            async with self._semaforo:
+                await self._cubeta(url_completa).adquirir()
+                cabeceras = (
+                    self.cache.cabeceras_condicionales(url_completa) if condicional and self.cache else {}
+                )
+                self.estadisticas['peticiones'] += 1
+                try:
+                    respuesta = await loop.run_in_executor(
+                        self._ejecutor,
+                        lambda: self.session.get(url_completa, headers=cabeceras, timeout=self.timeout),
+                    )
+                except (requests.ConnectionError, requests.Timeout):
+                    if intento == self.reintentos:
+                        self.estadisticas['errores'] += 1
+                        raise
+            if respuesta is not None and respuesta.status_code not in ESTADOS_REINTENTABLES:
+                return respuesta
+            if intento < self.reintentos:
+                self.estadisticas['reintentos'] += 1
+                await asyncio.sleep(self._espera(intento, respuesta))
+        return respuesta
@@ -1,12 +1,151 @@
 """
 Scraper para extraer artículos del Código de Procedimiento Civil chileno.
+
+``CPCScraper`` recorre los términos y los artículos de a uno con una pausa
+entre búsquedas. ``CPCScraperAsincrono`` hace las mismas búsquedas en paralelo
+con ``cliente_http.ClienteHTTPAsincrono`` (concurrencia acotada, límite de tasa
+por host, reintentos y caché en disco con GET condicional) y descarga una sola
+vez cada artículo aunque aparezca en varias búsquedas.
 """
+import asyncio
 import requests
 from bs4 import BeautifulSoup
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, FrozenSet, Optional, Set, Tuple
 import time
 from datetime import datetime
+from functools import lru_cache
+
+from .cliente_http import ClienteHTTPAsincrono
+
+try:
+    import lxml  # noqa: F401
+    PARSER_HTML = 'lxml'
+except ImportError:
+    PARSER_HTML = 'html.parser'
+
+BASE_URL_LEYCHILE = "https://www.leychile.cl"
+
+# Mapeo de palabras clave a tipos de documento (gana el primero que aparece)
+TIPOS_DOCUMENTO = {
+    'contestacion': ('contestación', 'contestar'),
+    'replica': ('réplica', 'replicar', 'replica'),
+    'duplica': ('dúplica', 'duplicar', 'duplica'),
+    'recurso_apelacion': ('recurso de apelación', 'apelación', 'apelar'),
+    'recurso_casacion': ('recurso de casación', 'casación', 'casar'),
+    'recurso_revision': ('recurso de revisión', 'revisión', 'revisar'),
+    'recurso_queja': ('recurso de queja', 'queja', 'quejar'),
+    'recurso_proteccion': ('recurso de protección', 'protección', 'proteger'),
+    'recurso_amparo': ('recurso de amparo', 'amparo', 'amparar'),
+    'incidente': ('incidente', 'incidentes'),
+    'excepcion': ('excepción', 'excepciones', 'exceptuar'),
+    'medida_cautelar': ('medida cautelar', 'cautelar', 'cautelas'),
+    'embargo': ('embargo', 'embargar', 'embargos'),
+}
+
+TIPOS_PROCEDIMIENTO = (
+    ('sumario', ('sumario',)),
+    ('ejecutivo', ('ejecutivo',)),
+    ('monitorio', ('monitorio',)),
+    ('constitucional', ('constitucional', 'protección', 'amparo')),
+)
+
+DIAS_POR_DEFECTO = (('contestación', 15), ('réplica', 6), ('dúplica', 3), ('recurso', 5))
+
+OBSERVACIONES_PLAZO = (
+    ('notificación', 'la notificación'),
+    ('presentación', 'la presentación'),
+    ('conocimiento', 'el conocimiento del hecho'),
+)
+
+PALABRAS_CLAVE = frozenset(
+    [palabra for palabras in TIPOS_DOCUMENTO.values() for palabra in palabras]
+    + [palabra for _, palabras in TIPOS_PROCEDIMIENTO for palabra in palabras]
+    + [palabra for palabra, _ in DIAS_POR_DEFECTO + OBSERVACIONES_PLAZO]
+    + ['hábil', 'corrido']
+)
+
+
+
+def _alternancia_trie(palabras) -> str:
+    """
+    Expresión que reconoce cualquiera de las palabras, factorizada por prefijos
+    comunes (un trie): en cada posición el motor descarta casi todas las palabras
+    con una comparación por carácter y, con cuantificadores codiciosos, calza la
+    más larga.
+    """
+    trie = {}
+    for palabra in palabras:
+        nodo = trie
+        for caracter in palabra:
+            nodo = nodo.setdefault(caracter, {})
+        nodo[''] = {}
+
+    def construir(nodo) -> str:
+        ramas = [re.escape(caracter) + construir(hijo) for caracter, hijo in sorted(nodo.items()) if caracter]
+        if not ramas:
+            return ''
+        cuerpo = ramas[0] if len(ramas) == 1 else '(?:%s)' % '|'.join(ramas)
+        if '' in nodo:
+            cuerpo = cuerpo + '?' if cuerpo.startswith('(?:') else '(?:%s)?' % cuerpo
+        return cuerpo
+
+    return construir(trie)
+
+
+# Una sola pasada con todas las palabras clave; el lookahead permite encontrar
+# también las que se solapan (por ejemplo "protección" dentro de "recurso de protección")
+_PATRON_PALABRAS = re.compile('(?=(%s))' % _alternancia_trie(PALABRAS_CLAVE))
+
+# Palabras presentes cuando aparece cada una (ella y las que son su prefijo)
+_PREFIJOS = {
+    palabra: frozenset(otra for otra in PALABRAS_CLAVE if palabra.startswith(otra))
+    for palabra in PALABRAS_CLAVE
+}
+
+_PATRON_NUMERO_ARTICULO = re.compile(r'Artículo\s+(\d+)|Art\.\s*(\d+)|Art\s+(\d+)', re.IGNORECASE)
+
+# "N días", opcionalmente seguido de "hábiles" o "corridos"
+_PATRON_DIAS = re.compile(r'(\d+)\s*días?(?:\s*(hábil|corrido))?', re.IGNORECASE)
+
+
+def buscar_palabras_clave(texto: str) -> List[Tuple[int, str]]:
+    """
+    Busca todas las palabras clave en una sola pasada sobre el texto.
+    
+    Returns:
+        Lista de ``(posición, palabra)``; en cada posición se informa la palabra
+        más larga, las que son su prefijo se obtienen con ``palabras_presentes``
+    """
+    return [(match.start(), match.group(1)) for match in _PATRON_PALABRAS.finditer(texto.lower())]
+
+
+@lru_cache(maxsize=256)
+def _palabras_termino(termino: str) -> FrozenSet[str]:
+    """Palabras clave de un término de búsqueda (se repiten en cada artículo)."""
+    return frozenset(palabras_presentes(termino))
+
+
+def palabras_presentes(texto: str) -> Set[str]:
+    """Conjunto de palabras clave que aparecen en el texto (sin distinguir mayúsculas)."""
+    return set().union(*map(_PREFIJOS.__getitem__, set(_PATRON_PALABRAS.findall(texto.lower()))))
+
+# Términos de búsqueda para encontrar artículos relevantes
+TERMINOS_BUSQUEDA = [
+    'contestación demanda procedimiento',
+    'réplica procedimiento civil',
+    'dúplica procedimiento',
+    'recurso apelación procedimiento',
+    'recurso casación',
+    'recurso revisión',
+    'recurso queja',
+    'recurso protección',
+    'recurso amparo',
+    'incidente procedimiento civil',
+    'excepción procedimiento',
+    'medida cautelar',
+    'embargo procedimiento'
+]
 
 
 class CPCScraper:
@@ -14,9 +153,11 @@ class CPCScraper:
     Scraper para extraer información del Código de Procedimiento Civil.
     """
     
-    def __init__(self):
-        self.base_url = "https://www.leychile.cl"
-        self.search_url = "https://www.leychile.cl/Consulta/buscar"
+    pausa_entre_terminos = 1  # segundos, para no sobrecargar el servidor
+
+    def __init__(self, base_url: str = BASE_URL_LEYCHILE):
+        self.base_url = base_url.rstrip('/')
+        self.search_url = f"{self.base_url}/Consulta/buscar"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
@@ -39,7 +180,7 @@ class CPCScraper:
             print(f"Buscando: {termino}")
             articulos = self._buscar_termino(termino)
             articulos_encontrados.extend(articulos)
-            time.sleep(1)  # Pausa para no sobrecargar el servidor
+            time.sleep(self.pausa_entre_terminos)
         
         # Eliminar duplicados
         articulos_unicos = self._eliminar_duplicados(articulos_encontrados)
@@ -56,26 +197,43 @@ class CPCScraper:
             Lista de artículos encontrados
         """
         try:
-            # Parámetros de búsqueda
-            params = {
-                'q': termino,
-                't': '1',  # Tipo: Leyes
-                'f': '0',  # Fecha desde
-                'h': '0',  # Fecha hasta
-                's': '0',  # Orden
-                'p': '1'   # Página
-            }
-            
-            response = self.session.get(self.search_url, params=params, timeout=10)
+            response = self.session.get(self.search_url, params=self._parametros_busqueda(termino), timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, PARSER_HTML)
             return self._parsear_resultados(soup, termino)
             
         except Exception as e:
             print(f"Error al buscar '{termino}': {e}")
             return []
     
+    def _parametros_busqueda(self, termino: str) -> Dict[str, str]:
+        """Parámetros de la búsqueda de LeyChile para un término."""
+        return {
+            'q': termino,
+            't': '1',  # Tipo: Leyes
+            'f': '0',  # Fecha desde
+            'h': '0',  # Fecha hasta
+            's': '0',  # Orden
+            'p': '1'   # Página
+        }
+    
+    def _enlaces_cpc(self, soup: BeautifulSoup) -> List[str]:
+        """
+        Obtiene las URLs de los resultados que corresponden al CPC.
+        
+        Args:
+            soup: Página de resultados de búsqueda
+            
+        Returns:
+            URLs absolutas, en el orden de la página
+        """
+        urls = []
+        for enlace in soup.find_all('a', href=re.compile(r'/Navegar\?idNorma=')):
+            if self._es_codigo_procedimiento_civil(enlace.get_text(strip=True)):
+                urls.append(self.base_url + enlace.get('href'))
+        return urls
+    
     def _parsear_resultados(self, soup: BeautifulSoup, termino: str) -> List[Dict]:
         """
         Parsea los resultados de búsqueda.
@@ -89,20 +247,13 @@ class CPCScraper:
         """
         articulos = []
         
-        # Buscar enlaces a leyes
-        enlaces = soup.find_all('a', href=re.compile(r'/Navegar\?idNorma='))
-        
-        for enlace in enlaces:
+        # Enlaces a leyes del CPC
+        for url in self._enlaces_cpc(soup):
             try:
-                titulo = enlace.get_text(strip=True)
-                url = self.base_url + enlace.get('href')
-                
-                # Verificar si es del CPC
-                if self._es_codigo_procedimiento_civil(titulo):
-                    articulo = self._extraer_articulo_desde_url(url, termino)
-                    if articulo:
-                        articulos.append(articulo)
-                        
+                articulo = self._extraer_articulo_desde_url(url, termino)
+                if articulo:
+                    articulos.append(articulo)
+                    
             except Exception as e:
                 print(f"Error al parsear enlace: {e}")
                 continue
@@ -142,7 +293,7 @@ class CPCScraper:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, PARSER_HTML)
             
             # Extraer información del artículo
             articulo_info = self._parsear_articulo(soup, termino)
@@ -163,59 +314,74 @@ class CPCScraper:
         Returns:
             Diccionario con información del artículo
         """
+        analisis = self._analizar_articulo(soup)
+        return self._armar_articulo(analisis, termino) if analisis else None
+    
+    def _analizar_articulo(self, soup: BeautifulSoup) -> Optional[Dict]:
+        """
+        Extrae de la página todo lo que no depende del término buscado.
+        
+        El texto se recorre una sola vez para buscar todas las palabras clave
+        (``palabras_presentes``) y otra para los plazos en días; las reglas de
+        clasificación consultan ese resultado en lugar de volver a leer el texto.
+        
+        Returns:
+            Diccionario con el análisis, o None si la página no es un artículo
+        """
         try:
             # Buscar el número del artículo
             numero_articulo = self._extraer_numero_articulo(soup)
             if not numero_articulo:
                 return None
             
-            # Extraer texto del artículo
+            # Extraer texto del artículo y sus palabras clave
             texto_articulo = self._extraer_texto_articulo(soup)
-            
-            # Determinar tipo de documento y procedimiento
-            tipo_info = self._determinar_tipo_documento(termino, texto_articulo)
-            
-            # Extraer días de plazo
-            dias_plazo = self._extraer_dias_plazo(texto_articulo)
-            
-            # Determinar tipo de día
-            tipo_dia = self._determinar_tipo_dia(texto_articulo)
+            presentes = palabras_presentes(texto_articulo)
             
             return {
-                'codigo': f"ART. {numero_articulo} CPC",
-                'nombre': f"{tipo_info['tipo_documento']} - {tipo_info['tipo_procedimiento']}",
-                'tipo_documento': tipo_info['tipo_documento'],
-                'tipo_procedimiento': tipo_info['tipo_procedimiento'],
-                'dias_plazo': dias_plazo,
-                'tipo_dia': tipo_dia,
-                'articulo_cpc': f"Artículo {numero_articulo}",
-                'descripcion': f"Plazo para {tipo_info['tipo_documento']} en {tipo_info['tipo_procedimiento']}",
-                'observaciones': f"Se cuenta desde {self._extraer_observaciones(texto_articulo)}",
-                'activo': True,
-                'texto_completo': texto_articulo,
-                'fecha_extraccion': datetime.now().isoformat()
+                'numero': numero_articulo,
+                'texto': texto_articulo,
+                'presentes': presentes,
+                'dias_plazo': self._extraer_dias_plazo(texto_articulo, presentes),
+                'tipo_dia': self._determinar_tipo_dia(presentes),
+                'observaciones': self._extraer_observaciones(presentes),
             }
             
         except Exception as e:
             print(f"Error al parsear artículo: {e}")
             return None
     
-    def _extraer_numero_articulo(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extrae el número del artículo."""
-        # Buscar patrones como "Artículo 254", "Art. 255", etc.
-        patrones = [
-            r'Artículo\s+(\d+)',
-            r'Art\.\s*(\d+)',
-            r'Art\s+(\d+)'
-        ]
+    def _armar_articulo(self, analisis: Dict, termino: str) -> Dict:
+        """Completa el artículo con el tipo de documento, que depende del término buscado."""
+        presentes = analisis['presentes']
+        tipo_info = self._determinar_tipo_documento(_palabras_termino(termino) | presentes, presentes)
+        numero_articulo = analisis['numero']
         
-        texto = soup.get_text()
-        for patron in patrones:
-            match = re.search(patron, texto, re.IGNORECASE)
-            if match:
+        return {
+            'codigo': f"ART. {numero_articulo} CPC",
+            'nombre': f"{tipo_info['tipo_documento']} - {tipo_info['tipo_procedimiento']}",
+            'tipo_documento': tipo_info['tipo_documento'],
+            'tipo_procedimiento': tipo_info['tipo_procedimiento'],
+            'dias_plazo': analisis['dias_plazo'],
+            'tipo_dia': analisis['tipo_dia'],
+            'articulo_cpc': f"Artículo {numero_articulo}",
+            'descripcion': f"Plazo para {tipo_info['tipo_documento']} en {tipo_info['tipo_procedimiento']}",
+            'observaciones': f"Se cuenta desde {analisis['observaciones']}",
+            'activo': True,
+            'texto_completo': analisis['texto'],
+            'fecha_extraccion': datetime.now().isoformat()
+        }
+    
+    def _extraer_numero_articulo(self, soup: BeautifulSoup) -> Optional[str]:
+        """Extrae el número del artículo ("Artículo 254", "Art. 255" o "Art 256", en ese orden)."""
+        primeros = [None, None, None]
+        for match in _PATRON_NUMERO_ARTICULO.finditer(soup.get_text()):
+            indice = match.lastindex - 1
+            if indice == 0:
                 return match.group(1)
-        
-        return None
+            if primeros[indice] is None:
+                primeros[indice] = match.group(match.lastindex)
+        return primeros[1] or primeros[2]
     
     def _extraer_texto_articulo(self, soup: BeautifulSoup) -> str:
         """Extrae el texto completo del artículo."""
@@ -226,103 +392,76 @@ class CPCScraper:
         
         return soup.get_text(strip=True)
     
-    def _determinar_tipo_documento(self, termino: str, texto: str) -> Dict[str, str]:
-        """Determina el tipo de documento y procedimiento."""
-        termino_lower = termino.lower()
-        texto_lower = texto.lower()
-        
-        # Mapeo de términos a tipos de documento
-        tipos_documento = {
-            'contestacion': ['contestación', 'contestar', 'contestar'],
-            'replica': ['réplica', 'replicar', 'replica'],
-            'duplica': ['dúplica', 'duplicar', 'duplica'],
-            'recurso_apelacion': ['recurso de apelación', 'apelación', 'apelar'],
-            'recurso_casacion': ['recurso de casación', 'casación', 'casar'],
-            'recurso_revision': ['recurso de revisión', 'revisión', 'revisar'],
-            'recurso_queja': ['recurso de queja', 'queja', 'quejar'],
-            'recurso_proteccion': ['recurso de protección', 'protección', 'proteger'],
-            'recurso_amparo': ['recurso de amparo', 'amparo', 'amparar'],
-            'incidente': ['incidente', 'incidentes'],
-            'excepcion': ['excepción', 'excepciones', 'exceptuar'],
-            'medida_cautelar': ['medida cautelar', 'cautelar', 'cautelas'],
-            'embargo': ['embargo', 'embargar', 'embargos']
-        }
+    def _determinar_tipo_documento(self, presentes_termino_o_texto: Set[str],
+                                   presentes_texto: Set[str]) -> Dict[str, str]:
+        """
+        Determina el tipo de documento y procedimiento.
         
+        Args:
+            presentes_termino_o_texto: Palabras clave del término buscado y del texto
+            presentes_texto: Palabras clave del texto del artículo
+        """
         # Determinar tipo de documento
         tipo_documento = 'otro'
-        for tipo, palabras in tipos_documento.items():
-            if any(palabra in termino_lower or palabra in texto_lower for palabra in palabras):
+        for tipo, palabras in TIPOS_DOCUMENTO.items():
+            if not presentes_termino_o_texto.isdisjoint(palabras):
                 tipo_documento = tipo
                 break
         
         # Determinar tipo de procedimiento
         tipo_procedimiento = 'ordinario'
-        if 'sumario' in texto_lower:
-            tipo_procedimiento = 'sumario'
-        elif 'ejecutivo' in texto_lower:
-            tipo_procedimiento = 'ejecutivo'
-        elif 'monitorio' in texto_lower:
-            tipo_procedimiento = 'monitorio'
-        elif 'constitucional' in texto_lower or 'protección' in texto_lower or 'amparo' in texto_lower:
-            tipo_procedimiento = 'constitucional'
+        for tipo, palabras in TIPOS_PROCEDIMIENTO:
+            if not presentes_texto.isdisjoint(palabras):
+                tipo_procedimiento = tipo
+                break
         
         return {
             'tipo_documento': tipo_documento,
             'tipo_procedimiento': tipo_procedimiento
         }
     
-    def _extraer_dias_plazo(self, texto: str) -> int:
+    def _extraer_dias_plazo(self, texto: str, presentes: Set[str]) -> int:
         """Extrae el número de días de plazo del texto."""
-        # Patrones para buscar días
-        patrones = [
-            r'(\d+)\s*días?\s*hábiles?',
-            r'(\d+)\s*días?\s*corridos?',
-            r'(\d+)\s*días?',
-            r'plazo\s*de\s*(\d+)\s*días?'
-        ]
-        
-        for patron in patrones:
-            match = re.search(patron, texto, re.IGNORECASE)
-            if match:
+        # Preferencia: "N días hábil(es)", luego "N días corrido(s)", luego "N días".
+        # El singular ("5 días hábil") también cuenta como hábil
+        primero = corridos = None
+        for match in _PATRON_DIAS.finditer(texto):
+            calificador = (match.group(2) or '').lower()
+            if calificador.startswith('h'):
                 return int(match.group(1))
+            if calificador and corridos is None:
+                corridos = int(match.group(1))
+            if primero is None:
+                primero = int(match.group(1))
+        if corridos is not None:
+            return corridos
+        if primero is not None:
+            return primero
         
         # Valores por defecto según el tipo de documento
-        if 'contestación' in texto.lower():
-            return 15
-        elif 'réplica' in texto.lower():
-            return 6
-        elif 'dúplica' in texto.lower():
-            return 3
-        elif 'recurso' in texto.lower():
-            return 5
+        for palabra, dias in DIAS_POR_DEFECTO:
+            if palabra in presentes:
+                return dias
         
         return 30  # Valor por defecto
     
-    def _determinar_tipo_dia(self, texto: str) -> str:
+    def _determinar_tipo_dia(self, presentes: Set[str]) -> str:
         """Determina si son días hábiles o corridos."""
-        texto_lower = texto.lower()
-        
-        if 'hábil' in texto_lower or 'hábiles' in texto_lower:
+        if 'hábil' in presentes:
             return 'habil'
-        elif 'corrido' in texto_lower or 'corridos' in texto_lower:
+        elif 'corrido' in presentes:
             return 'corrido'
-        elif 'recurso de protección' in texto_lower or 'recurso de amparo' in texto_lower:
+        elif 'recurso de protección' in presentes or 'recurso de amparo' in presentes:
             return 'corrido'
         else:
             return 'habil'  # Por defecto son hábiles
     
-    def _extraer_observaciones(self, texto: str) -> str:
+    def _extraer_observaciones(self, presentes: Set[str]) -> str:
         """Extrae observaciones sobre el cómputo del plazo."""
-        texto_lower = texto.lower()
-        
-        if 'notificación' in texto_lower:
-            return 'la notificación'
-        elif 'presentación' in texto_lower:
-            return 'la presentación'
-        elif 'conocimiento' in texto_lower:
-            return 'el conocimiento del hecho'
-        else:
-            return 'la fecha correspondiente'
+        for palabra, observacion in OBSERVACIONES_PLAZO:
+            if palabra in presentes:
+                return observacion
+        return 'la fecha correspondiente'
     
     def _eliminar_duplicados(self, articulos: List[Dict]) -> List[Dict]:
         """Elimina artículos duplicados basado en el código."""
@@ -338,34 +477,101 @@ class CPCScraper:
         return unicos
 
 
-def obtener_articulos_cpc_automaticamente() -> List[Dict]:
+class CPCScraperAsincrono(CPCScraper):
+    """
+    Variante concurrente de ``CPCScraper`` basada en asyncio.
+    
+    Devuelve los mismos artículos, en el mismo orden, que la versión secuencial.
+    """
+    
+    def __init__(self, base_url: str = BASE_URL_LEYCHILE, concurrencia: int = 8,
+                 peticiones_por_segundo: float = 4.0, reintentos: int = 3,
+                 directorio_cache=None):
+        super().__init__(base_url)
+        self.concurrencia = concurrencia
+        self.peticiones_por_segundo = peticiones_por_segundo
+        self.reintentos = reintentos
+        self.directorio_cache = directorio_cache
+        self.estadisticas = {}
+    
+    def buscar_articulos_cpc(self, terminos_busqueda: List[str]) -> List[Dict]:
+        """
+        Busca artículos del CPC ejecutando las búsquedas en paralelo.
+        
+        Args:
+            terminos_busqueda: Lista de términos para buscar
+            
+        Returns:
+            Lista de diccionarios con información de artículos
+        """
+        return asyncio.run(self.buscar_articulos_cpc_async(terminos_busqueda))
+    
+    async def buscar_articulos_cpc_async(self, terminos_busqueda: List[str]) -> List[Dict]:
+        """Versión corrutina de ``buscar_articulos_cpc``."""
+        cliente = ClienteHTTPAsincrono(
+            headers=self.headers,
+            concurrencia=self.concurrencia,
+            peticiones_por_segundo=self.peticiones_por_segundo,
+            reintentos=self.reintentos,
+            directorio_cache=self.directorio_cache,
+        )
+        async with cliente:
+            print(f"Buscando {len(terminos_busqueda)} términos en paralelo")
+            enlaces_por_termino = await asyncio.gather(
+                *(self._buscar_termino_async(cliente, termino) for termino in terminos_busqueda)
+            )
+            
+            # Cada artículo se descarga una sola vez aunque aparezca en varias búsquedas
+            urls = list(dict.fromkeys(url for enlaces in enlaces_por_termino for url in enlaces))
+            paginas = await asyncio.gather(*(self._descargar_async(cliente, url) for url in urls))
+        self.estadisticas = dict(cliente.estadisticas)
+        
+        # Cada página se analiza una vez; por término solo cambia el tipo de documento
+        analisis = {
+            url: self._analizar_articulo(BeautifulSoup(contenido, PARSER_HTML))
+            for url, contenido in zip(urls, paginas) if contenido is not None
+        }
+        articulos_encontrados = []
+        for termino, enlaces in zip(terminos_busqueda, enlaces_por_termino):
+            for url in enlaces:
+                if analisis.get(url):
+                    articulos_encontrados.append(self._armar_articulo(analisis[url], termino))
+        
+        return self._eliminar_duplicados(articulos_encontrados)
+    
+    async def _buscar_termino_async(self, cliente: ClienteHTTPAsincrono, termino: str) -> List[str]:
+        """Busca un término y devuelve las URLs de los artículos del CPC encontrados."""
+        try:
+            contenido = await cliente.obtener(self.search_url, params=self._parametros_busqueda(termino))
+            return self._enlaces_cpc(BeautifulSoup(contenido, PARSER_HTML))
+        except Exception as e:
+            print(f"Error al buscar '{termino}': {e}")
+            return []
+    
+    async def _descargar_async(self, cliente: ClienteHTTPAsincrono, url: str) -> Optional[bytes]:
+        """Descarga la página de un artículo (None si falla)."""
+        try:
+            return await cliente.obtener(url)
+        except Exception as e:
+            print(f"Error al extraer artículo desde {url}: {e}")
+            return None
+
+
+def obtener_articulos_cpc_automaticamente(asincrono: bool = False, **opciones) -> List[Dict]:
     """
     Función principal para obtener artículos del CPC automáticamente.
     
+    Args:
+        asincrono: Usar ``CPCScraperAsincrono`` en lugar del recorrido secuencial
+        **opciones: Argumentos para el constructor del scraper
+    
     Returns:
         Lista de artículos extraídos
     """
-    scraper = CPCScraper()
-    
-    # Términos de búsqueda para encontrar artículos relevantes
-    terminos_busqueda = [
-        'contestación demanda procedimiento',
-        'réplica procedimiento civil',
-        'dúplica procedimiento',
-        'recurso apelación procedimiento',
-        'recurso casación',
-        'recurso revisión',
-        'recurso queja',
-        'recurso protección',
-        'recurso amparo',
-        'incidente procedimiento civil',
-        'excepción procedimiento',
-        'medida cautelar',
-        'embargo procedimiento'
-    ]
+    scraper = CPCScraperAsincrono(**opciones) if asincrono else CPCScraper(**opciones)
     
     print("Iniciando extracción automática de artículos del CPC...")
-    articulos = scraper.buscar_articulos_cpc(terminos_busqueda)
+    articulos = scraper.buscar_articulos_cpc(TERMINOS_BUSQUEDA)
     
     print(f"Se encontraron {len(articulos)} artículos del CPC")
     return articulos
@@ -0,0 +1,368 @@
+"""
+Ingesta sin conexión del texto completo del Código de Procedimiento Civil.
+
+Toma una exportación del CPC descargada de LeyChile (XML de ``obtxml`` o la
+página HTML del texto completo) y la recorre una sola vez, en streaming:
+
+1. El archivo se lee por bloques y se convierte en párrafos de texto
+   (``iterparse`` para XML, ``HTMLParser`` para HTML); nunca se carga entero.
+2. Los párrafos se dividen en artículos al encontrar un encabezado
+   ("Art. 254.", "Artículo 44 bis.-", "Art. 1°") y se anotan con el libro y
+   título vigentes.
+3. De cada artículo se extraen las cláusulas de plazo en días (en cifras o en
+   palabras: "quince días hábiles") con su tipo de día.
+
+``guardar_articulos`` persiste los artículos en lotes en ``ArticuloCPC`` y
+vincula los ``CodigoProcedimiento`` existentes con su artículo.
+"""
+import hashlib
+import re
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, Optional
+
+TAMANO_BLOQUE_LECTURA = 64 * 1024
+
+TAMANO_LOTE_INGESTA = 500
+
+LARGO_MAXIMO_CLAUSULA = 300
+
+SUFIJOS_ARTICULO = ('bis', 'ter', 'quáter', 'quater', 'quinquies', 'sexies', 'septies', 'octies')
+
+# Orden de los sufijos dentro de un mismo número: 44 < 44 bis < 44 ter ...
+_ORDEN_SUFIJO = {'': 0, 'bis': 1, 'ter': 2, 'quáter': 3, 'quater': 3, 'quinquies': 4, 'sexies': 5, 'septies': 6, 'octies': 7}
+
+# El número de un encabezado va seguido de "°", de ".", "-" o ":" o del fin de la
+# línea; "Art. 258 dispone que..." es una remisión, no un encabezado
+_PATRON_ENCABEZADO_ARTICULO = re.compile(
+    r'^\s*(?:art[íi]culo|art\.)\s*(?P<numero>\d+)\s*(?P<grado>[°º])?\s*(?:(?P<sufijo>%s)\b\s*)?'
+    r'(?P<grado_sufijo>[°º])?\s*(?P<cierre>[.\-–:]+|$)?\s*' % '|'.join(SUFIJOS_ARTICULO),
+    re.IGNORECASE,
+)
+
+_PATRON_DIVISION = re.compile(r'^\s*(LIBRO|T[ÍI]TULO)\s+\S+')
+
+_UNIDADES = {
+    'un': 1, 'uno': 1, 'una': 1, 'dos': 2, 'tres': 3, 'cuatro': 4, 'cinco': 5,
+    'seis': 6, 'siete': 7, 'ocho': 8, 'nueve': 9,
+}
+_ESPECIALES = {
+    'diez': 10, 'once': 11, 'doce': 12, 'trece': 13, 'catorce': 14, 'quince': 15,
+    'dieciséis': 16, 'dieciseis': 16, 'diecisiete': 17, 'dieciocho': 18, 'diecinueve': 19,
+    'veinte': 20, 'veintiún': 21, 'veintiuno': 21, 'veintiuna': 21, 'veintidós': 22, 'veintidos': 22,
+    'veintitrés': 23, 'veintitres': 23, 'veinticuatro': 24, 'veinticinco': 25, 'veintiséis': 26,
+    'veintiseis': 26, 'veintisiete': 27, 'veintiocho': 28, 'veintinueve': 29, 'cien': 100,
+}
+_DECENAS = {'treinta': 30, 'cuarenta': 40, 'cincuenta': 50, 'sesenta': 60, 'setenta': 70, 'ochenta': 80, 'noventa': 90}
+
+_NUMERO_EN_PALABRAS = r'(?:%s)(?:\s+y\s+(?:%s))?|%s|%s' % (
+    '|'.join(_DECENAS), '|'.join(_UNIDADES),
+    '|'.join(sorted(_ESPECIALES, key=len, reverse=True)),
+    '|'.join(sorted(_UNIDADES, key=len, reverse=True)),
+)
+
+# "15 días", "quince días hábiles", "treinta y cinco días corridos"
+_PATRON_PLAZO = re.compile(
+    r'\b(?P<numero>\d+|%s)\s+d[íi]as?\b(?:\s+(?P<calificador>h[áa]biles|[úu]tiles|corridos|naturales))?'
+    % _NUMERO_EN_PALABRAS,
+    re.IGNORECASE,
+)
+
+# Los días que no son hábiles ni útiles se cuentan corridos
+_CALIFICADORES_CORRIDOS = ('corridos', 'naturales')
+
+
+class _ParrafosHTML(HTMLParser):
+    """Convierte HTML en párrafos: cada etiqueta de bloque cierra el párrafo en curso."""
+
+    ETIQUETAS_BLOQUE = {'p', 'div', 'br', 'li', 'tr', 'td', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'pre', 'table'}
+    ETIQUETAS_OMITIDAS = {'script', 'style', 'head', 'title'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parrafos: List[str] = []
+        self._actual: List[str] = []
+        self._omitidas = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.ETIQUETAS_OMITIDAS:
+            self._omitidas += 1
+        elif tag in self.ETIQUETAS_BLOQUE:
+            self._cerrar()
+
+    def handle_endtag(self, tag):
+        if tag in self.ETIQUETAS_OMITIDAS:
+            self._omitidas = max(0, self._omitidas - 1)
+        elif tag in self.ETIQUETAS_BLOQUE:
+            self._cerrar()
+
+    def handle_data(self, data):
+        if not self._omitidas:
+            self._actual.append(data)
+
+    def _cerrar(self):
+        if self._actual:
+            self.parrafos.append(''.join(self._actual))
+            self._actual = []
+
+    def close(self):
+        super().close()
+        self._cerrar()
+
+
+def _parrafos_html(ruta, codificacion: str) -> Iterator[str]:
+    parser = _ParrafosHTML()
+    with open(ruta, encoding=codificacion, errors='replace') as archivo:
+        while True:
+            bloque = archivo.read(TAMANO_BLOQUE_LECTURA)
+            if not bloque:
+                break
+            parser.feed(bloque)
+            yield from parser.parrafos
+            parser.parrafos.clear()
+    parser.close()
+    yield from parser.parrafos
+
+
+def _parrafos_xml(ruta) -> Iterator[str]:
+    """Textos de los elementos ``Texto`` del XML de LeyChile (con o sin espacio de nombres)."""
+    for _, elemento in ET.iterparse(ruta, events=('end',)):
+        if elemento.tag.rsplit('}', 1)[-1] == 'Texto':
+            yield ''.join(elemento.itertext())
+            elemento.clear()
+        elif elemento.tag.rsplit('}', 1)[-1] == 'EstructuraFuncional':
+            elemento.clear()
+
+
+def iterar_parrafos(ruta, formato: Optional[str] = None, codificacion: str = 'utf-8') -> Iterator[str]:
+    """
+    Lee una exportación del CPC como una secuencia de líneas de texto.
+
+    Args:
+        ruta: Archivo descargado
+        formato: 'xml' o 'html'; por defecto según la extensión del archivo
+        codificacion: Codificación del HTML (el XML la declara en su encabezado)
+    """
+    formato = formato or ('xml' if str(ruta).lower().endswith('.xml') else 'html')
+    parrafos = _parrafos_xml(ruta) if formato == 'xml' else _parrafos_html(ruta, codificacion)
+    for parrafo in parrafos:
+        for linea in parrafo.splitlines():
+            linea = ' '.join(linea.split())
+            if linea:
+                yield linea
+
+
+def _numero_palabras(texto: str) -> int:
+    texto = texto.lower()
+    if texto.isdigit():
+        return int(texto)
+    partes = re.split(r'\s+y\s+', texto)
+    if len(partes) == 2:
+        return _DECENAS[partes[0]] + _UNIDADES[partes[1]]
+    return _DECENAS.get(texto) or _ESPECIALES.get(texto) or _UNIDADES[texto]
+
+
+def extraer_clausulas_plazo(texto: str) -> List[Dict]:
+    """
+    Extrae los plazos en días de un artículo.
+
+    Los días sin calificar se consideran hábiles: el art. 66 del CPC suspende
+    los términos de días durante los feriados.
+
+    Returns:
+        Lista de ``{'dias', 'tipo_dia', 'texto'}`` en el orden del artículo
+    """
+    clausulas = []
+    for match in _PATRON_PLAZO.finditer(texto):
+        dias = _numero_palabras(match.group('numero'))
+        if not dias:
+            continue
+        calificador = (match.group('calificador') or '').lower()
+        inicio = texto.rfind('.', 0, match.start()) + 1
+        fin = texto.find('.', match.end())
+        fin = len(texto) if fin == -1 else fin + 1
+        clausulas.append({
+            'dias': dias,
+            'tipo_dia': 'corrido' if calificador in _CALIFICADORES_CORRIDOS else 'habil',
+            'texto': texto[inicio:fin].strip()[:LARGO_MAXIMO_CLAUSULA],
+        })
+    return clausulas
+
+
+def _articulo(numero: int, sufijo: str, libro: str, titulo: str, lineas: List[str]) -> Dict:
+    texto = '\n'.join(lineas)
+    clausulas = extraer_clausulas_plazo(texto)
+    return {
+        'numero': numero,
+        'sufijo': sufijo,
+        'libro': libro[:200],
+        'titulo': titulo[:200],
+        'texto': texto,
+        'dias_plazo': clausulas[0]['dias'] if clausulas else None,
+        'tipo_dia': clausulas[0]['tipo_dia'] if clausulas else '',
+        'clausulas_plazo': clausulas,
+        'huella': hashlib.sha256(texto.encode()).hexdigest(),
+    }
+
+
+def _clave_encabezado(linea: str, anterior: Optional[tuple]):
+    """
+    Clave ``(numero, sufijo)`` y resto de la línea si la línea abre un artículo.
+
+    La línea debe tener la puntuación de un encabezado y una clave mayor que la
+    del último artículo abierto; si no, es una remisión y se devuelve None.
+    """
+    encabezado = _PATRON_ENCABEZADO_ARTICULO.match(linea)
+    if not encabezado or not any(encabezado.group(grupo) is not None for grupo in ('grado', 'grado_sufijo', 'cierre')):
+        return None
+    clave = (int(encabezado.group('numero')), (encabezado.group('sufijo') or '').lower())
+    if anterior is not None and (clave[0], _ORDEN_SUFIJO[clave[1]]) <= (anterior[0], _ORDEN_SUFIJO[anterior[1]]):
+        return None
+    return clave, linea[encabezado.end():]
+
+
+def dividir_articulos(lineas: Iterable[str]) -> Iterator[Dict]:
+    """
+    Agrupa las líneas del código en artículos.
+
+    Una línea que comienza con "Art." o "Artículo", un número (y su sufijo) y la
+    puntuación de un encabezado ("°", ".", "-", ":" o el fin de la línea) abre
+    un artículo nuevo si su número es mayor que el del artículo anterior; si no,
+    es una remisión a otro artículo al inicio de un párrafo ("Art. 258 dispone
+    que...") y queda en el artículo en curso. Las líneas "LIBRO ..." y
+    "TÍTULO ..." (más la línea en mayúsculas que las sigue) cierran el artículo
+    en curso.
+
+    Yields:
+        Dict con los campos de ``ArticuloCPC``
+    """
+    libro = titulo = ''
+    actual = None  # (numero, sufijo, libro, titulo, lineas)
+    ultima_clave = None
+    division = None  # 'libro' o 'titulo' si la línea anterior abrió una división
+
+    for linea in lineas:
+        encabezado = _clave_encabezado(linea, ultima_clave)
+        if encabezado:
+            if actual:
+                yield _articulo(*actual)
+            ultima_clave, resto = encabezado
+            actual = (ultima_clave[0], ultima_clave[1], libro, titulo, [resto] if resto else [])
+            division = None
+            continue
+
+        division_match = _PATRON_DIVISION.match(linea)
+        if division_match:
+            if actual:
+                yield _articulo(*actual)
+                actual = None
+            if division_match.group(1) == 'LIBRO':
+                libro, titulo, division = linea, '', 'libro'
+            else:
+                titulo, division = linea, 'titulo'
+            continue
+
+        if division and linea.isupper() and actual is None:
+            # Nombre de la división en la línea siguiente: "TITULO I" / "DISPOSICIONES COMUNES"
+            if division == 'libro':
+                libro = f'{libro} - {linea}'
+            else:
+                titulo = f'{titulo} - {linea}'
+            division = None
+            continue
+
+        division = None
+        if actual:
+            actual[4].append(linea)
+
+    if actual:
+        yield _articulo(*actual)
+
+
+def iterar_articulos(ruta, formato: Optional[str] = None, codificacion: str = 'utf-8') -> Iterator[Dict]:
+    """Recorre una exportación del CPC y produce sus artículos (ver ``dividir_articulos``)."""
+    return dividir_articulos(iterar_parrafos(ruta, formato, codificacion))
+
+
+_PATRON_ARTICULO_CODIGO = re.compile(r'art(?:[íi]culo|\.)?\s*(\d+)\s*(%s)?\b' % '|'.join(SUFIJOS_ARTICULO), re.IGNORECASE)
+
+
+def clave_articulo_codigo(codigo) -> Optional[tuple]:
+    """
+    Número y sufijo del artículo de un ``CodigoProcedimiento`` ("ART. 254 CPC").
+
+    Returns:
+        Tupla ``(numero, sufijo)`` o None si no se reconoce el artículo
+    """
+    for texto in (codigo.articulo_cpc, codigo.codigo):
+        match = _PATRON_ARTICULO_CODIGO.search(texto or '')
+        if match:
+            return int(match.group(1)), (match.group(2) or '').lower()
+    return None
+
+
+def guardar_articulos(articulos: Iterable[Dict], tamano_lote: int = TAMANO_LOTE_INGESTA) -> Dict[str, int]:
+    """
+    Guarda los artículos en ``ArticuloCPC`` en lotes y vincula los códigos de procedimiento.
+
+    Los artículos cuyo texto no cambió (misma huella) no se escriben.
+
+    Args:
+        articulos: Iterable de dicts de ``dividir_articulos`` (se consume en streaming)
+        tamano_lote: Filas por INSERT
+
+    Returns:
+        Dict con 'creados', 'actualizados', 'sin_cambios', 'clausulas' y 'codigos_vinculados'
+    """
+    from django.db import transaction
+    from plazos.models import ArticuloCPC, CodigoProcedimiento
+
+    existentes = {
+        (numero, sufijo): huella
+        for numero, sufijo, huella in ArticuloCPC.objects.values_list('numero', 'sufijo', 'huella')
+    }
+    campos_actualizables = [
+        'libro', 'titulo', 'texto', 'dias_plazo', 'tipo_dia', 'clausulas_plazo', 'huella', 'updated_at',
+    ]
+    resumen = {'creados': 0, 'actualizados': 0, 'sin_cambios': 0, 'clausulas': 0, 'codigos_vinculados': 0}
+
+    def escribir(lote):
+        ArticuloCPC.objects.bulk_create(
+            lote,
+            update_conflicts=True,
+            unique_fields=['numero', 'sufijo'],
+            update_fields=campos_actualizables,
+        )
+
+    with transaction.atomic():
+        lote = []
+        for datos in articulos:
+            resumen['clausulas'] += len(datos['clausulas_plazo'])
+            clave = (datos['numero'], datos['sufijo'])
+            huella = existentes.get(clave)
+            if huella == datos['huella']:
+                resumen['sin_cambios'] += 1
+                continue
+            resumen['actualizados' if huella else 'creados'] += 1
+            lote.append(ArticuloCPC(**datos))
+            if len(lote) >= tamano_lote:
+                escribir(lote)
+                lote = []
+        if lote:
+            escribir(lote)
+
+        # Vincular cada código de procedimiento con su artículo
+        ids = {
+            (numero, sufijo): id_
+            for id_, numero, sufijo in ArticuloCPC.objects.values_list('id', 'numero', 'sufijo')
+        }
+        codigos = []
+        for codigo in CodigoProcedimiento.objects.only('id', 'codigo', 'articulo_cpc', 'articulo_id'):
+            articulo_id = ids.get(clave_articulo_codigo(codigo))
+            if articulo_id and articulo_id != codigo.articulo_id:
+                codigo.articulo_id = articulo_id
+                codigos.append(codigo)
+        CodigoProcedimiento.objects.bulk_update(codigos, ['articulo'], batch_size=tamano_lote)
+        resumen['codigos_vinculados'] = len(codigos)
+
+    return resumen
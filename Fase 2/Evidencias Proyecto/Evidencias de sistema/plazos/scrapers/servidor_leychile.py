@@ -0,0 +1,155 @@
+"""
+Servidor HTTP local que imita LeyChile con páginas grabadas, para probar y
+medir los scrapers sin salir a internet.
+
+Sirve ``/Consulta/buscar?q=...`` desde ``fixtures_leychile/busqueda/<término>.html``
+(o una página sin resultados) y ``/Navegar?idNorma=...&idParte=...`` desde
+``fixtures_leychile/normas/<idParte>.html``. Responde con ``ETag`` y
+``Last-Modified`` y devuelve 304 a los GET condicionales. Puede simular
+latencia de red y errores 503 periódicos.
+
+Uso::
+
+    with ServidorLeyChile(latencia=0.2) as servidor:
+        CPCScraperAsincrono(base_url=servidor.url).buscar_articulos_cpc(TERMINOS_BUSQUEDA)
+"""
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+DIRECTORIO_FIXTURES = Path(__file__).resolve().parent / 'fixtures_leychile'
+
+
+def slug_termino(termino: str) -> str:
+    """Nombre de archivo de la búsqueda de un término ("réplica civil" -> "replica-civil")."""
+    ascii_ = unicodedata.normalize('NFKD', termino).encode('ascii', 'ignore').decode()
+    return re.sub(r'[^a-z0-9]+', '-', ascii_.lower()).strip('-')
+
+
+class _ManejadorLeyChile(BaseHTTPRequestHandler):
+    servidor_leychile = None  # ServidorLeyChile, asignado por la subclase de cada instancia
+
+    def log_message(self, formato, *args):
+        pass
+
+    def do_GET(self):
+        servidor = self.servidor_leychile
+        numero = servidor._contar_peticion()
+        if servidor.latencia:
+            time.sleep(servidor.latencia)
+        if servidor.error_cada and numero % servidor.error_cada == 0:
+            self.send_response(503)
+            self.send_header('Retry-After', '0')
+            self.end_headers()
+            return
+
+        ruta = servidor.archivo_para(self.path)
+        if ruta is None:
+            self.send_error(404)
+            return
+
+        contenido = ruta.read_bytes()
+        etag = '"%s"' % hashlib.sha1(contenido).hexdigest()[:16]
+        modificado = ruta.stat().st_mtime
+        if self._no_modificado(etag, modificado):
+            servidor._contar_304()
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(contenido)))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', formatdate(modificado, usegmt=True))
+        self.end_headers()
+        self.wfile.write(contenido)
+
+    def _no_modificado(self, etag: str, modificado: float) -> bool:
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag in [valor.strip() for valor in if_none_match.split(',')]
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return int(modificado) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+
+class ServidorLeyChile:
+    """
+    Servidor local con las páginas grabadas de LeyChile.
+
+    Attributes:
+        url: URL base del servidor (una vez iniciado)
+        peticiones: Peticiones recibidas
+        no_modificadas: Respuestas 304 enviadas
+    """
+
+    def __init__(self, directorio=DIRECTORIO_FIXTURES, latencia: float = 0.0, error_cada: int = 0):
+        self.directorio = Path(directorio)
+        self.latencia = latencia
+        self.error_cada = error_cada
+        self.peticiones = 0
+        self.no_modificadas = 0
+        self.url = None
+        self._candado = threading.Lock()
+        self._servidor = None
+        self._hilo = None
+
+    def archivo_para(self, ruta_peticion: str):
+        """Archivo grabado que responde a una ruta, o None (404)."""
+        partes = urlsplit(ruta_peticion)
+        parametros = parse_qs(partes.query)
+        if partes.path == '/Consulta/buscar':
+            ruta = self.directorio / 'busqueda' / f"{slug_termino(parametros.get('q', [''])[0])}.html"
+            return ruta if ruta.exists() else self.directorio / 'busqueda' / '_sin_resultados.html'
+        if partes.path == '/Navegar':
+            id_parte = parametros.get('idParte', [''])[0]
+            ruta = self.directorio / 'normas' / f'{id_parte}.html'
+            if id_parte.isdigit() and ruta.exists():
+                return ruta
+        return None
+
+    def _contar_peticion(self) -> int:
+        with self._candado:
+            self.peticiones += 1
+            return self.peticiones
+
+    def _contar_304(self) -> None:
+        with self._candado:
+            self.no_modificadas += 1
+
+    def reiniciar_contadores(self) -> None:
+        with self._candado:
+            self.peticiones = 0
+            self.no_modificadas = 0
+
+    def iniciar(self) -> 'ServidorLeyChile':
+        manejador = type('Manejador', (_ManejadorLeyChile,), {'servidor_leychile': self})
+        self._servidor = ThreadingHTTPServer(('127.0.0.1', 0), manejador)
+        self._servidor.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self._servidor.server_address[1]}'
+        self._hilo = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._hilo.start()
+        return self
+
+    def detener(self) -> None:
+        self._servidor.shutdown()
+        self._servidor.server_close()
+        self._hilo.join()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.detener()
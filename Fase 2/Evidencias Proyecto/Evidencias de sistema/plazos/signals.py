@@ -0,0 +1,40 @@
+"""
+Señales de la aplicación de plazos.
+"""
+from django.db import connections
+from django.db.models.signals import post_save, post_delete, post_migrate
+from django.dispatch import receiver
+
+from .models import FeriadoJudicial, PlazoJudicial
+from .utils.feriados import invalidar_cache_feriados
+from .utils.cache_dashboard import invalidar_dashboard_usuario
+from .utils.cache_resultados import invalidar_resultados_usuario
+from .utils.busqueda import asegurar_triggers_fts
+
+
+@receiver(post_save, sender=FeriadoJudicial)
+@receiver(post_delete, sender=FeriadoJudicial)
+def feriado_judicial_modificado(sender, **kwargs):
+    """
+    Invalida el caché de feriados cuando se crea, edita o elimina un cierre.
+    """
+    invalidar_cache_feriados()
+
+
+@receiver(post_save, sender=PlazoJudicial)
+@receiver(post_delete, sender=PlazoJudicial)
+def plazo_judicial_modificado(sender, instance, **kwargs):
+    """
+    Invalida el caché del dashboard y de resultados del dueño del plazo.
+    """
+    invalidar_dashboard_usuario(instance.usuario_id)
+    invalidar_resultados_usuario(instance.usuario_id)
+
+
+@receiver(post_migrate)
+def plazos_migrados(sender, using='default', **kwargs):
+    """
+    Recrea los triggers del índice de búsqueda si una migración reconstruyó la tabla.
+    """
+    if sender.name == 'plazos':
+        asegurar_triggers_fts(connections[using])
@@ -11,8 +11,16 @@ urlpatterns = [
     path('plazo/<int:plazo_id>/eliminar/', views.eliminar_plazo, name='eliminar_plazo'),
     path('exportar/pdf/', views.exportar_pdf_view, name='exportar_pdf'),
     path('exportar/ics/', views.exportar_ics_view, name='exportar_ics'),
-    path('api/actualizar-estados/', views.actualizar_estados, name='actualizar_estados'),
+    path('exportar/excel/', views.exportar_excel_view, name='exportar_excel'),
+    path('exportar/csv/', views.exportar_csv_view, name='exportar_csv'),
+    path('exportar/trabajos/<int:trabajo_id>/descargar/', views.descargar_exportacion, name='descargar_exportacion'),
+    path('api/exportaciones/<str:formato>/', views.encolar_exportacion_api, name='encolar_exportacion'),
+    path('api/exportaciones/trabajo/<int:trabajo_id>/', views.estado_exportacion, name='estado_exportacion'),
+    path('calendario/feed/<str:token>.ics', views.feed_ics, name='feed_ics'),
+    path('api/suscripcion-ics/', views.suscripcion_ics, name='suscripcion_ics'),
     path('api/plazos-json/', views.obtener_plazos_json, name='plazos_json'),
+    path('api/buscar/', views.buscar_plazos_api, name='buscar_plazos_api'),
+    path('api/metricas-cache/', views.metricas_cache_dashboard, name='metricas_cache_dashboard'),
     path('api/codigos-procedimiento/', views.api_codigos_procedimiento, name='api_codigos_procedimiento'),
     
     # URLs para gestión de códigos CPC
@@ -3,6 +3,8 @@ from .plazos import (
     es_dia_habil,
     obtener_feriados_chile,
     calcular_dias_habiles_entre_fechas,
+    calcular_fechas_vencimiento_lote,
+    calcular_dias_habiles_entre_fechas_lote,
     obtener_proximo_dia_habil,
     es_fecha_vencimiento_valida,
     obtener_estado_plazo,
@@ -14,12 +16,15 @@ from .plazos import (
     formatear_rut_chileno,
     es_rut_valido_para_causa
 )
+from .dias_habiles import CalendarioHabil, obtener_calendario_habil
 
 __all__ = [
     'calcular_fecha_vencimiento',
     'es_dia_habil',
     'obtener_feriados_chile',
     'calcular_dias_habiles_entre_fechas',
+    'calcular_fechas_vencimiento_lote',
+    'calcular_dias_habiles_entre_fechas_lote',
     'obtener_proximo_dia_habil',
     'es_fecha_vencimiento_valida',
     'obtener_estado_plazo',
@@ -29,5 +34,7 @@ __all__ = [
     'validar_rut_chileno',
     'calcular_digito_verificador',
     'formatear_rut_chileno',
-    'es_rut_valido_para_causa'
+    'es_rut_valido_para_causa',
+    'CalendarioHabil',
+    'obtener_calendario_habil'
 ]
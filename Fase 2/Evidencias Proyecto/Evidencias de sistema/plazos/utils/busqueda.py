@@ -0,0 +1,259 @@
+"""
+Búsqueda de texto completo sobre los plazos de un usuario.
+
+Los campos buscables (``rol`` y ``observaciones``) se indexan según el motor:
+
+- PostgreSQL: índice GIN sobre ``to_tsvector('spanish', ...)`` para palabras
+  (con prefijos) y un índice GIN de trigramas sobre ``UPPER(rol)`` para
+  coincidencias parciales del rol.
+- SQLite: tabla virtual FTS5 ``plazos_plazojudicial_fts`` mantenida con triggers;
+  incluye ``usuario_id`` como columna para filtrar dentro del índice.
+
+Los índices se crean en la migración ``0014_indice_busqueda_plazos``. En otros
+motores se usa ``icontains``. ``clave_cliente`` se guarda cifrado: se busca
+por igualdad o prefijo con su índice ciego (ver ``indice_ciego``) y esas
+coincidencias van primero, seguidas de los roles idénticos a la consulta y
+luego del resto por relevancia.
+"""
+
+import re
+from typing import List, Optional
+
+from django.db import connection
+
+from .indice_ciego import filtro_clave_cliente
+
+LIMITE_RESULTADOS = 20
+
+LONGITUD_MINIMA = 2
+
+CONFIGURACION_TEXTO = 'spanish'
+
+TABLA_FTS = 'plazos_plazojudicial_fts'
+
+# Expresión indexada en PostgreSQL: debe coincidir exactamente con la del índice
+VECTOR_POSTGRES = (
+    f"to_tsvector('{CONFIGURACION_TEXTO}', "
+    "coalesce(rol, '') || ' ' || coalesce(observaciones, ''))"
+)
+
+# SQLite elimina los triggers al reconstruir la tabla (p. ej. en AddField);
+# se recrean tras cada migrate (ver plazos.signals)
+TRIGGERS_SQLITE = {
+    f'{TABLA_FTS}_ai': f"""
+        CREATE TRIGGER {TABLA_FTS}_ai AFTER INSERT ON plazos_plazojudicial BEGIN
+            INSERT INTO {TABLA_FTS}(rowid, usuario_id, rol, observaciones)
+            VALUES (new.id, new.usuario_id, new.rol, new.observaciones);
+        END""",
+    f'{TABLA_FTS}_ad': f"""
+        CREATE TRIGGER {TABLA_FTS}_ad AFTER DELETE ON plazos_plazojudicial BEGIN
+            INSERT INTO {TABLA_FTS}({TABLA_FTS}, rowid, usuario_id, rol, observaciones)
+            VALUES ('delete', old.id, old.usuario_id, old.rol, old.observaciones);
+        END""",
+    f'{TABLA_FTS}_au': f"""
+        CREATE TRIGGER {TABLA_FTS}_au
+        AFTER UPDATE OF usuario_id, rol, observaciones ON plazos_plazojudicial BEGIN
+            INSERT INTO {TABLA_FTS}({TABLA_FTS}, rowid, usuario_id, rol, observaciones)
+            VALUES ('delete', old.id, old.usuario_id, old.rol, old.observaciones);
+            INSERT INTO {TABLA_FTS}(rowid, usuario_id, rol, observaciones)
+            VALUES (new.id, new.usuario_id, new.rol, new.observaciones);
+        END""",
+}
+
+_PALABRA = re.compile(r'\w+', re.UNICODE)
+
+
+def _terminos(consulta: str) -> List[str]:
+    """
+    Separa la consulta en palabras, descartando operadores y símbolos.
+
+    Las palabras de una letra se descartan si hay otras (como prefijo
+    coinciden con casi todo el índice).
+    """
+    terminos = _PALABRA.findall(consulta.lower())
+    largos = [termino for termino in terminos if len(termino) > 1]
+    return largos or terminos
+
+
+def _buscar_ids_postgres(usuario_id: int, consulta: str, terminos: List[str], limite: int):
+    """Ids ordenados por relevancia usando tsvector y trigramas."""
+    consulta_ts = ' & '.join(f'{termino}:*' for termino in terminos)
+    patron = consulta.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT id
+            FROM plazos_plazojudicial, to_tsquery(%s, %s) AS consulta
+            WHERE usuario_id = %s
+              AND ({VECTOR_POSTGRES} @@ consulta OR UPPER(rol) LIKE UPPER(%s))
+            ORDER BY ts_rank({VECTOR_POSTGRES}, consulta) DESC, id
+            LIMIT %s
+            """,
+            [CONFIGURACION_TEXTO, consulta_ts, usuario_id, f'%{patron}%', limite],
+        )
+        return [fila[0] for fila in cursor.fetchall()]
+
+
+def _buscar_ids_sqlite(usuario_id: int, terminos: List[str], limite: int):
+    """Ids ordenados por relevancia (bm25) usando la tabla FTS5."""
+    consulta_fts = f'usuario_id:"{usuario_id}" AND ' + ' '.join(
+        f'"{termino}"*' for termino in terminos
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT rowid FROM {TABLA_FTS}
+            WHERE {TABLA_FTS} MATCH %s
+            ORDER BY bm25({TABLA_FTS}, 0.0, 2.0, 1.0), rowid
+            LIMIT %s
+            """,
+            [consulta_fts, limite],
+        )
+        return [fila[0] for fila in cursor.fetchall()]
+
+
+def _ids_rol_exacto(usuario_id: int, consulta: str, limite: int):
+    """
+    Ids de los plazos cuyo rol es la consulta (sin distinguir mayúsculas).
+
+    Se buscan aparte del ranking para que no dependan de él. En PostgreSQL la
+    igualdad usa el índice de trigramas de ``UPPER(rol)``; en SQLite los
+    candidatos salen de la frase en la columna ``rol`` del índice FTS5.
+    """
+    from plazos.models import PlazoJudicial
+
+    if connection.vendor == 'sqlite':
+        frase = ' '.join(_PALABRA.findall(consulta.lower()))
+        if not frase:
+            return []
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT plazo.id
+                FROM {TABLA_FTS} JOIN plazos_plazojudicial AS plazo ON plazo.id = {TABLA_FTS}.rowid
+                WHERE {TABLA_FTS} MATCH %s AND UPPER(plazo.rol) = UPPER(%s)
+                ORDER BY plazo.fecha_vencimiento, plazo.id
+                LIMIT %s
+                """,
+                [f'usuario_id:"{usuario_id}" AND rol:"{frase}"', consulta, limite],
+            )
+            return [fila[0] for fila in cursor.fetchall()]
+
+    return list(
+        PlazoJudicial.objects
+        .filter(usuario_id=usuario_id, rol__iexact=consulta)
+        .order_by('fecha_vencimiento', 'id')
+        .values_list('id', flat=True)[:limite]
+    )
+
+
+def _buscar_ids_generico(usuario_id: int, consulta: str, limite: int):
+    """Ids sin índice de texto: ``icontains`` sobre los campos buscables."""
+    from django.db.models import Q
+    from plazos.models import PlazoJudicial
+
+    return list(
+        PlazoJudicial.objects
+        .filter(usuario_id=usuario_id)
+        .filter(Q(rol__icontains=consulta) | Q(observaciones__icontains=consulta))
+        .order_by('fecha_vencimiento', 'id')
+        .values_list('id', flat=True)[:limite]
+    )
+
+
+def asegurar_triggers_fts(conexion=None) -> bool:
+    """
+    Recrea los triggers de la tabla FTS5 si faltan y reconstruye el índice.
+
+    Args:
+        conexion: Conexión de base de datos (por defecto la principal)
+
+    Returns:
+        True si hubo que recrear triggers
+    """
+    conexion = conexion or connection
+    if conexion.vendor != 'sqlite':
+        return False
+
+    with conexion.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = %s", [TABLA_FTS]
+        )
+        if not cursor.fetchone():
+            return False
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        existentes = {fila[0] for fila in cursor.fetchall()}
+        faltantes = [nombre for nombre in TRIGGERS_SQLITE if nombre not in existentes]
+        for nombre in faltantes:
+            cursor.execute(TRIGGERS_SQLITE[nombre])
+        if faltantes:
+            cursor.execute(f"INSERT INTO {TABLA_FTS}({TABLA_FTS}) VALUES ('rebuild')")
+    return bool(faltantes)
+
+
+def buscar_ids_plazos(usuario_id: int, consulta: str, limite: int = LIMITE_RESULTADOS) -> List[int]:
+    """
+    Busca plazos de un usuario por texto y devuelve sus ids por relevancia.
+
+    Args:
+        usuario_id: Id del usuario dueño de los plazos
+        consulta: Texto ingresado por el usuario
+        limite: Cantidad máxima de resultados
+
+    Returns:
+        Lista de ids de PlazoJudicial, del más al menos relevante
+    """
+    consulta = (consulta or '').strip()
+    terminos = _terminos(consulta)
+    if len(consulta) < LONGITUD_MINIMA or not terminos:
+        return []
+
+    from plazos.models import PlazoJudicial
+
+    ids = list(
+        PlazoJudicial.objects
+        .filter(filtro_clave_cliente(consulta), usuario_id=usuario_id)
+        .order_by('fecha_vencimiento', 'id')
+        .values_list('id', flat=True)[:limite]
+    )
+
+    if connection.vendor == 'postgresql':
+        ids_texto = _buscar_ids_postgres(usuario_id, consulta, terminos, limite)
+    elif connection.vendor == 'sqlite':
+        ids_texto = _buscar_ids_sqlite(usuario_id, terminos, limite)
+    else:
+        ids_texto = _buscar_ids_generico(usuario_id, consulta, limite)
+
+    encontrados = set(ids)
+    for plazo_id in _ids_rol_exacto(usuario_id, consulta, limite) + ids_texto:
+        if plazo_id not in encontrados:
+            encontrados.add(plazo_id)
+            ids.append(plazo_id)
+    return ids[:limite]
+
+
+def buscar_plazos(usuario, consulta: str, limite: int = LIMITE_RESULTADOS,
+                  campos: Optional[List[str]] = None):
+    """
+    Busca plazos de un usuario por texto y devuelve las instancias por relevancia.
+
+    Args:
+        usuario: Usuario dueño de los plazos
+        consulta: Texto ingresado por el usuario
+        limite: Cantidad máxima de resultados
+        campos: Campos a cargar con ``only()`` (por defecto todos)
+
+    Returns:
+        Lista de PlazoJudicial, del más al menos relevante
+    """
+    from plazos.models import PlazoJudicial
+
+    ids = buscar_ids_plazos(usuario.pk, consulta, limite)
+    if not ids:
+        return []
+
+    plazos = PlazoJudicial.objects.filter(usuario=usuario, id__in=ids)
+    if campos:
+        plazos = plazos.only(*campos)
+    por_id = {plazo.id: plazo for plazo in plazos}
+    return [por_id[plazo_id] for plazo_id in ids if plazo_id in por_id]
@@ -0,0 +1,166 @@
+"""
+Caché por usuario de los fragmentos del dashboard.
+
+Cada fragmento (estadísticas, listados de plazos recientes y próximos, conteo
+de resultados del calendario por filtro) se guarda
+bajo una clave que incluye:
+
+- el id del usuario y su contador de generación, que se incrementa al guardar
+  o eliminar uno de sus plazos (ver ``plazos.signals``);
+- un contador de generación global, que se incrementa tras las escrituras
+  masivas que no disparan señales (transiciones de estado, recálculos);
+- la fecha de Santiago, para que todo expire al cambiar el día.
+
+Invalidar nunca borra claves: basta con cambiar un contador. Los contadores
+los incrementan también otros procesos (``procesar_estados``,
+``recalcular_vencimientos``), por lo que el caché debe ser compartido (Redis
+con ``REDIS_URL``, Memcached o base de datos). Con un backend local del
+proceso (memoria local, el predeterminado sin ``REDIS_URL``) los fragmentos
+no se cachean: se calculan en cada petición (ver ``cache_compartido``).
+Los aciertos y fallos se cuentan en el mismo caché y se consultan con
+``obtener_metricas_dashboard``.
+"""
+
+from typing import Any, Callable, Dict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .estados import fecha_hoy_tribunales
+
+DURACION_CACHE_DASHBOARD = 600  # segundos
+
+FRAGMENTOS_DASHBOARD = ['estadisticas', 'listados', 'conteo_calendario']
+
+_PREFIJO = 'plazos:dashboard'
+CLAVE_GENERACION_GLOBAL = f'{_PREFIJO}:generacion'
+
+# Backends cuyo contenido solo ve el proceso que lo escribió
+BACKENDS_DEL_PROCESO = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def cache_compartido() -> bool:
+    """
+    Indica si el caché por defecto lo comparten todos los procesos.
+
+    Si no lo comparten, una invalidación hecha por otro proceso no llega al
+    proceso web y los fragmentos cacheados quedarían obsoletos.
+    """
+    return settings.CACHES['default']['BACKEND'] not in BACKENDS_DEL_PROCESO
+
+
+def _clave_generacion_usuario(usuario_id: int) -> str:
+    """Clave del contador de generación de un usuario."""
+    return f'{_PREFIJO}:generacion:{usuario_id}'
+
+
+def _clave_metrica(fragmento: str, tipo: str) -> str:
+    """Clave del contador de aciertos o fallos de un fragmento."""
+    return f'{_PREFIJO}:metricas:{fragmento}:{tipo}'
+
+
+def _incrementar(clave: str) -> None:
+    """Incrementa un contador del caché, creándolo si no existe."""
+    cache.add(clave, 0, timeout=None)
+    try:
+        cache.incr(clave)
+    except ValueError:
+        # La clave fue desalojada entre add() e incr()
+        cache.set(clave, 1, timeout=None)
+
+
+def version_cache_usuario(usuario_id: int) -> str:
+    """
+    Versión de los datos cacheados de un usuario: generación global, del usuario y fecha.
+
+    Cambia con cualquier escritura de sus plazos, con las escrituras masivas y
+    al cambiar el día; sirve para construir claves que nunca quedan obsoletas.
+
+    Args:
+        usuario_id: Id del usuario
+    """
+    clave_usuario = _clave_generacion_usuario(usuario_id)
+    generaciones = cache.get_many([CLAVE_GENERACION_GLOBAL, clave_usuario])
+    return (
+        f'{generaciones.get(CLAVE_GENERACION_GLOBAL, 0)}'
+        f':{generaciones.get(clave_usuario, 0)}'
+        f':{fecha_hoy_tribunales().isoformat()}'
+    )
+
+
+def obtener_fragmento(usuario_id: int, fragmento: str, calcular: Callable[[], Any],
+                      variante: str = '') -> Any:
+    """
+    Obtiene un fragmento del dashboard desde el caché o lo calcula.
+
+    Args:
+        usuario_id: Id del usuario
+        fragmento: Nombre del fragmento (ver FRAGMENTOS_DASHBOARD)
+        calcular: Función sin argumentos que produce el valor si no está en caché
+        variante: Distingue valores del mismo fragmento (ej: filtros aplicados);
+            las métricas se cuentan por fragmento
+
+    Returns:
+        Valor del fragmento (calculado siempre si el caché no es compartido)
+    """
+    if not cache_compartido():
+        return calcular()
+
+    clave = f'{_PREFIJO}:{usuario_id}:{fragmento}:{variante}:{version_cache_usuario(usuario_id)}'
+
+    valor = cache.get(clave)
+    if valor is not None:
+        _incrementar(_clave_metrica(fragmento, 'aciertos'))
+        return valor
+
+    _incrementar(_clave_metrica(fragmento, 'fallos'))
+    valor = calcular()
+    cache.set(clave, valor, DURACION_CACHE_DASHBOARD)
+    return valor
+
+
+def invalidar_dashboard_usuario(usuario_id: int) -> None:
+    """
+    Invalida todos los fragmentos del dashboard de un usuario.
+
+    Args:
+        usuario_id: Id del usuario
+    """
+    _incrementar(_clave_generacion_usuario(usuario_id))
+
+
+def invalidar_dashboard_global() -> None:
+    """
+    Invalida los fragmentos del dashboard de todos los usuarios.
+    """
+    _incrementar(CLAVE_GENERACION_GLOBAL)
+
+
+def obtener_metricas_dashboard() -> Dict[str, Dict[str, Any]]:
+    """
+    Obtiene los aciertos y fallos del caché del dashboard por fragmento.
+
+    Returns:
+        Dict con aciertos, fallos y tasa de aciertos de cada fragmento
+    """
+    claves = [
+        _clave_metrica(fragmento, tipo)
+        for fragmento in FRAGMENTOS_DASHBOARD
+        for tipo in ('aciertos', 'fallos')
+    ]
+    valores = cache.get_many(claves)
+
+    metricas = {}
+    for fragmento in FRAGMENTOS_DASHBOARD:
+        aciertos = valores.get(_clave_metrica(fragmento, 'aciertos'), 0)
+        fallos = valores.get(_clave_metrica(fragmento, 'fallos'), 0)
+        total = aciertos + fallos
+        metricas[fragmento] = {
+            'aciertos': aciertos,
+            'fallos': fallos,
+            'tasa_aciertos': round(aciertos / total, 4) if total else None,
+        }
+    return metricas
@@ -0,0 +1,227 @@
+"""
+Caché de corta duración de los ids ordenados de un filtro del calendario.
+
+La primera página de un filtro guarda la lista de ids de sus resultados, en el
+orden del listado, bajo la clave canónica del filtro (``FiltroCompilado.clave_orden``).
+Las páginas siguientes y las exportaciones con el mismo filtro se leen con
+``id__in`` sobre un tramo de esa lista en lugar de volver a evaluar los filtros.
+
+- Tamaño: se guardan como máximo ``MAX_IDS_RESULTADOS`` ids. Si el filtro
+  tiene más solo se guarda ese prefijo (marcado como incompleto): sirve para
+  paginar, pero no para contar ni exportar.
+- Dos niveles: un LRU en memoria del proceso, limitado por
+  ``PRESUPUESTO_BYTES_RESULTADOS``, delante del caché de Django, que comparten
+  los procesos web y el de exportaciones.
+- Invalidación: la clave incluye la versión del usuario de
+  ``cache_dashboard``, que cambia con cualquier escritura de sus plazos, con
+  las escrituras masivas y al cambiar el día. Además ``plazos.signals`` descarta
+  de inmediato las entradas locales del usuario. Como esa versión la cambian
+  también otros procesos, sin un caché compartido (``cache_compartido``) no se
+  guarda nada y cada consulta evalúa los filtros.
+"""
+
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Optional
+
+from django.core.cache import cache
+
+from .cache_dashboard import cache_compartido, version_cache_usuario
+from .filtros import PROYECCIONES, ordenar_plazos
+
+DURACION_CACHE_RESULTADOS = 120  # segundos
+
+# Con este máximo la lista cabe en un solo ``id__in`` (SQLite admite 32766 parámetros)
+MAX_IDS_RESULTADOS = 20000
+
+PRESUPUESTO_BYTES_RESULTADOS = 16 * 1024 * 1024
+
+# Costo fijo aproximado de cada entrada del LRU (tupla, clave y objeto)
+_BYTES_POR_ENTRADA = 256
+
+_PREFIJO = 'plazos:resultados'
+
+
+class ResultadoCacheado:
+    """
+    Ids ordenados de los resultados de un filtro.
+
+    Attributes:
+        ids: ``array`` de enteros en el orden del listado
+        completo: False si el filtro tiene más resultados que los guardados
+    """
+
+    __slots__ = ('ids', 'completo', 'expira')
+
+    def __init__(self, ids: array, completo: bool, expira: float):
+        self.ids = ids
+        self.completo = completo
+        self.expira = expira
+
+    @property
+    def total(self) -> Optional[int]:
+        """Cantidad de resultados, o None si la lista está truncada."""
+        return len(self.ids) if self.completo else None
+
+    @property
+    def bytes(self) -> int:
+        return self.ids.itemsize * len(self.ids) + _BYTES_POR_ENTRADA
+
+
+class _CacheLRU:
+    """LRU en memoria acotado por la suma de bytes de sus entradas."""
+
+    def __init__(self, presupuesto: int):
+        self.presupuesto = presupuesto
+        self.ocupado = 0
+        self._entradas: 'OrderedDict[tuple, ResultadoCacheado]' = OrderedDict()
+        self._candado = threading.Lock()
+
+    def obtener(self, clave: tuple) -> Optional[ResultadoCacheado]:
+        with self._candado:
+            resultado = self._entradas.get(clave)
+            if resultado is None:
+                return None
+            if resultado.expira <= time.monotonic():
+                self._quitar(clave)
+                return None
+            self._entradas.move_to_end(clave)
+            return resultado
+
+    def guardar(self, clave: tuple, resultado: ResultadoCacheado) -> None:
+        if resultado.bytes > self.presupuesto:
+            return
+        with self._candado:
+            if clave in self._entradas:
+                self._quitar(clave)
+            self._entradas[clave] = resultado
+            self.ocupado += resultado.bytes
+            while self.ocupado > self.presupuesto:
+                self._quitar(next(iter(self._entradas)))
+
+    def descartar_usuario(self, usuario_id: int) -> None:
+        with self._candado:
+            for clave in [clave for clave in self._entradas if clave[0] == usuario_id]:
+                self._quitar(clave)
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def _quitar(self, clave: tuple) -> None:
+        self.ocupado -= self._entradas.pop(clave).bytes
+
+
+_lru = _CacheLRU(PRESUPUESTO_BYTES_RESULTADOS)
+
+
+def _clave(usuario_id: int, filtro) -> tuple:
+    return (usuario_id, filtro.clave_orden, version_cache_usuario(usuario_id))
+
+
+def _clave_compartida(clave: tuple) -> str:
+    return f'{_PREFIJO}:{clave[0]}:{clave[1]}:{clave[2]}'
+
+
+def _buscar(clave: tuple) -> Optional[ResultadoCacheado]:
+    """Busca en el LRU local y luego en el caché compartido."""
+    resultado = _lru.obtener(clave)
+    if resultado is not None:
+        return resultado
+
+    guardado = cache.get(_clave_compartida(clave))
+    if guardado is None:
+        return None
+    completo, crudo = guardado
+    ids = array('q')
+    ids.frombytes(crudo)
+    resultado = ResultadoCacheado(ids, completo, time.monotonic() + DURACION_CACHE_RESULTADOS)
+    _lru.guardar(clave, resultado)
+    return resultado
+
+
+def buscar_ids(usuario_id: int, filtro) -> Optional[ResultadoCacheado]:
+    """
+    Obtiene los ids cacheados de un filtro sin consultar la base de datos.
+
+    Args:
+        usuario_id: Dueño de los plazos
+        filtro: FiltroCompilado
+
+    Returns:
+        ResultadoCacheado, o None si el filtro no está en caché
+    """
+    if filtro.vacio or not cache_compartido():
+        return None
+    return _buscar(_clave(usuario_id, filtro))
+
+
+def consulta_ids(usuario_id: int, filtro):
+    """QuerySet de los ids ordenados de un filtro (hasta uno más que ``MAX_IDS_RESULTADOS``)."""
+    return filtro.queryset(usuario_id).values_list('id', flat=True)[:MAX_IDS_RESULTADOS + 1]
+
+
+def obtener_ids(usuario_id: int, filtro) -> ResultadoCacheado:
+    """
+    Obtiene los ids ordenados de un filtro desde el caché o la base de datos.
+
+    Args:
+        usuario_id: Dueño de los plazos
+        filtro: FiltroCompilado
+
+    Returns:
+        ResultadoCacheado (truncado a ``MAX_IDS_RESULTADOS`` ids)
+    """
+    if filtro.vacio:
+        return ResultadoCacheado(array('q'), True, 0)
+
+    compartido = cache_compartido()
+    if compartido:
+        clave = _clave(usuario_id, filtro)
+        resultado = _buscar(clave)
+        if resultado is not None:
+            return resultado
+
+    ids = array('q', consulta_ids(usuario_id, filtro))
+    completo = len(ids) <= MAX_IDS_RESULTADOS
+    del ids[MAX_IDS_RESULTADOS:]
+
+    resultado = ResultadoCacheado(ids, completo, time.monotonic() + DURACION_CACHE_RESULTADOS)
+    if compartido:
+        _lru.guardar(clave, resultado)
+        cache.set(_clave_compartida(clave), (completo, ids.tobytes()), DURACION_CACHE_RESULTADOS)
+    return resultado
+
+
+def plazos_filtrados(usuario_id: int, filtro, consumidor: Optional[str] = None):
+    """
+    QuerySet ordenado de los plazos de un filtro, con ``id__in`` si sus ids están en caché.
+
+    Solo usa el caché si la lista está completa; si no, evalúa los filtros.
+
+    Args:
+        usuario_id: Dueño de los plazos
+        filtro: FiltroCompilado
+        consumidor: Clave de ``filtros.PROYECCIONES``
+    """
+    resultado = buscar_ids(usuario_id, filtro)
+    if resultado is None or not resultado.completo:
+        return filtro.queryset(usuario_id, consumidor=consumidor)
+
+    from plazos.models import PlazoJudicial
+
+    plazos = PlazoJudicial.objects.filter(usuario_id=usuario_id, id__in=list(resultado.ids))
+    if consumidor:
+        plazos = plazos.only(*PROYECCIONES[consumidor])
+    return ordenar_plazos(plazos, filtro.ordenar_por, filtro.direccion)
+
+
+def invalidar_resultados_usuario(usuario_id: int) -> None:
+    """
+    Descarta las listas de ids del usuario guardadas en este proceso.
+
+    Las de otros procesos y las del caché compartido quedan obsoletas al
+    cambiar la versión del usuario (``invalidar_dashboard_usuario``).
+    """
+    _lru.descartar_usuario(usuario_id)
@@ -0,0 +1,170 @@
+"""
+Cifrado de la clave del cliente con un MultiFernet compartido por el proceso.
+
+Las claves se leen de ``settings.ENCRYPTION_KEYS`` (la primera cifra, todas
+descifran), lo que permite rotarlas: se agrega la clave nueva al principio,
+se ejecuta ``recifrar_claves_cliente`` y luego se retira la antigua. Si no hay
+claves configuradas se deriva una de ``SECRET_KEY``, estable entre reinicios.
+
+El cifrador se construye una sola vez por proceso; ``invalidar_cifrador``
+fuerza a releer la configuración.
+
+Un valor con forma de token Fernet que ninguna clave descifra (cifrado con
+una clave retirada de ``ENCRYPTION_KEYS``) no es texto plano: se muestra como
+``MENSAJE_NO_DESCIFRABLE`` y no se indexa ni se vuelve a cifrar.
+"""
+
+import base64
+import binascii
+import hashlib
+import threading
+from typing import Iterable, List, Optional
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+from django.conf import settings
+
+MENSAJE_NO_DESCIFRABLE = 'Error al desencriptar'
+
+# Versión (1 byte), marca de tiempo (8), IV (16), al menos un bloque AES (16) y HMAC (32)
+_VERSION_FERNET = 0x80
+_LARGO_MINIMO_TOKEN = 1 + 8 + 16 + 16 + 32
+
+_cifrador: Optional[MultiFernet] = None
+_lock = threading.Lock()
+
+
+def obtener_claves() -> List[bytes]:
+    """
+    Obtiene las claves Fernet configuradas, la de cifrado primero.
+
+    Returns:
+        Lista de claves en base64 url-safe
+    """
+    claves = list(getattr(settings, 'ENCRYPTION_KEYS', None) or [])
+    clave_unica = getattr(settings, 'ENCRYPTION_KEY', None)
+    if clave_unica and clave_unica not in claves:
+        claves.insert(0, clave_unica)
+    if not claves:
+        derivada = hashlib.sha256(f'plazos.clave_cliente:{settings.SECRET_KEY}'.encode()).digest()
+        claves = [base64.urlsafe_b64encode(derivada)]
+    return [clave.encode() if isinstance(clave, str) else clave for clave in claves]
+
+
+def obtener_cifrador() -> MultiFernet:
+    """
+    Obtiene el cifrador del proceso, construyéndolo la primera vez.
+
+    Returns:
+        MultiFernet con las claves configuradas
+    """
+    global _cifrador
+    if _cifrador is None:
+        with _lock:
+            if _cifrador is None:
+                _cifrador = MultiFernet([Fernet(clave) for clave in obtener_claves()])
+    return _cifrador
+
+
+def invalidar_cifrador() -> None:
+    """
+    Descarta el cifrador del proceso (por ejemplo, tras cambiar las claves).
+    """
+    global _cifrador
+    with _lock:
+        _cifrador = None
+
+
+def cifrar(texto: Optional[str]) -> str:
+    """
+    Cifra un texto con la clave principal.
+
+    Args:
+        texto: Texto plano
+
+    Returns:
+        Token Fernet, o cadena vacía si el texto está vacío
+    """
+    if not texto:
+        return ''
+    return obtener_cifrador().encrypt(texto.encode()).decode()
+
+
+def es_token_fernet(valor: Optional[str]) -> bool:
+    """
+    Indica si un valor tiene la forma de un token Fernet, lo descifre o no alguna clave.
+
+    Un token es base64 url-safe de al menos ``_LARGO_MINIMO_TOKEN`` bytes que
+    comienza con el byte de versión 0x80 y cuyo texto cifrado ocupa bloques
+    completos de 16 bytes.
+    """
+    if not valor:
+        return False
+    try:
+        datos = base64.urlsafe_b64decode(valor.encode())
+    except (binascii.Error, ValueError):
+        return False
+    return (
+        len(datos) >= _LARGO_MINIMO_TOKEN
+        and datos[0] == _VERSION_FERNET
+        and (len(datos) - _LARGO_MINIMO_TOKEN) % 16 == 0
+    )
+
+
+def descifrar(valor: Optional[str], no_descifrable: str = MENSAJE_NO_DESCIFRABLE) -> str:
+    """
+    Descifra un valor guardado.
+
+    Los valores que no tienen forma de token (registros antiguos guardados sin
+    cifrar) se devuelven tal cual.
+
+    Args:
+        valor: Token Fernet o texto plano
+        no_descifrable: Resultado para un token que ninguna clave descifra
+
+    Returns:
+        Texto plano
+    """
+    if not valor:
+        return ''
+    try:
+        return obtener_cifrador().decrypt(valor.encode()).decode()
+    except InvalidToken:
+        return no_descifrable if es_token_fernet(valor) else valor
+
+
+def descifrar_lote(valores: Iterable[Optional[str]],
+                   no_descifrable: str = MENSAJE_NO_DESCIFRABLE) -> List[str]:
+    """
+    Descifra varios valores reutilizando el mismo cifrador.
+
+    Args:
+        valores: Tokens Fernet o textos planos
+        no_descifrable: Resultado para un token que ninguna clave descifra
+
+    Returns:
+        Lista de textos planos en el mismo orden
+    """
+    cifrador = obtener_cifrador()
+    resultado = []
+    for valor in valores:
+        if not valor:
+            resultado.append('')
+            continue
+        try:
+            resultado.append(cifrador.decrypt(valor.encode()).decode())
+        except InvalidToken:
+            resultado.append(no_descifrable if es_token_fernet(valor) else valor)
+    return resultado
+
+
+def esta_cifrado(valor: Optional[str]) -> bool:
+    """
+    Indica si un valor es un token que alguna de las claves configuradas puede descifrar.
+    """
+    if not valor:
+        return False
+    try:
+        obtener_cifrador().decrypt(valor.encode())
+    except InvalidToken:
+        return False
+    return True
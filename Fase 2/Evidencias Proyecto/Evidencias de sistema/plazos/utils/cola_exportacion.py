@@ -0,0 +1,280 @@
+"""
+Cola de exportaciones en segundo plano respaldada por la base de datos.
+
+La petición solo encola un ``TrabajoExportacion``; el comando
+``procesar_exportaciones`` lo toma, genera el archivo en ``MEDIA_ROOT`` y el
+cliente consulta el estado hasta poder descargarlo.
+
+- Deduplicación: la huella del trabajo combina formato, clave del filtro
+  compilado y la versión de los datos del usuario (máximo ``updated_at`` y
+  cantidad de plazos). Si ya hay un trabajo activo o un archivo vigente con la misma
+  huella se reutiliza; una restricción única parcial impide dos activos iguales.
+- Reclamo: un UPDATE condicional sobre el estado, válido en SQLite y PostgreSQL
+  con varios procesos en paralelo.
+- Reintentos: un trabajo fallido vuelve a la cola con ``disponible_en`` en el
+  futuro (espera exponencial desde ``RETRASO_BASE_REINTENTO``), de modo que un
+  error transitorio no se reintenta de inmediato ni bloquea al resto de la cola.
+- Expiración: los archivos duran ``DURACION_ARCHIVO`` y luego se eliminan junto
+  con el trabajo.
+"""
+
+import hashlib
+import json
+import logging
+import tempfile
+from datetime import timedelta
+from typing import Optional, Tuple
+
+from django.core.files import File
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Q
+from django.utils import timezone
+
+from .export import GENERADORES, nombre_descarga, plazos_exportacion
+from .filtros import compilar_parametros
+
+logger = logging.getLogger(__name__)
+
+DURACION_ARCHIVO = timedelta(hours=24)
+
+# Un trabajo "procesando" más antiguo que esto se considera abandonado (worker caído)
+TIEMPO_MAXIMO_PROCESO = timedelta(minutes=30)
+
+MAX_INTENTOS = 3
+
+# Espera antes del primer reintento; se duplica con cada intento fallido
+RETRASO_BASE_REINTENTO = timedelta(seconds=30)
+
+
+def retraso_reintento(intentos: int) -> timedelta:
+    """
+    Espera antes de volver a reclamar un trabajo que falló ``intentos`` veces.
+    """
+    return RETRASO_BASE_REINTENTO * 2 ** max(intentos - 1, 0)
+
+
+def version_datos(usuario_id: int) -> str:
+    """
+    Versión de los plazos de un usuario: cambia con cualquier alta, edición o eliminación.
+    """
+    from plazos.models import PlazoJudicial
+
+    resumen = PlazoJudicial.objects.filter(usuario_id=usuario_id).aggregate(
+        ultima=Max('updated_at'), total=Count('id'),
+    )
+    ultima = resumen['ultima'].isoformat() if resumen['ultima'] else '-'
+    return f"{ultima}:{resumen['total']}"
+
+
+def huella_trabajo(usuario_id: int, formato: str, parametros: dict) -> str:
+    """
+    Calcula la huella que identifica exportaciones equivalentes.
+
+    Usa la clave del filtro compilado, de modo que parámetros escritos de
+    forma distinta pero con el mismo resultado comparten huella.
+
+    Args:
+        usuario_id: Dueño de los plazos
+        formato: 'pdf', 'ics' o 'xlsx'
+        parametros: Resultado de ``export.normalizar_parametros``
+
+    Returns:
+        SHA-256 hexadecimal
+    """
+    firma = json.dumps(
+        [usuario_id, formato, compilar_parametros(parametros).clave_orden, version_datos(usuario_id)],
+        separators=(',', ':'),
+    )
+    return hashlib.sha256(firma.encode()).hexdigest()
+
+
+def encolar_exportacion(usuario, formato: str, parametros: dict) -> Tuple[object, bool]:
+    """
+    Encola una exportación o reutiliza una equivalente.
+
+    Args:
+        usuario: Usuario que solicita la exportación
+        formato: 'pdf', 'ics' o 'xlsx'
+        parametros: Resultado de ``export.normalizar_parametros``
+
+    Returns:
+        Tupla ``(trabajo, creado)``
+    """
+    from plazos.models import TrabajoExportacion
+
+    if formato not in GENERADORES:
+        raise ValueError(f'Formato de exportación no soportado: {formato}')
+
+    huella = huella_trabajo(usuario.pk, formato, parametros)
+    existente = _trabajo_reutilizable(usuario.pk, huella)
+    if existente:
+        return existente, False
+
+    try:
+        with transaction.atomic():
+            trabajo = TrabajoExportacion.objects.create(
+                usuario=usuario, formato=formato, parametros=parametros, huella=huella,
+            )
+    except IntegrityError:
+        # Otra petición encoló el mismo trabajo entre la consulta y la inserción
+        existente = _trabajo_reutilizable(usuario.pk, huella)
+        if existente is None:
+            raise
+        return existente, False
+    return trabajo, True
+
+
+def _trabajo_reutilizable(usuario_id: int, huella: str):
+    from plazos.models import TrabajoExportacion
+
+    return (
+        TrabajoExportacion.objects
+        .filter(usuario_id=usuario_id, huella=huella)
+        .filter(
+            Q(estado__in=TrabajoExportacion.ESTADOS_ACTIVOS)
+            | Q(estado='completado', expira_en__gt=timezone.now())
+        )
+        .order_by('-created_at')
+        .first()
+    )
+
+
+def reclamar_siguiente():
+    """
+    Toma el trabajo pendiente disponible más antiguo y lo marca como "procesando".
+
+    Los trabajos en espera de reintento (``disponible_en`` futuro) se omiten.
+
+    El intento se cuenta al reclamarlo, de modo que un worker que se cae a
+    mitad del trabajo también lo consume.
+
+    Returns:
+        El trabajo reclamado, o None si no hay pendientes
+    """
+    from plazos.models import TrabajoExportacion
+
+    pendientes = TrabajoExportacion.objects.filter(
+        estado='pendiente', disponible_en__lte=timezone.now(),
+    ).order_by('disponible_en', 'id')
+    for trabajo_id in pendientes.values_list('id', flat=True)[:10]:
+        # Solo un proceso logra cambiar el estado: el resto ve 0 filas y prueba el siguiente
+        reclamado = TrabajoExportacion.objects.filter(id=trabajo_id, estado='pendiente').update(
+            estado='procesando', iniciado_en=timezone.now(), intentos=F('intentos') + 1,
+        )
+        if reclamado:
+            return TrabajoExportacion.objects.get(id=trabajo_id)
+    return None
+
+
+def procesar_trabajo(trabajo) -> bool:
+    """
+    Genera el archivo de un trabajo reclamado y guarda el resultado.
+
+    Si falla se reintenta, tras ``retraso_reintento``, hasta ``MAX_INTENTOS``
+    veces antes de marcarlo con error.
+
+    Args:
+        trabajo: TrabajoExportacion en estado "procesando"
+
+    Returns:
+        True si el archivo se generó correctamente
+    """
+    generar = GENERADORES[trabajo.formato]
+
+    try:
+        plazos, titulo = plazos_exportacion(trabajo.usuario_id, trabajo.parametros)
+        with tempfile.TemporaryFile() as temporal:
+            trabajo.total_filas = generar(plazos, temporal, titulo)
+            temporal.seek(0)
+            ahora = timezone.now()
+            nombre = nombre_descarga(trabajo.formato, timezone.localtime(ahora))
+            trabajo.archivo.save(nombre, File(temporal), save=False)
+    except Exception as error:
+        logger.exception('Error al generar la exportación %s', trabajo.pk)
+        trabajo.estado = 'pendiente' if trabajo.intentos < MAX_INTENTOS else 'error'
+        trabajo.error = str(error)[:1000]
+        trabajo.finalizado_en = timezone.now()
+        trabajo.disponible_en = trabajo.finalizado_en + retraso_reintento(trabajo.intentos)
+        trabajo.save(update_fields=['estado', 'error', 'finalizado_en', 'disponible_en'])
+        return False
+
+    trabajo.estado = 'completado'
+    trabajo.nombre_descarga = nombre
+    trabajo.error = ''
+    trabajo.finalizado_en = timezone.now()
+    trabajo.expira_en = trabajo.finalizado_en + DURACION_ARCHIVO
+    trabajo.save(update_fields=[
+        'estado', 'archivo', 'nombre_descarga', 'total_filas',
+        'error', 'finalizado_en', 'expira_en',
+    ])
+    return True
+
+
+def liberar_trabajos_atascados() -> int:
+    """
+    Devuelve a la cola los trabajos que llevan demasiado tiempo "procesando".
+
+    Los que ya agotaron ``MAX_INTENTOS`` se marcan con error en lugar de
+    reintentarse (p. ej. un archivo que hace caer al worker por memoria).
+
+    Returns:
+        Cantidad de trabajos liberados
+    """
+    from plazos.models import TrabajoExportacion
+
+    ahora = timezone.now()
+    atascados = TrabajoExportacion.objects.filter(
+        estado='procesando', iniciado_en__lt=ahora - TIEMPO_MAXIMO_PROCESO,
+    )
+    atascados.filter(intentos__gte=MAX_INTENTOS).update(
+        estado='error', error='El proceso se interrumpió en cada intento', finalizado_en=ahora,
+    )
+    # El worker no llegó a registrar el fallo: se aplica aquí la misma espera
+    liberados = 0
+    for intentos in atascados.filter(intentos__lt=MAX_INTENTOS).order_by().values_list('intentos', flat=True).distinct():
+        liberados += atascados.filter(intentos=intentos).update(
+            estado='pendiente', iniciado_en=None, disponible_en=ahora + retraso_reintento(intentos),
+        )
+    return liberados
+
+
+def eliminar_expirados() -> int:
+    """
+    Elimina los archivos vencidos y sus trabajos, y los trabajos fallidos antiguos.
+
+    Returns:
+        Cantidad de trabajos eliminados
+    """
+    from plazos.models import TrabajoExportacion
+
+    ahora = timezone.now()
+    expirados = TrabajoExportacion.objects.filter(
+        Q(expira_en__lte=ahora) | Q(estado='error', created_at__lte=ahora - DURACION_ARCHIVO)
+    )
+    eliminados = 0
+    for trabajo in expirados.only('id', 'archivo').iterator():
+        if trabajo.archivo:
+            trabajo.archivo.delete(save=False)
+        trabajo.delete()
+        eliminados += 1
+    return eliminados
+
+
+def resumen_trabajo(trabajo, url_descarga: Optional[str] = None) -> dict:
+    """
+    Datos del trabajo para el endpoint de estado.
+
+    Args:
+        trabajo: TrabajoExportacion
+        url_descarga: URL de descarga, incluida solo si el archivo está listo
+    """
+    return {
+        'id': trabajo.pk,
+        'formato': trabajo.formato,
+        'estado': trabajo.estado,
+        'total_filas': trabajo.total_filas,
+        'error': trabajo.error if trabajo.estado == 'error' else '',
+        'creado': trabajo.created_at.isoformat() if trabajo.created_at else None,
+        'expira': trabajo.expira_en.isoformat() if trabajo.expira_en else None,
+        'url_descarga': url_descarga if trabajo.descargable else None,
+    }
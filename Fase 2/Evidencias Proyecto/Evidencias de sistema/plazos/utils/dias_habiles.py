@@ -0,0 +1,261 @@
+"""
+Índice precalculado de días hábiles para el cálculo de plazos judiciales.
+
+El calendario se construye una sola vez por proceso y se extiende de forma
+perezosa a nuevos años. Los días inhábiles provienen de ``feriados.py``
+(feriados nacionales y cierres judiciales). Cada índice (``_IndiceHabil``)
+tiene dos arreglos:
+
+- ``habiles``: ordinales (``date.toordinal()``) de todos los días hábiles del
+  rango cubierto, ordenados.
+- ``acumulado``: para cada día del rango, cuántos días hábiles hay antes de él.
+
+Con esto, "N días hábiles después de X" es un acceso directo al arreglo y
+contar días hábiles entre dos fechas es una resta.
+"""
+
+from array import array
+from bisect import bisect_left
+from datetime import date
+from threading import Lock
+from typing import Callable, Iterable, List, Optional, Sequence
+
+from .feriados import obtener_cache_feriados
+
+
+class _IndiceHabil:
+    """Índices de un rango de años; inmutable una vez construido."""
+
+    __slots__ = ('ano_inicio', 'ano_fin', 'ordinal_base', 'habiles', 'acumulado')
+
+    def __init__(self, ano_inicio: int, ano_fin: int, ordinal_base: int, habiles: array, acumulado: array):
+        self.ano_inicio = ano_inicio
+        self.ano_fin = ano_fin
+        self.ordinal_base = ordinal_base
+        self.habiles = habiles
+        self.acumulado = acumulado
+
+    def cubre(self, ano_inicio: int, ano_fin: int) -> bool:
+        return self.ano_inicio <= ano_inicio and ano_fin <= self.ano_fin
+
+    def habiles_antes(self, ordinal: int) -> int:
+        """Cantidad de días hábiles del rango cubierto anteriores al ordinal."""
+        return self.acumulado[ordinal - self.ordinal_base]
+
+
+class CalendarioHabil:
+    """
+    Calendario de días hábiles con búsquedas O(1) / O(log n).
+
+    Cubre siempre un rango continuo de años completos [ano_inicio, ano_fin].
+    Los índices viven en un ``_IndiceHabil`` que se reemplaza entero (una sola
+    asignación bajo el lock); cada consulta toma una referencia local al índice
+    y no ve cambios a medias aunque otro hilo lo extienda o invalide.
+    """
+
+    def __init__(self, proveedor_feriados: Optional[Callable[[int], Iterable[date]]] = None):
+        self._proveedor_feriados = proveedor_feriados or obtener_cache_feriados().feriados_del_ano
+        self._lock = Lock()
+        self._indice: Optional[_IndiceHabil] = None
+
+    def _construir(self, ano_inicio: int, ano_fin: int) -> _IndiceHabil:
+        """Construye los índices para el rango de años indicado."""
+        ordinal_base = date(ano_inicio, 1, 1).toordinal()
+        ordinal_fin = date(ano_fin, 12, 31).toordinal()
+
+        feriados = set()
+        for ano in range(ano_inicio, ano_fin + 1):
+            feriados.update(f.toordinal() for f in self._proveedor_feriados(ano))
+
+        habiles = array('l')
+        acumulado = array('l')
+        contador = 0
+        # date(1, 1, 1) es lunes, por lo que (ordinal - 1) % 7 es el weekday()
+        for ordinal in range(ordinal_base, ordinal_fin + 1):
+            acumulado.append(contador)
+            if (ordinal - 1) % 7 < 5 and ordinal not in feriados:
+                habiles.append(ordinal)
+                contador += 1
+
+        return _IndiceHabil(ano_inicio, ano_fin, ordinal_base, habiles, acumulado)
+
+    def _asegurar_anos(self, ano_inicio: int, ano_fin: int) -> _IndiceHabil:
+        """
+        Obtiene un índice que cubre los años indicados, extendiéndolo si hace falta.
+
+        Returns:
+            Índice que el llamador debe usar para toda la consulta
+        """
+        indice = self._indice
+        if indice is not None and indice.cubre(ano_inicio, ano_fin):
+            return indice
+
+        with self._lock:
+            indice = self._indice
+            if indice is None:
+                nuevo_inicio, nuevo_fin = ano_inicio, ano_fin
+            else:
+                if indice.cubre(ano_inicio, ano_fin):
+                    return indice
+                nuevo_inicio = min(ano_inicio, indice.ano_inicio)
+                nuevo_fin = max(ano_fin, indice.ano_fin)
+            indice = self._construir(nuevo_inicio, nuevo_fin)
+            self._indice = indice
+            return indice
+
+    def _extender_un_ano(self, indice: _IndiceHabil) -> _IndiceHabil:
+        """Índice que cubre al menos un año más allá del rango de ``indice``."""
+        return self._asegurar_anos(indice.ano_inicio, indice.ano_fin + 1)
+
+    def invalidar(self) -> None:
+        """Descarta los índices; se reconstruyen en la siguiente consulta."""
+        with self._lock:
+            self._indice = None
+
+    def es_dia_habil(self, fecha: date) -> bool:
+        """
+        Verifica si una fecha es día hábil.
+
+        Args:
+            fecha: Fecha a verificar
+
+        Returns:
+            True si es día hábil, False en caso contrario
+        """
+        indice = self._asegurar_anos(fecha.year, fecha.year)
+        ordinal = fecha.toordinal()
+        posicion = indice.habiles_antes(ordinal)
+        return posicion < len(indice.habiles) and indice.habiles[posicion] == ordinal
+
+    def sumar_dias_habiles(self, fecha: date, dias: int) -> date:
+        """
+        Obtiene el día hábil número ``dias`` contado desde ``fecha`` (inclusive).
+
+        Args:
+            fecha: Primer día del cómputo
+            dias: Número de días hábiles (>= 1)
+
+        Returns:
+            Fecha del último día hábil del cómputo
+        """
+        indice = self._asegurar_anos(fecha.year, fecha.year)
+        objetivo = indice.habiles_antes(fecha.toordinal()) + dias - 1
+
+        # Extender año a año hasta que el índice objetivo quede cubierto
+        while objetivo >= len(indice.habiles):
+            indice = self._extender_un_ano(indice)
+            objetivo = indice.habiles_antes(fecha.toordinal()) + dias - 1
+
+        return date.fromordinal(indice.habiles[objetivo])
+
+    def sumar_dias_habiles_lote(self, fechas: Sequence[date], dias: Sequence[int]) -> List[date]:
+        """
+        Versión por lotes de ``sumar_dias_habiles``.
+
+        Asegura la cobertura de años una sola vez y luego resuelve cada fila
+        con accesos directos a los arreglos.
+
+        Args:
+            fechas: Primer día del cómputo de cada fila
+            dias: Número de días hábiles de cada fila (>= 1)
+
+        Returns:
+            Lista con la fecha resultante de cada fila
+        """
+        if not fechas:
+            return []
+
+        indice = self._asegurar_anos(min(fechas).year, max(fechas).year)
+        ordinales = [fecha.toordinal() for fecha in fechas]
+
+        while True:
+            base = indice.ordinal_base
+            acumulado = indice.acumulado
+            objetivos = [acumulado[o - base] + n - 1 for o, n in zip(ordinales, dias)]
+            if max(objetivos) < len(indice.habiles):
+                break
+            indice = self._extender_un_ano(indice)
+
+        habiles = indice.habiles
+        fromordinal = date.fromordinal
+        return [fromordinal(habiles[objetivo]) for objetivo in objetivos]
+
+    def contar_dias_habiles_lote(self, fechas_inicio: Sequence[date], fechas_fin: Sequence[date]) -> List[int]:
+        """
+        Versión por lotes de ``contar_dias_habiles``.
+
+        Args:
+            fechas_inicio: Fecha de inicio de cada fila
+            fechas_fin: Fecha de fin de cada fila
+
+        Returns:
+            Lista con el número de días hábiles de cada fila
+        """
+        if not fechas_inicio:
+            return []
+
+        indice = self._asegurar_anos(min(fechas_inicio).year, max(fechas_fin).year)
+        base = indice.ordinal_base
+        acumulado = indice.acumulado
+        habiles = indice.habiles
+
+        conteos = []
+        for inicio, fin in zip(fechas_inicio, fechas_fin):
+            if inicio > fin:
+                conteos.append(0)
+                continue
+            conteos.append(
+                bisect_left(habiles, fin.toordinal() + 1) - acumulado[inicio.toordinal() - base]
+            )
+        return conteos
+
+    def contar_dias_habiles(self, fecha_inicio: date, fecha_fin: date) -> int:
+        """
+        Cuenta los días hábiles entre dos fechas, ambas inclusive.
+
+        Args:
+            fecha_inicio: Fecha de inicio
+            fecha_fin: Fecha de fin
+
+        Returns:
+            Número de días hábiles en el intervalo
+        """
+        if fecha_inicio > fecha_fin:
+            return 0
+
+        indice = self._asegurar_anos(fecha_inicio.year, fecha_fin.year)
+        inicio = indice.habiles_antes(fecha_inicio.toordinal())
+        fin = bisect_left(indice.habiles, fecha_fin.toordinal() + 1)
+        return fin - inicio
+
+    def proximo_dia_habil(self, fecha: date) -> date:
+        """
+        Obtiene el primer día hábil estrictamente posterior a una fecha.
+
+        Args:
+            fecha: Fecha de referencia
+
+        Returns:
+            Próximo día hábil
+        """
+        siguiente = date.fromordinal(fecha.toordinal() + 1)
+        return self.sumar_dias_habiles(siguiente, 1)
+
+
+_calendario_habil = CalendarioHabil()
+
+
+def obtener_calendario_habil() -> CalendarioHabil:
+    """
+    Obtiene el calendario de días hábiles compartido por el proceso.
+
+    Si la tabla de feriados cambió, el calendario se invalida y se reconstruye
+    con los nuevos días inhábiles. La versión de los feriados se revisa a lo
+    sumo cada ``INTERVALO_VERIFICACION_VERSION`` segundos, no en cada llamada.
+
+    Returns:
+        Instancia única de CalendarioHabil
+    """
+    if obtener_cache_feriados().sincronizar():
+        _calendario_habil.invalidar()
+    return _calendario_habil
@@ -0,0 +1,144 @@
+"""
+Estadísticas y listados de plazos del dashboard, cada uno en una sola consulta.
+
+Todos los contadores del dashboard se obtienen con agregación condicional
+(``Count(filter=Q(...))``); los plazos recientes y próximos, con una consulta
+que une ambas selecciones y se separa en Python. Los dos resultados se guardan
+en el caché del dashboard por usuario (ver ``cache_dashboard``).
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, List, Tuple
+
+from django.db.models import Count, Q
+
+from .cache_dashboard import obtener_fragmento
+from .estados import fecha_hoy_tribunales
+
+DIAS_URGENCIA = 3
+
+CANTIDAD_RECIENTES = 10
+CANTIDAD_PROXIMOS = 5
+DIAS_PROXIMOS = 7
+ESTADOS_PROXIMOS = ['corriendo', 'pendiente']
+
+
+def agregados_estadisticas(hoy) -> Dict[str, Count]:
+    """
+    Expresiones de agregación de los contadores del dashboard.
+
+    Args:
+        hoy: Fecha de referencia para los plazos urgentes
+
+    Returns:
+        Dict de nombre de contador a ``Count`` condicional
+    """
+    limite_urgencia = hoy + timedelta(days=DIAS_URGENCIA)
+    return {
+        'total': Count('id'),
+        'pendientes': Count('id', filter=Q(estado='pendiente')),
+        'corriendo': Count('id', filter=Q(estado='corriendo')),
+        'suspendidos': Count('id', filter=Q(estado='suspendido')),
+        'vencidos': Count('id', filter=Q(estado='vencido')),
+        'urgentes': Count('id', filter=Q(
+            fecha_vencimiento__lte=limite_urgencia,
+            estado__in=['corriendo', 'pendiente'],
+        )),
+        'urgentes_corriendo': Count('id', filter=Q(
+            fecha_vencimiento__lte=limite_urgencia,
+            estado='corriendo',
+        )),
+    }
+
+
+def calcular_estadisticas_plazos(usuario_id: int) -> Dict[str, Any]:
+    """
+    Calcula todos los contadores de plazos de un usuario en una consulta.
+
+    Args:
+        usuario_id: Id del usuario
+
+    Returns:
+        Dict con los contadores y la fecha de cálculo
+    """
+    from plazos.models import PlazoJudicial
+
+    hoy = fecha_hoy_tribunales()
+    contadores = PlazoJudicial.objects.filter(usuario_id=usuario_id).aggregate(**agregados_estadisticas(hoy))
+    contadores['fecha'] = hoy
+    return contadores
+
+
+def obtener_estadisticas_plazos(usuario) -> Dict[str, Any]:
+    """
+    Obtiene las estadísticas de plazos de un usuario, usando el caché si es posible.
+
+    Args:
+        usuario: Instancia del usuario
+
+    Returns:
+        Dict con los contadores: total, pendientes, corriendo, suspendidos,
+        vencidos, urgentes y urgentes_corriendo
+    """
+    return obtener_fragmento(
+        usuario.pk,
+        'estadisticas',
+        lambda: calcular_estadisticas_plazos(usuario.pk)
+    )
+
+
+def calcular_listados_dashboard(usuario_id: int) -> Tuple[List[Any], List[Any]]:
+    """
+    Obtiene los plazos recientes y los próximos a vencer de un usuario en una consulta.
+
+    Cada selección se expresa como subconsulta de ids (con su propio orden y
+    límite) y se piden juntas con ``OR``; el resultado contiene ambas
+    selecciones completas, así que ordenarlo y cortarlo en Python entrega lo
+    mismo que dos consultas separadas.
+
+    Args:
+        usuario_id: Id del usuario
+
+    Returns:
+        Tupla ``(recientes, proximos)``: los ``CANTIDAD_RECIENTES`` creados más
+        recientemente y los ``CANTIDAD_PROXIMOS`` activos que vencen dentro de
+        ``DIAS_PROXIMOS`` días
+    """
+    from plazos.models import PlazoJudicial
+
+    hoy = fecha_hoy_tribunales()
+    limite = hoy + timedelta(days=DIAS_PROXIMOS)
+    plazos_usuario = PlazoJudicial.objects.filter(usuario_id=usuario_id)
+    en_ventana = Q(fecha_vencimiento__gte=hoy, fecha_vencimiento__lte=limite, estado__in=ESTADOS_PROXIMOS)
+
+    ids_recientes = plazos_usuario.order_by('-created_at', '-id').values('id')[:CANTIDAD_RECIENTES]
+    ids_proximos = plazos_usuario.filter(en_ventana).order_by('fecha_vencimiento', 'id').values('id')[:CANTIDAD_PROXIMOS]
+    plazos = list(plazos_usuario.filter(Q(id__in=ids_recientes) | Q(id__in=ids_proximos)))
+
+    recientes = sorted(plazos, key=lambda plazo: (plazo.created_at, plazo.id), reverse=True)[:CANTIDAD_RECIENTES]
+    proximos = sorted(
+        (
+            plazo for plazo in plazos
+            if plazo.fecha_vencimiento and hoy <= plazo.fecha_vencimiento <= limite
+            and plazo.estado in ESTADOS_PROXIMOS
+        ),
+        key=lambda plazo: (plazo.fecha_vencimiento, plazo.id),
+    )[:CANTIDAD_PROXIMOS]
+    return recientes, proximos
+
+
+def obtener_listados_dashboard(usuario) -> Tuple[List[Any], List[Any]]:
+    """
+    Obtiene los plazos recientes y próximos de un usuario, usando el caché si es posible.
+
+    Args:
+        usuario: Instancia del usuario
+
+    Returns:
+        Tupla ``(recientes, proximos)`` (ver ``calcular_listados_dashboard``)
+    """
+    return obtener_fragmento(
+        usuario.pk,
+        'listados',
+        lambda: calcular_listados_dashboard(usuario.pk)
+    )
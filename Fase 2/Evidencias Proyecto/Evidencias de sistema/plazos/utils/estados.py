@@ -0,0 +1,129 @@
+"""
+Transiciones de estado de plazos judiciales resueltas directamente en SQL.
+
+Aplica las mismas reglas que ``obtener_estado_plazo`` pero con un
+``UPDATE ... WHERE`` por transición, sin cargar filas en Python:
+
+- ``pendiente``/``corriendo`` con vencimiento anterior a hoy pasan a ``vencido``.
+- ``pendiente`` con vencimiento hoy o posterior pasa a ``corriendo``.
+- ``suspendido`` y ``esperando_proveido`` no se modifican.
+
+Las transiciones las ejecuta el comando ``procesar_estados`` en segundo
+plano; ninguna petición web las dispara.
+"""
+
+from datetime import date
+from typing import Dict, Optional
+from zoneinfo import ZoneInfo
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+ESTADOS_ACTIVOS = ['pendiente', 'corriendo']
+
+PROCESO_TRANSICIONES = 'transiciones_estado'
+
+ZONA_HORARIA_TRIBUNALES = ZoneInfo('America/Santiago')
+
+
+def aplicar_transiciones_estado(plazos=None, usuario=None, hoy: Optional[date] = None) -> Dict[str, int]:
+    """
+    Actualiza los estados de los plazos según su fecha de vencimiento.
+
+    Args:
+        plazos: QuerySet base a actualizar (por defecto todos los plazos)
+        usuario: Si se indica, limita la actualización a sus plazos
+        hoy: Fecha de referencia (por defecto la fecha actual en Santiago)
+
+    Returns:
+        Dict con la cantidad de plazos que pasaron a cada estado y el total
+    """
+    from plazos.models import PlazoJudicial
+
+    if plazos is None:
+        plazos = PlazoJudicial.objects.all()
+    if usuario is not None:
+        plazos = plazos.filter(usuario=usuario)
+    hoy = hoy or fecha_hoy_tribunales()
+    ahora = timezone.now()
+
+    with transaction.atomic():
+        vencidos = plazos.filter(
+            estado__in=ESTADOS_ACTIVOS,
+            fecha_vencimiento__lt=hoy,
+        ).update(estado='vencido', updated_at=ahora)
+
+        corriendo = plazos.filter(
+            estado='pendiente',
+            fecha_vencimiento__gte=hoy,
+        ).update(estado='corriendo', updated_at=ahora)
+
+    if vencidos or corriendo:
+        # Las actualizaciones masivas no disparan señales
+        from .cache_dashboard import invalidar_dashboard_global
+        invalidar_dashboard_global()
+
+    return {
+        'vencido': vencidos,
+        'corriendo': corriendo,
+        'total': vencidos + corriendo,
+    }
+
+
+def fecha_hoy_tribunales() -> date:
+    """
+    Obtiene la fecha actual en la zona horaria de los tribunales (America/Santiago).
+
+    Returns:
+        Fecha local de Santiago
+    """
+    return timezone.now().astimezone(ZONA_HORARIA_TRIBUNALES).date()
+
+
+def procesar_transiciones_pendientes(hoy: Optional[date] = None) -> Dict[str, int]:
+    """
+    Aplica las transiciones de estado solo sobre las filas aún no procesadas.
+
+    Usa la marca de agua del proceso para limitar el trabajo a:
+
+    - plazos cuyo vencimiento cayó entre la última fecha de corte y hoy, y
+    - plazos creados o editados desde la última ejecución.
+
+    Args:
+        hoy: Fecha de referencia (por defecto la fecha actual en Santiago)
+
+    Returns:
+        Dict con la cantidad de plazos que pasaron a cada estado y el total
+    """
+    from plazos.models import PlazoJudicial, MarcaProceso
+
+    hoy = hoy or fecha_hoy_tribunales()
+    inicio = timezone.now()
+
+    with transaction.atomic():
+        marca, _ = MarcaProceso.objects.select_for_update().get_or_create(
+            proceso=PROCESO_TRANSICIONES
+        )
+
+        plazos = PlazoJudicial.objects.all()
+        if marca.fecha_corte and marca.ultima_ejecucion:
+            plazos = plazos.filter(
+                Q(fecha_vencimiento__gte=marca.fecha_corte, fecha_vencimiento__lte=hoy) |
+                Q(updated_at__gte=marca.ultima_ejecucion)
+            )
+
+        resultado = aplicar_transiciones_estado(plazos, hoy=hoy)
+        cambio_de_dia = marca.fecha_corte != hoy
+
+        marca.fecha_corte = hoy
+        marca.ultima_ejecucion = inicio
+        marca.actualizados = resultado['total']
+        marca.save()
+
+    if cambio_de_dia:
+        # Días restantes y urgencias del dashboard cambian con la fecha
+        from .cache_dashboard import invalidar_dashboard_global
+        invalidar_dashboard_global()
+
+    return resultado
@@ -1,183 +1,446 @@
 """
-Utilidades para exportar plazos judiciales a diferentes formatos.
-Incluye exportación a PDF e iCalendar.
+Generación de archivos de exportación de plazos judiciales (PDF, iCalendar, Excel y CSV).
+
+Los generadores de archivos escriben en un archivo binario abierto y devuelven
+la cantidad de plazos exportados; no dependen de la petición HTTP, por lo que
+los usa el proceso de exportaciones en segundo plano (ver
+``plazos.utils.cola_exportacion``). El CSV se genera al vuelo para
+``StreamingHttpResponse``. Los plazos se obtienen con el mismo compilador de
+filtros que el calendario (``plazos.utils.filtros``).
 """
 
-from django.http import HttpResponse
-from django.template.loader import render_to_string
-from django.utils import timezone
+import csv
 from datetime import datetime
-import weasyprint
-from ics import Calendar, Event
-from .plazos import formatear_fecha_chilena, es_plazo_urgente
+from itertools import chain, islice
+from typing import BinaryIO, Dict, Iterator, List
+
+from .ics import en_lotes, etiquetas_plazo, generar_ics
+from .cache_resultados import plazos_filtrados
+from .cifrado import descifrar_lote
+from .filtros import PARAMETRO_SELECCION, compilar_parametros
+
+EXTENSIONES = {
+    'csv': 'csv',
+    'pdf': 'pdf',
+    'ics': 'ics',
+    'xlsx': 'xlsx',
+}
+
+TIPOS_CONTENIDO = {
+    'csv': 'text/csv; charset=utf-8',
+    'pdf': 'application/pdf',
+    'ics': 'text/calendar; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+
+def normalizar_parametros(datos) -> Dict[str, List[str]]:
+    """
+    Reduce los parámetros de una petición a los que afectan la exportación.
+
+    Descarta los vacíos y los de navegación y ordena claves y valores, de modo
+    que dos peticiones con los mismos filtros producen el mismo dict.
+
+    Args:
+        datos: QueryDict (``request.GET``) o dict de listas
+
+    Returns:
+        Dict ``{parámetro: [valores]}`` ordenado
+    """
+    from plazos.forms import FiltroPlazosForm
+
+    permitidos = set(FiltroPlazosForm.base_fields) | {PARAMETRO_SELECCION}
+    listas = datos.lists() if hasattr(datos, 'lists') else datos.items()
+    normalizados = {}
+    for clave, valores in listas:
+        if clave not in permitidos:
+            continue
+        valores = [v.strip() for v in valores if v and v.strip()]
+        if clave == PARAMETRO_SELECCION:
+            valores = [str(v) for v in sorted({int(v) for v in valores if v.isdigit()})]
+        if valores:
+            normalizados[clave] = valores
+    return dict(sorted(normalizados.items()))
+
+
+def plazos_exportacion(usuario_id: int, parametros: Dict[str, List[str]]):
+    """
+    Obtiene los plazos de una exportación a partir de los parámetros normalizados.
+
+    Usa el compilador de filtros del calendario, por lo que el archivo contiene
+    los mismos plazos, en el mismo orden, que el listado con esos parámetros. Si
+    el listado dejó en caché los ids del filtro se leen con ``id__in``.
+
+    Args:
+        usuario_id: Dueño de los plazos; los seleccionados también se limitan a él
+        parametros: Resultado de ``normalizar_parametros``
+
+    Returns:
+        Tupla ``(queryset ordenado, título del documento)``; el título puede
+        incluir ``{total}``, que el generador reemplaza por la cantidad exportada
+    """
+    filtro = compilar_parametros(parametros)
+    if 'ids' in filtro.criterios:
+        titulo = 'Plazos Seleccionados ({total} plazos)'
+    else:
+        titulo = 'Calendario de Plazos Judiciales'
+    return plazos_filtrados(usuario_id, filtro), titulo
+
+
+def nombre_descarga(formato: str, momento: datetime) -> str:
+    """Nombre de archivo sugerido al descargar una exportación."""
+    return f'plazos_judiciales_{momento.strftime("%Y%m%d_%H%M%S")}.{EXTENSIONES[formato]}'
+
+
+def _fecha(valor) -> str:
+    return valor.strftime('%d/%m/%Y') if valor else '-'
+
+
+ENCABEZADOS_PDF = ['Doc.', 'Procedimiento', 'Inicio', 'Vencimiento', 'Estado', 'RUT']
+
+CAMPOS_PDF = ['tipo_documento', 'procedimiento', 'fecha_inicio', 'fecha_vencimiento', 'estado', 'rut_cliente']
+
+TAMANO_LOTE_PDF = 2000
+
+# Alto fijo de fila (puntos): texto de 9 pt en una línea más 6 pt de margen arriba y abajo.
+# Con alto fijo ReportLab no mide cada celda al maquetar
+ALTO_FILA_PDF = 23
+
+# Orientación horizontal si hay muchos plazos para mejor visualización
+LIMITE_VERTICAL_PDF = 10
+
+
+def _estilo_tabla_pdf():
+    """Estilo compartido por todas las tablas del PDF (uno solo para todo el documento)."""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        # Filas alternadas en un solo comando, en lugar de uno por fila
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.lightgrey]),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 4),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ])
+
+
+class _HistoriaPerezosa(list):
+    """
+    Lista de flowables que se completa desde un generador a medida que ReportLab la consume.
+
+    ``doc.build`` solo lee y elimina elementos del comienzo de la lista, por lo
+    que basta con mantener unos pocos en memoria en lugar de todas las tablas.
+    """
+
+    MINIMO = 2  # handle_keepWithNext mira el flowable siguiente
+
+    def __init__(self, iniciales, pendientes):
+        super().__init__(iniciales)
+        self._pendientes = iter(pendientes)
+
+    def _completar(self):
+        while self._pendientes is not None and list.__len__(self) < self.MINIMO:
+            siguiente = next(self._pendientes, None)
+            if siguiente is None:
+                self._pendientes = None
+            else:
+                self.append(siguiente)
+
+    def __len__(self):
+        self._completar()
+        return list.__len__(self)
+
+    def __getitem__(self, indice):
+        self._completar()
+        return list.__getitem__(self, indice)
+
+
+def _filas_pdf(plazos) -> Iterator[list]:
+    """Filas de texto de la tabla, leídas con ``values_list`` (sin instancias del modelo)."""
+    etiquetas = etiquetas_plazo()
+    tipos, procedimientos, estados = etiquetas['tipo_documento'], etiquetas['procedimiento'], etiquetas['estado']
+    filas = plazos.values_list(*CAMPOS_PDF).iterator(chunk_size=TAMANO_LOTE_PDF)
+    for tipo_documento, procedimiento, fecha_inicio, fecha_vencimiento, estado, rut_cliente in filas:
+        yield [
+            tipos.get(tipo_documento, tipo_documento),
+            procedimientos.get(procedimiento, procedimiento),
+            _fecha(fecha_inicio),
+            _fecha(fecha_vencimiento),
+            estados.get(estado, estado),
+            rut_cliente,
+        ]
+
+
+def generar_pdf(plazos, destino: BinaryIO, titulo: str) -> int:
+    """
+    Genera el PDF de un listado de plazos con ReportLab.
+
+    La tabla se arma en trozos del tamaño de una página, cada uno con su
+    encabezado (``repeatRows``) y alto de fila fijo, y todos comparten un único
+    ``TableStyle``. Así ReportLab nunca maqueta ni divide una tabla gigante y el
+    tiempo crece de forma lineal con la cantidad de plazos.
+
+    Args:
+        plazos: QuerySet de PlazoJudicial ya filtrado y ordenado
+        destino: Archivo binario abierto para escritura
+        titulo: Título del documento
+
+    Returns:
+        Cantidad de plazos exportados
+    """
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table
+
+    total = plazos.count()
+
+    horizontal = total > LIMITE_VERTICAL_PDF
+    doc = SimpleDocTemplate(
+        destino,
+        pagesize=landscape(A4) if horizontal else A4,
+        rightMargin=50, leftMargin=50, topMargin=72, bottomMargin=50,
+    )
+    if horizontal:
+        anchos = [1.5*inch, 2.5*inch, 1.2*inch, 1.2*inch, 1*inch, 1.5*inch]
+    else:
+        anchos = [1.2*inch, 2*inch, 1*inch, 1*inch, 0.8*inch, 1.2*inch]
+
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceAfter=30,
+        alignment=1  # Centrado
+    )
+
+    story = [
+        Paragraph(titulo.format(total=total), title_style),
+        Spacer(1, 12),
+        Paragraph(f"Generado el: {datetime.now().strftime('%d/%m/%Y %H:%M')}", styles['Normal']),
+        Paragraph(f"Total de plazos: {total}", styles['Normal']),
+        Spacer(1, 20),
+    ]
+
+    if total:
+        # Filas de datos que caben en una página bajo el encabezado
+        por_tabla = max(1, int(doc.height // ALTO_FILA_PDF) - 1)
+        estilo = _estilo_tabla_pdf()
+        tablas = (
+            Table(
+                [ENCABEZADOS_PDF] + lote,
+                colWidths=anchos,
+                rowHeights=ALTO_FILA_PDF,
+                repeatRows=1,
+                style=estilo,
+            )
+            for lote in en_lotes(_filas_pdf(plazos), por_tabla)
+        )
+        story = _HistoriaPerezosa(story, tablas)
+    else:
+        story.append(Paragraph("No hay plazos para mostrar con los filtros aplicados.", styles['Normal']))
 
+    doc.build(story)
+    return total
 
-def exportar_pdf(plazos, titulo="Calendario de Plazos Judiciales"):
+def generar_ics_archivo(plazos, destino: BinaryIO, titulo: str) -> int:
     """
-    Exporta una lista de plazos judiciales a PDF.
-    
+    Escribe el calendario iCalendar de los plazos en un archivo.
+
     Args:
-        plazos: QuerySet de plazos judiciales
-        titulo: Título del documento PDF
-    
+        plazos: QuerySet de PlazoJudicial ya filtrado y ordenado
+        destino: Archivo binario abierto para escritura
+        titulo: No se usa; se recibe por uniformidad con los demás formatos
+
     Returns:
-        HttpResponse con el PDF generado
-    """
-    # Preparar datos para el template
-    context = {
-        'plazos': plazos,
-        'titulo': titulo,
-        'fecha_generacion': timezone.now(),
-        'total_plazos': plazos.count(),
+        Cantidad de eventos exportados
+    """
+    fragmentos = generar_ics(plazos)
+    while True:
+        try:
+            fragmento = next(fragmentos)
+        except StopIteration as fin:
+            # generar_ics devuelve la cantidad de eventos al terminar
+            return fin.value
+        destino.write(fragmento.encode('utf-8'))
+
+
+# Columnas de las exportaciones tabulares (Excel y CSV)
+ENCABEZADOS_TABLA = [
+    'ID', 'Tipo Documento', 'Procedimiento', 'Días Plazo', 'Tipo Día',
+    'Fecha Inicio', 'Fecha Vencimiento', 'Rol', 'RUT Cliente', 'Clave Cliente',
+    'Estado', 'Observaciones',
+]
+
+CAMPOS_TABLA = [
+    'id', 'tipo_documento', 'procedimiento', 'dias_plazo', 'tipo_dia',
+    'fecha_inicio', 'fecha_vencimiento', 'rol', 'rut_cliente', 'clave_cliente',
+    'estado', 'observaciones',
+]
+
+TAMANO_LOTE_TABLA = 2000
+
+# Filas leídas para estimar el ancho de las columnas de Excel
+MUESTRA_ANCHOS = 500
+
+ANCHO_MINIMO_COLUMNA = 8
+ANCHO_MAXIMO_COLUMNA = 50
+
+
+def filas_tabulares(plazos, tamano_lote: int = TAMANO_LOTE_TABLA) -> Iterator[list]:
+    """
+    Filas de las exportaciones tabulares, con etiquetas legibles y la clave descifrada.
+
+    Lee los plazos con ``values_list`` por lotes y descifra las claves de cada
+    lote de una vez; la memoria no depende de la cantidad de plazos.
+
+    Args:
+        plazos: QuerySet de PlazoJudicial ya filtrado y ordenado
+        tamano_lote: Filas leídas de la base de datos por lote
+
+    Yields:
+        Listas de valores en el orden de ``ENCABEZADOS_TABLA``
+    """
+    from plazos.models import PlazoJudicial
+
+    etiquetas = etiquetas_plazo()
+    etiquetas['tipo_dia'] = {
+        str(valor): str(nombre) for valor, nombre in PlazoJudicial._meta.get_field('tipo_dia').flatchoices
     }
-    
-    # Renderizar HTML
-    html_string = render_to_string('plazos/export/pdf_template.html', context)
-    
-    # Generar PDF
-    pdf_file = weasyprint.HTML(string=html_string).write_pdf()
-    
-    # Crear respuesta HTTP
-    response = HttpResponse(pdf_file, content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="plazos_judiciales_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf"'
-    
-    return response
-
-
-def exportar_ics(plazos, titulo="Plazos Judiciales"):
-    """
-    Exporta una lista de plazos judiciales a formato iCalendar (.ics).
-    
+    tipos, procedimientos = etiquetas['tipo_documento'], etiquetas['procedimiento']
+    tipos_dia, estados = etiquetas['tipo_dia'], etiquetas['estado']
+
+    filas = plazos.values_list(*CAMPOS_TABLA).iterator(chunk_size=tamano_lote)
+    for lote in en_lotes(filas, tamano_lote):
+        claves = descifrar_lote(fila[9] for fila in lote)
+        for fila, clave in zip(lote, claves):
+            (id_, tipo_documento, procedimiento, dias_plazo, tipo_dia, fecha_inicio,
+             fecha_vencimiento, rol, rut_cliente, _, estado, observaciones) = fila
+            yield [
+                id_,
+                tipos.get(tipo_documento, tipo_documento),
+                procedimientos.get(procedimiento, procedimiento),
+                dias_plazo,
+                tipos_dia.get(tipo_dia, tipo_dia),
+                fecha_inicio.strftime('%d/%m/%Y') if fecha_inicio else '',
+                fecha_vencimiento.strftime('%d/%m/%Y') if fecha_vencimiento else '',
+                rol,
+                rut_cliente,
+                clave,
+                estados.get(estado, estado),
+                observaciones or '',
+            ]
+
+
+class _Eco:
+    """Objeto tipo archivo que devuelve lo escrito, para usar ``csv.writer`` al vuelo."""
+
+    def write(self, valor):
+        return valor
+
+
+def generar_csv(plazos) -> Iterator[str]:
+    """
+    Genera un CSV de los plazos por streaming (para ``StreamingHttpResponse``).
+
+    Empieza con BOM para que Excel reconozca el UTF-8 y usa ``;`` como
+    separador, el predeterminado de Excel en configuración regional chilena.
+
     Args:
-        plazos: QuerySet de plazos judiciales
-        titulo: Título del calendario
-    
+        plazos: QuerySet de PlazoJudicial ya filtrado y ordenado
+
+    Yields:
+        Fragmentos de texto del documento, uno por lote de filas
+    """
+    escritor = csv.writer(_Eco(), delimiter=';')
+    yield '\ufeff' + escritor.writerow(ENCABEZADOS_TABLA)
+    for lote in en_lotes(filas_tabulares(plazos), TAMANO_LOTE_TABLA):
+        yield ''.join(escritor.writerow(fila) for fila in lote)
+
+
+def anchos_columnas(muestra: List[list]) -> List[int]:
+    """
+    Estima el ancho de cada columna de Excel a partir de una muestra de filas.
+
+    Args:
+        muestra: Primeras filas del documento
+
     Returns:
-        HttpResponse con el archivo .ics generado
+        Ancho en caracteres por columna, entre ``ANCHO_MINIMO_COLUMNA`` y ``ANCHO_MAXIMO_COLUMNA``
     """
-    # Crear calendario
-    cal = Calendar()
-    
-    for plazo in plazos:
-        if not plazo.fecha_vencimiento:
-            continue
-        
-        # Crear evento
-        evento = Event()
-        evento.uid = f"plazo-{plazo.id}@calendario-judicial.local"
-        evento.name = f"{plazo.get_tipo_documento_display()} - {plazo.rut_causa}"
-        evento.begin = plazo.fecha_vencimiento
-        evento.end = plazo.fecha_vencimiento
-        
-        # Descripción del evento
-        descripcion = f"""
-Tipo de Documento: {plazo.get_tipo_documento_display()}
-Procedimiento: {plazo.get_procedimiento_display()}
-Días de Plazo: {plazo.dias_plazo} ({plazo.get_tipo_dia_display()})
-Fecha de Inicio: {formatear_fecha_chilena(plazo.fecha_inicio)}
-Estado: {plazo.get_estado_display()}
-Clave del Cliente: {plazo.clave_cliente}
-"""
-        
-        if plazo.observaciones:
-            descripcion += f"\nObservaciones: {plazo.observaciones}"
-        
-        evento.description = descripcion.strip()
-        
-        # Categorías
-        evento.categories = [plazo.get_procedimiento_display(), plazo.get_tipo_documento_display()]
-        
-        # Prioridad según urgencia
-        if es_plazo_urgente(plazo.fecha_vencimiento):
-            evento.priority = 1  # Alta prioridad
-        elif plazo.estado == 'vencido':
-            evento.priority = 0  # Muy alta prioridad
-        else:
-            evento.priority = 5  # Normal
-        
-        # Agregar evento al calendario
-        cal.events.add(evento)
-    
-    # Generar contenido iCalendar
-    ics_content = str(cal)
-    
-    # Crear respuesta HTTP
-    response = HttpResponse(ics_content, content_type='text/calendar; charset=utf-8')
-    response['Content-Disposition'] = f'attachment; filename="plazos_judiciales_{datetime.now().strftime("%Y%m%d_%H%M%S")}.ics"'
-    
-    return response
-
-
-def exportar_excel(plazos, titulo="Plazos Judiciales"):
-    """
-    Exporta una lista de plazos judiciales a Excel.
-    Nota: Requiere openpyxl o xlsxwriter
+    anchos = [len(encabezado) for encabezado in ENCABEZADOS_TABLA]
+    for fila in muestra:
+        for i, valor in enumerate(fila):
+            anchos[i] = max(anchos[i], len(str(valor)))
+    return [min(max(ancho + 2, ANCHO_MINIMO_COLUMNA), ANCHO_MAXIMO_COLUMNA) for ancho in anchos]
+
+
+def generar_excel(plazos, destino: BinaryIO, titulo: str) -> int:
+    """
+    Genera la planilla Excel de los plazos en modo de solo escritura de openpyxl.
+
+    Las filas se escriben a medida que se leen (memoria constante); el ancho de
+    las columnas se estima con las primeras ``MUESTRA_ANCHOS`` filas en lugar
+    de recorrer todas las celdas.
+
+    Args:
+        plazos: QuerySet de PlazoJudicial ya filtrado y ordenado
+        destino: Archivo binario abierto para escritura
+        titulo: No se usa; la hoja se llama siempre "Plazos Judiciales"
+
+    Returns:
+        Cantidad de plazos exportados
     """
     try:
         import openpyxl
-        from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Font, PatternFill
+        from openpyxl.utils import get_column_letter
     except ImportError:
         raise ImportError("openpyxl es requerido para exportar a Excel. Instálelo con: pip install openpyxl")
-    
-    # Crear workbook
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Plazos Judiciales"
-    
-    # Encabezados
-    headers = [
-        'ID', 'Tipo Documento', 'Procedimiento', 'Días Plazo', 'Tipo Día',
-        'Fecha Inicio', 'Fecha Vencimiento', 'RUT Causa', 'Clave Cliente',
-        'Estado', 'Días Restantes', 'Observaciones'
-    ]
-    
-    # Estilo para encabezados
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center")
-    
-    # Escribir encabezados
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-    
-    # Escribir datos
-    for row, plazo in enumerate(plazos, 2):
-        ws.cell(row=row, column=1, value=plazo.id)
-        ws.cell(row=row, column=2, value=plazo.get_tipo_documento_display())
-        ws.cell(row=row, column=3, value=plazo.get_procedimiento_display())
-        ws.cell(row=row, column=4, value=plazo.dias_plazo)
-        ws.cell(row=row, column=5, value=plazo.get_tipo_dia_display())
-        ws.cell(row=row, column=6, value=plazo.fecha_inicio.strftime('%d/%m/%Y'))
-        ws.cell(row=row, column=7, value=plazo.fecha_vencimiento.strftime('%d/%m/%Y') if plazo.fecha_vencimiento else '')
-        ws.cell(row=row, column=8, value=plazo.rut_causa)
-        ws.cell(row=row, column=9, value=plazo.clave_cliente)
-        ws.cell(row=row, column=10, value=plazo.get_estado_display())
-        ws.cell(row=row, column=11, value=plazo.dias_restantes)
-        ws.cell(row=row, column=12, value=plazo.observaciones or '')
-    
-    # Ajustar ancho de columnas
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        ws.column_dimensions[column_letter].width = adjusted_width
-    
-    # Crear respuesta HTTP
-    response = HttpResponse(
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    response['Content-Disposition'] = f'attachment; filename="plazos_judiciales_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx"'
-    
-    # Guardar workbook en la respuesta
-    wb.save(response)
-    
-    return response
+
+    filas = filas_tabulares(plazos)
+    muestra = list(islice(filas, MUESTRA_ANCHOS))
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title='Plazos Judiciales')
+    # En modo de solo escritura los anchos deben fijarse antes de la primera fila
+    for columna, ancho in enumerate(anchos_columnas(muestra), 1):
+        ws.column_dimensions[get_column_letter(columna)].width = ancho
+
+    fuente = Font(bold=True, color="FFFFFF")
+    relleno = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    alineacion = Alignment(horizontal="center", vertical="center")
+    encabezados = []
+    for texto in ENCABEZADOS_TABLA:
+        celda = WriteOnlyCell(ws, value=texto)
+        celda.font = fuente
+        celda.fill = relleno
+        celda.alignment = alineacion
+        encabezados.append(celda)
+    ws.append(encabezados)
+
+    total = 0
+    for fila in chain(muestra, filas):
+        ws.append(fila)
+        total += 1
+
+    wb.save(destino)
+    return total
+
+
+GENERADORES = {
+    'pdf': generar_pdf,
+    'ics': generar_ics_archivo,
+    'xlsx': generar_excel,
+}
@@ -0,0 +1,180 @@
+"""
+Caché en memoria de los días inhábiles para tribunales chilenos.
+
+Combina los feriados nacionales (paquete ``holidays``) con los cierres
+registrados en el modelo ``FeriadoJudicial`` (receso judicial de febrero,
+cierres de tribunales, etc.). Cada worker carga un año una sola vez; cuando
+un administrador modifica la tabla se incrementa un contador de versión en
+el caché de Django y los workers descartan su copia. Cada worker consulta esa
+versión a lo sumo una vez cada ``INTERVALO_VERIFICACION_VERSION`` segundos
+(no en cada cálculo de plazo); el worker que hizo el cambio la ve de inmediato.
+
+Para que la invalidación llegue a todos los workers, ``CACHES['default']``
+debe ser un backend compartido (Redis, Memcached o base de datos).
+"""
+
+import logging
+import time
+from datetime import date, timedelta
+from threading import Lock
+from typing import Dict, FrozenSet
+
+import holidays
+from django.core.cache import cache
+from django.db import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+# Segundos entre consultas de la versión compartida de los feriados
+INTERVALO_VERIFICACION_VERSION = 5
+
+CLAVE_VERSION_FERIADOS = 'plazos:feriados:version'
+
+
+def _feriados_nacionales(ano: int) -> set:
+    """
+    Obtiene los feriados nacionales de Chile para un año.
+
+    Args:
+        ano: Año a consultar
+
+    Returns:
+        Conjunto de fechas de feriados del año
+    """
+    return set(holidays.Chile(years=ano).keys())
+
+
+def _cierres_judiciales(ano: int) -> set:
+    """
+    Obtiene los días de cierre registrados en FeriadoJudicial para un año.
+
+    Args:
+        ano: Año a consultar
+
+    Returns:
+        Conjunto de fechas en que los tribunales no funcionan
+    """
+    from plazos.models import FeriadoJudicial
+
+    primer_dia = date(ano, 1, 1)
+    ultimo_dia = date(ano, 12, 31)
+    rangos = FeriadoJudicial.objects.filter(
+        activo=True,
+        fecha_inicio__lte=ultimo_dia,
+        fecha_fin__gte=primer_dia,
+    ).values_list('fecha_inicio', 'fecha_fin')
+
+    dias = set()
+    for fecha_inicio, fecha_fin in rangos:
+        fecha_actual = max(fecha_inicio, primer_dia)
+        fecha_fin = min(fecha_fin, ultimo_dia)
+        while fecha_actual <= fecha_fin:
+            dias.add(fecha_actual)
+            fecha_actual += timedelta(days=1)
+    return dias
+
+
+def obtener_version_feriados() -> int:
+    """
+    Obtiene la versión vigente de la tabla de feriados.
+
+    Returns:
+        Contador de versión almacenado en el caché de Django
+    """
+    return cache.get(CLAVE_VERSION_FERIADOS, 0)
+
+
+def invalidar_cache_feriados() -> None:
+    """
+    Incrementa la versión de feriados para que todos los workers recarguen.
+    """
+    cache.add(CLAVE_VERSION_FERIADOS, 0, timeout=None)
+    try:
+        cache.incr(CLAVE_VERSION_FERIADOS)
+    except ValueError:
+        # La clave expiró o fue desalojada entre add() e incr()
+        cache.set(CLAVE_VERSION_FERIADOS, 1, timeout=None)
+    _cache_feriados.verificar_pronto()
+
+
+class CacheFeriados:
+    """
+    Días inhábiles por año, cargados una vez por worker y versionados.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._version = None
+        self._verificado_en = float('-inf')
+        self._por_ano: Dict[int, FrozenSet[date]] = {}
+
+    def verificar_pronto(self) -> None:
+        """Hace que la próxima llamada a ``sincronizar`` consulte la versión."""
+        self._verificado_en = float('-inf')
+
+    def sincronizar(self) -> bool:
+        """
+        Descarta los años cargados si la versión compartida cambió.
+
+        La versión se consulta a lo sumo una vez cada
+        ``INTERVALO_VERIFICACION_VERSION`` segundos; entre consultas se asume
+        que no cambió.
+
+        Returns:
+            True si el caché local fue invalidado
+        """
+        ahora = time.monotonic()
+        if ahora - self._verificado_en < INTERVALO_VERIFICACION_VERSION:
+            return False
+        self._verificado_en = ahora
+
+        version = obtener_version_feriados()
+        if version == self._version:
+            return False
+
+        with self._lock:
+            if version == self._version:
+                return False
+            self._por_ano = {}
+            self._version = version
+        return True
+
+    def feriados_del_ano(self, ano: int) -> FrozenSet[date]:
+        """
+        Obtiene todos los días inhábiles (fuera de fines de semana) de un año.
+
+        Args:
+            ano: Año a consultar
+
+        Returns:
+            Conjunto inmutable de fechas
+        """
+        feriados = self._por_ano.get(ano)
+        if feriados is not None:
+            return feriados
+
+        dias = _feriados_nacionales(ano)
+        try:
+            dias |= _cierres_judiciales(ano)
+        except DatabaseError:
+            # Tabla no disponible (p. ej. antes de migrar): no se guarda en caché
+            logger.warning('No se pudieron leer los feriados judiciales de %s', ano)
+            return frozenset(dias)
+
+        feriados = frozenset(dias)
+        with self._lock:
+            self._por_ano[ano] = feriados
+        return feriados
+
+
+_cache_feriados = CacheFeriados()
+
+
+def obtener_cache_feriados() -> CacheFeriados:
+    """
+    Obtiene el caché de feriados compartido por el proceso.
+
+    Returns:
+        Instancia única de CacheFeriados
+    """
+    return _cache_feriados
@@ -0,0 +1,237 @@
+"""
+Compilador de filtros del calendario (``FiltroPlazosForm``) a un QuerySet.
+
+Todas las vistas que listan o exportan plazos (calendario, JSON, PDF, ICS,
+Excel y CSV) compilan los filtros aquí, por lo que devuelven exactamente los
+mismos plazos para los mismos parámetros:
+
+- Las condiciones se reúnen en un único árbol ``Q`` y se fusionan las
+  redundantes: los estados permitidos por ``estado``, ``solo_vencidos`` y
+  ``solo_urgentes`` se intersectan y los límites de fecha se reducen a un
+  solo rango. Si la intersección es vacía no se consulta la base de datos.
+- Cada consumidor indica las columnas que necesita (``PROYECCIONES``).
+- ``clave`` identifica el conjunto de resultados y ``clave_orden`` además su
+  orden; son estables (no dependen del orden ni de la forma de los parámetros)
+  y sirven como claves de caché.
+- La selección explícita de plazos (``plazos=<id>``) siempre se limita al usuario.
+"""
+
+import hashlib
+import json
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+
+from django.db.models import Q
+from django.utils.datastructures import MultiValueDict
+
+from .estados import fecha_hoy_tribunales
+from .indice_ciego import filtro_clave_cliente, normalizar_clave
+from .paginacion import campos_orden
+
+ORDEN_POR_DEFECTO = 'fecha_vencimiento'
+DIRECCION_POR_DEFECTO = 'asc'
+
+PARAMETRO_SELECCION = 'plazos'
+
+ESTADOS_URGENTES = ('corriendo', 'pendiente')
+
+DIAS_URGENCIA = 3
+
+# Columnas que carga cada consumidor; incluyen los campos de orden que usa el cursor
+PROYECCIONES = {
+    'calendario': [
+        'id', 'tipo_documento', 'procedimiento', 'fecha_inicio', 'fecha_vencimiento',
+        'estado', 'rol', 'rut_cliente',
+    ],
+    'json': ['id', 'tipo_documento', 'rol', 'fecha_vencimiento', 'estado'],
+}
+
+
+class FiltroCompilado:
+    """
+    Resultado de compilar los filtros: condición, orden y claves de caché.
+
+    Attributes:
+        condicion: Árbol ``Q`` con todos los filtros (sin el usuario)
+        vacio: True si los filtros no pueden coincidir con ningún plazo
+        ordenar_por: Campo de orden elegido
+        direccion: 'asc' o 'desc'
+        criterios: Dict canónico de los filtros, base de las claves
+    """
+
+    def __init__(self, condicion: Q, vacio: bool, ordenar_por: str, direccion: str, criterios: dict):
+        self.condicion = condicion
+        self.vacio = vacio
+        self.ordenar_por = ordenar_por
+        self.direccion = direccion
+        self.criterios = criterios
+
+    @property
+    def clave(self) -> str:
+        """Clave estable del conjunto de resultados (sin el orden)."""
+        return _hash(self.criterios)
+
+    @property
+    def clave_orden(self) -> str:
+        """Clave estable del conjunto de resultados y su orden."""
+        return _hash([self.criterios, self.ordenar_por, self.direccion])
+
+    def queryset(self, usuario_id: int, consumidor: Optional[str] = None, ordenar: bool = True):
+        """
+        Construye el QuerySet de los plazos del usuario que cumplen los filtros.
+
+        Args:
+            usuario_id: Dueño de los plazos
+            consumidor: Clave de ``PROYECCIONES`` para cargar solo esas columnas
+            ordenar: Si es False no se aplica el orden (por ejemplo para contar)
+
+        Returns:
+            QuerySet de PlazoJudicial (``none()`` si los filtros son contradictorios)
+        """
+        from plazos.models import PlazoJudicial
+
+        if self.vacio:
+            return PlazoJudicial.objects.none()
+        plazos = PlazoJudicial.objects.filter(Q(usuario_id=usuario_id) & self.condicion)
+        if consumidor:
+            plazos = plazos.only(*PROYECCIONES[consumidor])
+        if ordenar:
+            plazos = ordenar_plazos(plazos, self.ordenar_por, self.direccion)
+        return plazos
+
+
+def _hash(valor) -> str:
+    serializado = json.dumps(valor, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(serializado.encode()).hexdigest()[:32]
+
+
+def _texto(valor) -> str:
+    """Texto de búsqueda normalizado para la clave (las búsquedas no distinguen mayúsculas)."""
+    return (valor or '').strip().lower()
+
+
+def compilar_filtros(datos: Optional[dict] = None, seleccionados: Optional[Iterable[int]] = None) -> FiltroCompilado:
+    """
+    Compila los datos limpios de ``FiltroPlazosForm`` en un ``FiltroCompilado``.
+
+    Args:
+        datos: ``cleaned_data`` del formulario, o None si no es válido (sin filtros)
+        seleccionados: Ids elegidos explícitamente; si se indican, reemplazan a
+            los filtros y el orden es el predeterminado
+
+    Returns:
+        FiltroCompilado
+    """
+    if seleccionados is not None:
+        ids = sorted({int(id_) for id_ in seleccionados})
+        return FiltroCompilado(
+            Q(id__in=ids), not ids, ORDEN_POR_DEFECTO, DIRECCION_POR_DEFECTO, {'ids': ids},
+        )
+
+    datos = datos or {}
+    condiciones: List[Q] = []
+    criterios: Dict[str, object] = {}
+
+    for campo in ('tipo_documento', 'procedimiento'):
+        if datos.get(campo):
+            condiciones.append(Q(**{campo: datos[campo]}))
+            criterios[campo] = datos[campo]
+
+    # Estados permitidos: intersección de estado, solo_vencidos y solo_urgentes
+    estados = None
+    if datos.get('estado'):
+        estados = {datos['estado']}
+    if datos.get('solo_vencidos'):
+        estados = {'vencido'} if estados is None else estados & {'vencido'}
+    if datos.get('solo_urgentes'):
+        estados = set(ESTADOS_URGENTES) if estados is None else estados & set(ESTADOS_URGENTES)
+
+    # Rango de vencimiento: el límite más restrictivo de cada lado
+    desde = datos.get('fecha_desde')
+    hasta = datos.get('fecha_hasta')
+    if datos.get('solo_urgentes'):
+        limite_urgencia = fecha_hoy_tribunales() + timedelta(days=DIAS_URGENCIA)
+        hasta = min(hasta, limite_urgencia) if hasta else limite_urgencia
+
+    vacio = estados == set() or bool(desde and hasta and desde > hasta)
+
+    if estados is not None:
+        ordenados = sorted(estados)
+        if len(ordenados) == 1:
+            condiciones.append(Q(estado=ordenados[0]))
+        elif ordenados:
+            condiciones.append(Q(estado__in=ordenados))
+        criterios['estados'] = ordenados
+    if desde:
+        condiciones.append(Q(fecha_vencimiento__gte=desde))
+        criterios['vencimiento_desde'] = desde.isoformat()
+    if hasta:
+        condiciones.append(Q(fecha_vencimiento__lte=hasta))
+        criterios['vencimiento_hasta'] = hasta.isoformat()
+
+    # Búsqueda general: rol, clave del cliente (índice ciego) y observaciones
+    busqueda = (datos.get('busqueda') or '').strip()
+    if busqueda:
+        exacta = bool(datos.get('busqueda_exacta'))
+        incluir_observaciones = datos.get('incluir_observaciones', True)
+        if exacta:
+            busqueda_q = Q(rol__iexact=busqueda) | filtro_clave_cliente(busqueda, exacta=True)
+            if incluir_observaciones:
+                busqueda_q |= Q(observaciones__iexact=busqueda)
+        else:
+            busqueda_q = Q(rol__icontains=busqueda) | filtro_clave_cliente(busqueda)
+            if incluir_observaciones:
+                busqueda_q |= Q(observaciones__icontains=busqueda)
+        condiciones.append(busqueda_q)
+        criterios['busqueda'] = [_texto(busqueda), exacta, bool(incluir_observaciones)]
+
+    # Búsqueda específica
+    for campo in ('rol', 'rut_cliente'):
+        valor = (datos.get(campo) or '').strip()
+        if valor:
+            condiciones.append(Q(**{f'{campo}__icontains': valor}))
+            criterios[campo] = _texto(valor)
+    clave_cliente = (datos.get('clave_cliente') or '').strip()
+    if clave_cliente:
+        condiciones.append(filtro_clave_cliente(clave_cliente))
+        criterios['clave_cliente'] = normalizar_clave(clave_cliente)
+
+    ordenar_por = datos.get('ordenar_por') or ORDEN_POR_DEFECTO
+    direccion = datos.get('direccion_orden') or DIRECCION_POR_DEFECTO
+    return FiltroCompilado(Q(*condiciones), vacio, ordenar_por, direccion, criterios)
+
+
+def compilar_parametros(parametros) -> FiltroCompilado:
+    """
+    Compila los parámetros de una petición (``request.GET``) o un dict de listas.
+
+    Args:
+        parametros: QueryDict o dict ``{parámetro: [valores]}``
+
+    Returns:
+        FiltroCompilado; los parámetros inválidos se ignoran igual que en el calendario
+    """
+    from plazos.forms import FiltroPlazosForm
+
+    if not hasattr(parametros, 'getlist'):
+        parametros = MultiValueDict(parametros)
+
+    seleccionados = parametros.getlist(PARAMETRO_SELECCION)
+    if seleccionados:
+        return compilar_filtros(seleccionados=[v for v in seleccionados if str(v).isdigit()])
+
+    form_filtro = FiltroPlazosForm(parametros)
+    return compilar_filtros(form_filtro.cleaned_data if form_filtro.is_valid() else None)
+
+
+def ordenar_plazos(plazos, ordenar_por: str = ORDEN_POR_DEFECTO, direccion: str = DIRECCION_POR_DEFECTO):
+    """
+    Ordena los plazos igual que el calendario (con los mismos campos de desempate).
+
+    Args:
+        plazos: QuerySet de PlazoJudicial
+        ordenar_por: Campo elegido en el formulario de filtros
+        direccion: 'asc' o 'desc'; se aplica a todos los campos de orden
+    """
+    prefijo = '-' if direccion == 'desc' else ''
+    return plazos.order_by(*(prefijo + campo for campo in campos_orden(ordenar_por)))
@@ -0,0 +1,275 @@
+"""
+Generación de calendarios iCalendar (RFC 5545) por streaming.
+
+El documento se produce como un generador de fragmentos de texto: los plazos
+se leen con ``.iterator(chunk_size=...)`` cargando solo los campos necesarios,
+las claves de cliente se descifran por lotes y cada línea se escapa y pliega
+según la RFC 5545 (máximo 75 octetos por línea, terminadas en CRLF). La
+memoria usada no depende de la cantidad de plazos.
+
+El feed de suscripción (``estado_feed`` / ``obtener_cuerpo_feed``) admite GET
+condicional: el ETag se calcula con el máximo ``updated_at`` y la cantidad de
+plazos del usuario en una sola consulta, y el cuerpo ya generado se guarda en
+el caché bajo ese ETag.
+"""
+
+import hashlib
+from datetime import timedelta, timezone as tz
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from .cifrado import descifrar_lote
+
+TAMANO_LOTE_ICS = 2000
+
+CAMPOS_ICS = [
+    'id', 'tipo_documento', 'procedimiento', 'estado', 'fecha_vencimiento', 'rol', 'clave_cliente',
+    'updated_at',
+]
+
+FIN_LINEA = '\r\n'
+
+LARGO_MAXIMO_LINEA = 75  # octetos, sin contar el CRLF
+
+# Cambiar si cambia el formato de los eventos, para invalidar ETags y cachés
+VERSION_FEED = 2
+
+DURACION_CACHE_FEED = 24 * 60 * 60  # segundos
+
+# Los cuerpos más grandes se generan por streaming en cada petición
+TAMANO_MAXIMO_CACHE_FEED = 5 * 1024 * 1024  # bytes
+
+ENCABEZADO_ICS = [
+    'BEGIN:VCALENDAR',
+    'VERSION:2.0',
+    'PRODID:-//Calendario Judicial//ES',
+    'CALSCALE:GREGORIAN',
+]
+
+
+def escapar_texto(valor) -> str:
+    """
+    Escapa un valor de tipo TEXT (RFC 5545, sección 3.3.11).
+
+    Args:
+        valor: Texto a escapar
+
+    Returns:
+        Texto con ``\\``, ``;``, ``,`` y saltos de línea escapados
+    """
+    texto = '' if valor is None else str(valor)
+    return (
+        texto.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+        .replace('\r', '\\n')
+    )
+
+
+def plegar_linea(linea: str) -> str:
+    """
+    Pliega una línea de contenido a 75 octetos (RFC 5545, sección 3.1).
+
+    Nunca corta en medio de un carácter UTF-8 multibyte.
+
+    Args:
+        linea: Línea sin terminador
+
+    Returns:
+        Línea plegada terminada en CRLF
+    """
+    datos = linea.encode('utf-8')
+    if len(datos) <= LARGO_MAXIMO_LINEA:
+        return linea + FIN_LINEA
+
+    partes = []
+    inicio = 0
+    limite = LARGO_MAXIMO_LINEA
+    while len(datos) - inicio > limite:
+        corte = inicio + limite
+        # Retroceder si el corte cae en un byte de continuación (10xxxxxx)
+        while datos[corte] & 0xC0 == 0x80:
+            corte -= 1
+        partes.append(datos[inicio:corte])
+        inicio = corte
+        limite = LARGO_MAXIMO_LINEA - 1  # las continuaciones empiezan con un espacio
+    partes.append(datos[inicio:])
+    return (b'\r\n '.join(partes)).decode('utf-8') + FIN_LINEA
+
+
+def etiquetas_plazo() -> Dict[str, Dict[str, str]]:
+    """
+    Obtiene los nombres para mostrar de los campos con opciones usados en el evento.
+
+    Equivale a ``get_<campo>_display()`` sin su costo por fila.
+    """
+    from plazos.models import PlazoJudicial
+
+    return {
+        campo: {str(valor): str(nombre) for valor, nombre in PlazoJudicial._meta.get_field(campo).flatchoices}
+        for campo in ('tipo_documento', 'procedimiento', 'estado')
+    }
+
+
+def lineas_evento(plazo, clave: str, etiquetas: Dict[str, Dict[str, str]]) -> List[str]:
+    """
+    Construye las líneas de contenido de un VEVENT para un plazo.
+
+    Args:
+        plazo: Instancia de PlazoJudicial (con al menos CAMPOS_ICS cargados)
+        clave: Clave del cliente ya descifrada
+        etiquetas: Resultado de ``etiquetas_plazo()``
+
+    El vencimiento es un evento de día completo: ``DTEND`` es exclusivo, por lo
+    que apunta al día siguiente. ``DTSTAMP`` (obligatorio) es la última
+    modificación del plazo, así el documento no cambia mientras no cambien los datos.
+
+    Returns:
+        Lista de líneas sin plegar
+    """
+    inicio = plazo.fecha_vencimiento.strftime('%Y%m%d')
+    fin = (plazo.fecha_vencimiento + timedelta(days=1)).strftime('%Y%m%d')
+    sello = plazo.updated_at.astimezone(tz.utc).strftime('%Y%m%dT%H%M%SZ')
+    tipo_documento = etiquetas['tipo_documento'].get(plazo.tipo_documento, plazo.tipo_documento)
+    procedimiento = etiquetas['procedimiento'].get(plazo.procedimiento, plazo.procedimiento)
+    estado = etiquetas['estado'].get(plazo.estado, plazo.estado)
+    descripcion = f"Procedimiento: {procedimiento}\nEstado: {estado}\nClave: {clave}"
+    return [
+        'BEGIN:VEVENT',
+        f'UID:plazo-{plazo.id}@calendario-judicial.local',
+        f'SUMMARY:{escapar_texto(f"{tipo_documento} - {plazo.rol}")}',
+        f'DTSTAMP:{sello}',
+        f'DTSTART;VALUE=DATE:{inicio}',
+        f'DTEND;VALUE=DATE:{fin}',
+        f'DESCRIPTION:{escapar_texto(descripcion)}',
+        'END:VEVENT',
+    ]
+
+
+def en_lotes(iterable: Iterable, tamano: int) -> Iterator[list]:
+    """Agrupa un iterable en listas de hasta ``tamano`` elementos."""
+    iterador = iter(iterable)
+    while True:
+        lote = list(islice(iterador, tamano))
+        if not lote:
+            return
+        yield lote
+
+
+def generar_ics(plazos, tamano_lote: int = TAMANO_LOTE_ICS) -> Iterator[str]:
+    """
+    Genera un calendario iCalendar a partir de un QuerySet de plazos.
+
+    Args:
+        plazos: QuerySet de PlazoJudicial ya filtrado y ordenado
+        tamano_lote: Filas leídas de la base de datos por lote
+
+    Yields:
+        Fragmentos de texto del documento (encabezado, un fragmento por lote, cierre)
+
+    Returns:
+        Cantidad de eventos generados (valor de ``StopIteration``)
+    """
+    yield ''.join(plegar_linea(linea) for linea in ENCABEZADO_ICS)
+
+    eventos = 0
+
+    filas = (
+        plazos.filter(fecha_vencimiento__isnull=False)
+        .only(*CAMPOS_ICS)
+        .iterator(chunk_size=tamano_lote)
+    )
+    etiquetas = etiquetas_plazo()
+    for lote in en_lotes(filas, tamano_lote):
+        claves = descifrar_lote(plazo.clave_cliente for plazo in lote)
+        eventos += len(lote)
+        yield ''.join(
+            plegar_linea(linea)
+            for plazo, clave in zip(lote, claves)
+            for linea in lineas_evento(plazo, clave, etiquetas)
+        )
+
+    yield plegar_linea('END:VCALENDAR')
+    return eventos
+
+
+def plazos_feed(usuario_id: int):
+    """QuerySet de los plazos incluidos en el feed de suscripción de un usuario."""
+    from plazos.models import PlazoJudicial
+
+    return PlazoJudicial.objects.filter(usuario_id=usuario_id).order_by('fecha_vencimiento', 'fecha_inicio')
+
+
+def _etag_feed(usuario_id: int, ultima, total: int) -> str:
+    firma = f"{VERSION_FEED}:{usuario_id}:{ultima.isoformat() if ultima else '-'}:{total}"
+    return hashlib.sha256(firma.encode()).hexdigest()[:32]
+
+
+def estado_feed(token: str) -> Optional[Tuple[int, str, Optional[object]]]:
+    """
+    Resuelve el token de suscripción y calcula el ETag del feed en una consulta.
+
+    El ETag se basa en el máximo ``updated_at`` y la cantidad de plazos del
+    usuario: cualquier alta, edición, eliminación o actualización masiva lo cambia.
+
+    Args:
+        token: Token de la URL de suscripción
+
+    Returns:
+        Tupla ``(usuario_id, etag, ultima_modificacion)``, o None si el token no
+        existe; la fecha es None si el usuario no tiene plazos
+    """
+    from plazos.models import SuscripcionCalendario
+
+    resumen = (
+        SuscripcionCalendario.objects
+        .filter(token=token)
+        .values('usuario_id')
+        .annotate(ultima_modificacion=Max('usuario__plazos__updated_at'), total=Count('usuario__plazos'))
+        .order_by()[:1]
+    )
+    if not resumen:
+        return None
+    resumen = resumen[0]
+    ultima = resumen['ultima_modificacion']
+    usuario_id = resumen['usuario_id']
+    return usuario_id, _etag_feed(usuario_id, ultima, resumen['total']), ultima
+
+
+def obtener_cuerpo_feed(usuario_id: int, etag: str) -> Iterator[str]:
+    """
+    Obtiene el cuerpo del feed desde el caché o lo genera.
+
+    Args:
+        usuario_id: Id del usuario
+        etag: ETag calculado con ``estado_feed``
+
+    Returns:
+        Iterable de fragmentos de texto del documento
+    """
+    clave = f'plazos:feed_ics:{usuario_id}:{etag}'
+    cuerpo = cache.get(clave)
+    if cuerpo is not None:
+        return [cuerpo]
+    return _generar_y_guardar(plazos_feed(usuario_id), clave)
+
+
+def _generar_y_guardar(plazos, clave: str) -> Iterator[str]:
+    """Genera el documento por streaming y lo guarda en caché si no es muy grande."""
+    partes = []
+    tamano = 0
+    for parte in generar_ics(plazos):
+        if partes is not None:
+            tamano += len(parte)
+            if tamano > TAMANO_MAXIMO_CACHE_FEED:
+                partes = None
+            else:
+                partes.append(parte)
+        yield parte
+    if partes is not None:
+        cache.set(clave, ''.join(partes), DURACION_CACHE_FEED)
@@ -0,0 +1,162 @@
+"""
+Índice ciego (blind index) para buscar por la clave del cliente sin descifrarla.
+
+La clave del cliente se guarda cifrada con Fernet, por lo que no se puede
+filtrar con ``icontains`` ni ``iexact``. En su lugar se guarda un HMAC con
+clave secreta del valor normalizado:
+
+- ``PlazoJudicial.clave_cliente_hash``: HMAC de la clave completa (búsqueda exacta).
+- ``TokenClaveCliente``: HMAC de cada prefijo de la clave entre
+  ``LARGO_MINIMO_PREFIJO`` y ``LARGO_MAXIMO_PREFIJO`` caracteres (búsqueda por prefijo).
+
+Ambas búsquedas son igualdades sobre columnas indexadas. La clave del HMAC es
+``settings.BLIND_INDEX_KEY``; si cambia, hay que ejecutar ``indexar_claves_cliente``.
+"""
+
+import unicodedata
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils.crypto import salted_hmac
+
+from .cifrado import descifrar
+
+LARGO_MINIMO_PREFIJO = 3
+LARGO_MAXIMO_PREFIJO = 32
+
+LARGO_TOKEN = 32  # caracteres hexadecimales (128 bits)
+
+_SAL_EXACTA = 'plazos.clave_cliente.exacta'
+_SAL_PREFIJO = 'plazos.clave_cliente.prefijo'
+
+
+def normalizar_clave(valor: Optional[str]) -> str:
+    """
+    Normaliza una clave para el índice: sin espacios extremos, sin tildes y en minúsculas.
+
+    Args:
+        valor: Clave en texto plano
+
+    Returns:
+        Clave normalizada
+    """
+    if not valor:
+        return ''
+    sin_tildes = unicodedata.normalize('NFKD', valor.strip())
+    sin_tildes = ''.join(c for c in sin_tildes if not unicodedata.combining(c))
+    return sin_tildes.casefold()
+
+
+def _hmac(sal: str, valor: str) -> str:
+    secreto = getattr(settings, 'BLIND_INDEX_KEY', None) or settings.SECRET_KEY
+    return salted_hmac(sal, valor, secret=secreto, algorithm='sha256').hexdigest()[:LARGO_TOKEN]
+
+
+def indice_exacto(valor: Optional[str]) -> str:
+    """
+    Calcula el índice ciego de una clave completa.
+
+    Args:
+        valor: Clave en texto plano
+
+    Returns:
+        HMAC hexadecimal, o cadena vacía si la clave está vacía
+    """
+    normalizada = normalizar_clave(valor)
+    return _hmac(_SAL_EXACTA, normalizada) if normalizada else ''
+
+
+def token_prefijo(prefijo: str) -> Optional[str]:
+    """
+    Calcula el token ciego de un prefijo de búsqueda.
+
+    Los prefijos más largos que ``LARGO_MAXIMO_PREFIJO`` se truncan, por lo que
+    pueden devolver falsos positivos que coinciden solo en ese tramo.
+
+    Args:
+        prefijo: Texto ingresado en la búsqueda
+
+    Returns:
+        HMAC hexadecimal, o None si el prefijo es demasiado corto
+    """
+    normalizado = normalizar_clave(prefijo)
+    if len(normalizado) < LARGO_MINIMO_PREFIJO:
+        return None
+    return _hmac(_SAL_PREFIJO, normalizado[:LARGO_MAXIMO_PREFIJO])
+
+
+def tokens_prefijo(valor: Optional[str]) -> List[str]:
+    """
+    Calcula los tokens ciegos de todos los prefijos indexables de una clave.
+
+    Args:
+        valor: Clave en texto plano
+
+    Returns:
+        Lista de HMAC, uno por largo de prefijo
+    """
+    normalizada = normalizar_clave(valor)[:LARGO_MAXIMO_PREFIJO]
+    return [
+        _hmac(_SAL_PREFIJO, normalizada[:largo])
+        for largo in range(LARGO_MINIMO_PREFIJO, len(normalizada) + 1)
+    ]
+
+
+def clave_en_claro(valor: Optional[str]) -> str:
+    """
+    Obtiene el texto plano de un valor de ``clave_cliente``.
+
+    Los registros antiguos pueden tener la clave sin cifrar; en ese caso se
+    devuelve tal cual. Un token que ninguna clave descifra devuelve cadena
+    vacía: no se indexa.
+    """
+    return descifrar(valor, no_descifrable='')
+
+
+def sincronizar_tokens(claves: Dict[int, str]) -> None:
+    """
+    Reemplaza los tokens de prefijo de los plazos dados.
+
+    Args:
+        claves: Dict ``{id del plazo: clave en texto plano}``
+    """
+    from plazos.models import TokenClaveCliente
+
+    if not claves:
+        return
+    with transaction.atomic():
+        TokenClaveCliente.objects.filter(plazo_id__in=list(claves)).delete()
+        TokenClaveCliente.objects.bulk_create([
+            TokenClaveCliente(plazo_id=plazo_id, token=token)
+            for plazo_id, clave in claves.items()
+            for token in tokens_prefijo(clave)
+        ], batch_size=5000)
+
+
+def filtro_clave_cliente(texto: str, exacta: bool = False) -> Q:
+    """
+    Construye el filtro de búsqueda por clave del cliente usando el índice ciego.
+
+    Args:
+        texto: Clave (o comienzo de la clave) buscada
+        exacta: Si es True solo busca la clave completa
+
+    Returns:
+        Q aplicable a un QuerySet de PlazoJudicial; no coincide con nada si
+        el texto está vacío
+    """
+    from plazos.models import PlazoJudicial, TokenClaveCliente
+
+    indice = indice_exacto(texto)
+    if not indice:
+        return Q(pk__in=[])
+
+    # Como subconsultas por id: así el motor parte del índice ciego aunque el
+    # filtro se combine con otros (usuario, OR con rol u observaciones)
+    filtro = Q(pk__in=PlazoJudicial.objects.filter(clave_cliente_hash=indice).values('pk'))
+    token = None if exacta else token_prefijo(texto)
+    if token:
+        filtro |= Q(pk__in=TokenClaveCliente.objects.filter(token=token).values('plazo_id'))
+    return filtro
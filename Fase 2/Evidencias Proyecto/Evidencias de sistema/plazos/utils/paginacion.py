@@ -0,0 +1,264 @@
+"""
+Paginación por cursor (keyset) para el listado del calendario.
+
+En lugar de ``OFFSET n LIMIT 20`` cada página se pide a partir de los valores
+de la última (o primera) fila de la página anterior, ordenando siempre por
+``(campo elegido, fecha_vencimiento, fecha_inicio, id)``. Así cualquier página
+cuesta lo mismo que la primera y aprovecha el índice
+``(usuario, fecha_vencimiento, fecha_inicio)``. Si además se conoce la lista
+ordenada de ids del filtro (``cache_resultados``) la página se lee con
+``id__in`` sobre el tramo que le corresponde.
+
+Los cursores son opacos: se firman con ``django.core.signing`` e incluyen el
+orden con el que fueron generados, por lo que un cursor manipulado o de otro
+orden simplemente devuelve la primera página.
+"""
+
+from typing import Any, List, Optional
+
+from django.core import signing
+from django.db.models import Q
+
+POR_PAGINA_DEFECTO = 20
+
+CAMPOS_DESEMPATE = ('fecha_vencimiento', 'fecha_inicio', 'id')
+
+SAL_CURSOR = 'plazos.calendario.cursor'
+
+_SIGUIENTE = 's'
+_ANTERIOR = 'a'
+
+
+def campos_orden(ordenar_por: str) -> List[str]:
+    """
+    Obtiene la lista completa de campos de ordenamiento para un campo elegido.
+
+    Args:
+        ordenar_por: Campo elegido en el formulario de filtros
+
+    Returns:
+        Lista de campos que determina un orden total
+    """
+    return [ordenar_por] + [campo for campo in CAMPOS_DESEMPATE if campo != ordenar_por]
+
+
+class PaginaCursor:
+    """
+    Página de resultados con cursores a la página siguiente y anterior.
+
+    Expone la misma interfaz que usan las plantillas de ``Page`` de Django
+    (iteración, ``has_next``, ``start_index``...) salvo los números de página.
+    """
+
+    def __init__(self, objetos, antes, total, cursor_siguiente=None,
+                 cursor_anterior=None, cursor_ultima=None):
+        self.object_list = objetos
+        self.antes = antes
+        self.total = total
+        self.cursor_siguiente = cursor_siguiente
+        self.cursor_anterior = cursor_anterior
+        self.cursor_ultima = cursor_ultima
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.cursor_siguiente is not None
+
+    def has_previous(self):
+        return self.cursor_anterior is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def start_index(self):
+        return self.antes + 1 if self.object_list else 0
+
+    def end_index(self):
+        return self.antes + len(self.object_list)
+
+
+def _serializar(valor: Any) -> Any:
+    """Convierte un valor de campo a un tipo serializable en JSON."""
+    return valor.isoformat() if hasattr(valor, 'isoformat') else valor
+
+
+def _codificar(ordenar_por, descendente, sentido, valores, antes) -> str:
+    """Genera un cursor firmado."""
+    return signing.dumps(
+        {
+            'o': ordenar_por,
+            'd': descendente,
+            's': sentido,
+            'v': [_serializar(valor) for valor in valores] if valores is not None else None,
+            'n': antes,
+        },
+        salt=SAL_CURSOR,
+        compress=True,
+    )
+
+
+def _decodificar(cursor: Optional[str], modelo, ordenar_por: str, descendente: bool):
+    """
+    Lee un cursor y valida que corresponda al orden actual.
+
+    Returns:
+        Tupla ``(sentido, valores, antes)`` o None si el cursor no es válido
+    """
+    if not cursor:
+        return None
+    try:
+        datos = signing.loads(cursor, salt=SAL_CURSOR)
+    except signing.BadSignature:
+        return None
+    if datos.get('o') != ordenar_por or datos.get('d') != descendente:
+        return None
+
+    valores = datos.get('v')
+    if valores is not None:
+        campos = campos_orden(ordenar_por)
+        if len(valores) != len(campos):
+            return None
+        valores = [
+            modelo._meta.get_field(campo).to_python(valor)
+            for campo, valor in zip(campos, valores)
+        ]
+    return datos.get('s'), valores, max(0, int(datos.get('n', 0)))
+
+
+def _condicion_posterior(campos: List[str], valores: List[Any], descendente: bool) -> Q:
+    """
+    Construye la condición "fila posterior a ``valores``" en el orden dado.
+
+    Equivale a la comparación de tuplas ``(a, b, c) > (x, y, z)`` expandida como
+    ``a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)``, precedida de
+    ``a >= x``: sin esa condición el índice (usuario, a, b, ...) solo acota por
+    usuario y las páginas profundas recorren la tabla.
+    """
+    operador = 'lt' if descendente else 'gt'
+    condicion = Q()
+    iguales = {}
+    for campo, valor in zip(campos, valores):
+        condicion |= Q(**iguales, **{f'{campo}__{operador}': valor})
+        iguales[campo] = valor
+    return Q(**{f"{campos[0]}__{operador}e": valores[0]}) & condicion
+
+
+def _filas_cursor(queryset, campos: List[str], descendente: bool, sentido: str, valores: Optional[List[Any]]):
+    """Filas a partir de la posición del cursor, en el sentido de lectura (sin LIMIT)."""
+    # Hacia atrás se lee en orden inverso y luego se da vuelta la página
+    inverso = descendente if sentido != _ANTERIOR else not descendente
+    filas = queryset.order_by(*(f'-{campo}' if inverso else campo for campo in campos))
+    if valores is not None:
+        filas = filas.filter(_condicion_posterior(campos, valores, inverso))
+    return filas
+
+
+def consulta_cursor(queryset, ordenar_por: str = 'fecha_vencimiento', direccion: str = 'asc',
+                    cursor: Optional[str] = None):
+    """
+    QuerySet que ``paginar_por_cursor`` consulta para un cursor, sin el LIMIT de la página.
+
+    Sirve para inspeccionar la consulta real (por ejemplo con ``explain()``).
+    Un cursor inválido equivale a la primera página.
+    """
+    descendente = direccion == 'desc'
+    posicion = _decodificar(cursor, queryset.model, ordenar_por, descendente)
+    sentido, valores, _ = posicion if posicion else (_SIGUIENTE, None, 0)
+    return _filas_cursor(queryset, campos_orden(ordenar_por), descendente, sentido, valores)
+
+
+def _tramo_de_ids(ids, completo: bool, campos: List[str], sentido: str,
+                  valores: Optional[List[Any]], antes: int, por_pagina: int):
+    """
+    Ubica la página pedida dentro de una lista de ids ya ordenada.
+
+    La posición sale del ``antes`` del cursor y se comprueba con el id de la
+    fila límite que guarda el cursor; si no coincide (los datos cambiaron) o la
+    página queda fuera de una lista truncada, se usa la consulta por cursor.
+
+    Returns:
+        Tupla ``(ids de la página, antes, hay_anterior, hay_siguiente)`` o None
+    """
+    limite = valores[campos.index('id')] if valores is not None else None
+
+    if sentido == _ANTERIOR:
+        fin = antes if limite is not None else (len(ids) if completo else None)
+        if fin is None or fin > len(ids) or (limite is not None and (fin == len(ids) or ids[fin] != limite)):
+            return None
+        inicio = max(0, fin - por_pagina)
+        return list(ids[inicio:fin]), inicio, inicio > 0, limite is not None
+
+    inicio = antes if limite is not None else 0
+    if limite is not None and (inicio == 0 or inicio > len(ids) or ids[inicio - 1] != limite):
+        return None
+    if inicio + por_pagina >= len(ids) and not completo:
+        return None
+    return list(ids[inicio:inicio + por_pagina]), inicio, limite is not None, inicio + por_pagina < len(ids)
+
+
+def paginar_por_cursor(queryset, ordenar_por: str = 'fecha_vencimiento', direccion: str = 'asc',
+                       cursor: Optional[str] = None, por_pagina: int = POR_PAGINA_DEFECTO,
+                       total: Optional[int] = None, ids=None, ids_completos: bool = True) -> PaginaCursor:
+    """
+    Obtiene una página de un queryset usando paginación por cursor.
+
+    Args:
+        queryset: QuerySet ya filtrado (su orden se reemplaza)
+        ordenar_por: Campo principal de ordenamiento
+        direccion: 'asc' o 'desc'; se aplica a todos los campos de orden
+        cursor: Cursor recibido de una página anterior (None para la primera)
+        por_pagina: Cantidad de filas por página
+        total: Total de filas del queryset, si ya se conoce (para "última página")
+        ids: Ids del queryset en este mismo orden (ver ``cache_resultados``); si
+            contienen la página pedida, sus filas se leen con ``id__in``
+        ids_completos: False si ``ids`` es solo un prefijo de los resultados
+
+    Returns:
+        PaginaCursor con las filas y los cursores de navegación
+    """
+    descendente = direccion == 'desc'
+    campos = campos_orden(ordenar_por)
+
+    posicion = _decodificar(cursor, queryset.model, ordenar_por, descendente)
+    sentido, valores, antes = posicion if posicion else (_SIGUIENTE, None, 0)
+
+    tramo = None
+    if ids is not None:
+        tramo = _tramo_de_ids(ids, ids_completos, campos, sentido, valores, antes, por_pagina)
+    if tramo is not None:
+        ids_pagina, antes, hay_anterior, hay_siguiente = tramo
+        por_id = queryset.in_bulk(ids_pagina)
+        objetos = [por_id[id_] for id_ in ids_pagina if id_ in por_id]
+    elif sentido == _ANTERIOR:
+        filas = _filas_cursor(queryset, campos, descendente, sentido, valores)
+        objetos = list(filas[:por_pagina + 1])
+        hay_anterior = len(objetos) > por_pagina
+        objetos = objetos[:por_pagina][::-1]
+        antes = max(0, antes - len(objetos)) if hay_anterior else 0
+        hay_siguiente = valores is not None
+    else:
+        filas = _filas_cursor(queryset, campos, descendente, sentido, valores)
+        objetos = list(filas[:por_pagina + 1])
+        hay_siguiente = len(objetos) > por_pagina
+        objetos = objetos[:por_pagina]
+        hay_anterior = valores is not None
+
+    def valores_de(objeto):
+        return [getattr(objeto, campo) for campo in campos]
+
+    pagina = PaginaCursor(objetos, antes, total)
+    if objetos and hay_siguiente:
+        pagina.cursor_siguiente = _codificar(
+            ordenar_por, descendente, _SIGUIENTE, valores_de(objetos[-1]), antes + len(objetos)
+        )
+        if total is not None:
+            pagina.cursor_ultima = _codificar(ordenar_por, descendente, _ANTERIOR, None, total)
+    if objetos and hay_anterior:
+        pagina.cursor_anterior = _codificar(
+            ordenar_por, descendente, _ANTERIOR, valores_de(objetos[0]), antes
+        )
+    return pagina
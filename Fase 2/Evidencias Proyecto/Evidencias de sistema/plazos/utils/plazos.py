@@ -4,8 +4,10 @@ Incluye lógica para días hábiles, feriados y cálculos de vencimiento.
 """
 
 from datetime import date, timedelta
-import holidays
-from typing import Optional
+from typing import List, Optional, Sequence, Union
+
+from .dias_habiles import obtener_calendario_habil
+from .feriados import obtener_cache_feriados
 
 
 def es_dia_habil(fecha: date, pais: str = 'Chile') -> bool:
@@ -19,18 +21,14 @@ def es_dia_habil(fecha: date, pais: str = 'Chile') -> bool:
     Returns:
         True si es día hábil, False en caso contrario
     """
-    # Verificar si es fin de semana (sábado = 5, domingo = 6)
-    if fecha.weekday() >= 5:
-        return False
-    
-    # Verificar si es feriado
-    chile_holidays = holidays.Chile()
-    return fecha not in chile_holidays
+    # Fines de semana y feriados se resuelven en el índice precalculado
+    return obtener_calendario_habil().es_dia_habil(fecha)
 
 
 def obtener_feriados_chile(ano: int) -> list:
     """
     Obtiene la lista de feriados para un año específico en Chile.
+    Incluye los feriados judiciales y cierres registrados en FeriadoJudicial.
     
     Args:
         ano: Año para obtener los feriados
@@ -38,8 +36,7 @@ def obtener_feriados_chile(ano: int) -> list:
     Returns:
         Lista de fechas de feriados
     """
-    chile_holidays = holidays.Chile()
-    return [fecha for fecha in chile_holidays.keys() if fecha.year == ano]
+    return sorted(obtener_cache_feriados().feriados_del_ano(ano))
 
 
 def calcular_fecha_vencimiento(
@@ -68,21 +65,14 @@ def calcular_fecha_vencimiento(
     
     # El plazo comienza al día siguiente de la fecha_inicio
     fecha_actual = fecha_inicio + timedelta(days=1)
-    dias_contados = 0
     
     if tipo_dia == 'corrido':
         # Para días corridos, simplemente sumar los días
         return fecha_actual + timedelta(days=dias_plazo - 1)
     
     elif tipo_dia == 'habil':
-        # Para días hábiles, contar solo días hábiles
-        while dias_contados < dias_plazo:
-            if es_dia_habil(fecha_actual):
-                dias_contados += 1
-            fecha_actual += timedelta(days=1)
-        
-        # Retroceder un día porque el bucle avanza uno de más
-        return fecha_actual - timedelta(days=1)
+        # Para días hábiles, buscar el día hábil número dias_plazo en el índice
+        return obtener_calendario_habil().sumar_dias_habiles(fecha_actual, dias_plazo)
     
     return None
 
@@ -101,15 +91,94 @@ def calcular_dias_habiles_entre_fechas(fecha_inicio: date, fecha_fin: date) -> i
     if fecha_inicio > fecha_fin:
         return 0
     
-    dias_habiles = 0
-    fecha_actual = fecha_inicio
+    return obtener_calendario_habil().contar_dias_habiles(fecha_inicio, fecha_fin)
+
+
+def _a_lista(valores) -> list:
+    """
+    Convierte una secuencia (lista, tupla o arreglo NumPy) en lista de Python.
+    
+    Los arreglos ``datetime64[D]`` de NumPy se convierten en objetos ``date``.
+    """
+    if hasattr(valores, 'tolist'):
+        return valores.tolist()
+    return list(valores)
+
+
+def calcular_fechas_vencimiento_lote(
+    fechas_inicio: Sequence[date],
+    dias_plazo: Sequence[int],
+    tipo_dia: Union[str, Sequence[str]] = 'habil'
+) -> List[Optional[date]]:
+    """
+    Calcula en una sola pasada las fechas de vencimiento de muchos plazos.
+    
+    Equivale a llamar ``calcular_fecha_vencimiento`` fila por fila, pero
+    resuelve todos los plazos en días hábiles contra el índice de días
+    hábiles de una vez.
+    
+    Args:
+        fechas_inicio: Fechas de inicio (lista o arreglo NumPy ``datetime64[D]``)
+        dias_plazo: Días de plazo de cada fila
+        tipo_dia: Tipo de día común ('habil' o 'corrido') o uno por fila
+    
+    Returns:
+        Lista de fechas de vencimiento (None en las filas inválidas)
+    """
+    fechas_inicio = _a_lista(fechas_inicio)
+    dias_plazo = _a_lista(dias_plazo)
+    if isinstance(tipo_dia, str):
+        tipos_dia = [tipo_dia] * len(fechas_inicio)
+    else:
+        tipos_dia = _a_lista(tipo_dia)
+    
+    if not (len(fechas_inicio) == len(dias_plazo) == len(tipos_dia)):
+        raise ValueError("fechas_inicio, dias_plazo y tipo_dia deben tener el mismo largo")
+    
+    resultados = [None] * len(fechas_inicio)
+    indices_habiles = []
+    
+    for i, (fecha_inicio, dias, tipo) in enumerate(zip(fechas_inicio, dias_plazo, tipos_dia)):
+        if not fecha_inicio or not dias or dias <= 0:
+            continue
+        if tipo == 'corrido':
+            resultados[i] = fecha_inicio + timedelta(days=dias)
+        elif tipo == 'habil':
+            indices_habiles.append(i)
+    
+    if indices_habiles:
+        # El plazo comienza al día siguiente de la fecha_inicio
+        vencimientos = obtener_calendario_habil().sumar_dias_habiles_lote(
+            [fechas_inicio[i] + timedelta(days=1) for i in indices_habiles],
+            [dias_plazo[i] for i in indices_habiles]
+        )
+        for i, vencimiento in zip(indices_habiles, vencimientos):
+            resultados[i] = vencimiento
+    
+    return resultados
+
+
+def calcular_dias_habiles_entre_fechas_lote(
+    fechas_inicio: Sequence[date],
+    fechas_fin: Sequence[date]
+) -> List[int]:
+    """
+    Calcula en una sola pasada los días hábiles entre pares de fechas.
+    
+    Args:
+        fechas_inicio: Fechas de inicio (lista o arreglo NumPy ``datetime64[D]``)
+        fechas_fin: Fechas de fin, en el mismo orden
     
-    while fecha_actual <= fecha_fin:
-        if es_dia_habil(fecha_actual):
-            dias_habiles += 1
-        fecha_actual += timedelta(days=1)
+    Returns:
+        Lista con el número de días hábiles de cada par
+    """
+    fechas_inicio = _a_lista(fechas_inicio)
+    fechas_fin = _a_lista(fechas_fin)
     
-    return dias_habiles
+    if len(fechas_inicio) != len(fechas_fin):
+        raise ValueError("fechas_inicio y fechas_fin deben tener el mismo largo")
+    
+    return obtener_calendario_habil().contar_dias_habiles_lote(fechas_inicio, fechas_fin)
 
 
 def obtener_proximo_dia_habil(fecha: date) -> date:
@@ -122,12 +191,7 @@ def obtener_proximo_dia_habil(fecha: date) -> date:
     Returns:
         Próximo día hábil
     """
-    fecha_actual = fecha + timedelta(days=1)
-    
-    while not es_dia_habil(fecha_actual):
-        fecha_actual += timedelta(days=1)
-    
-    return fecha_actual
+    return obtener_calendario_habil().proximo_dia_habil(fecha)
 
 
 def es_fecha_vencimiento_valida(fecha_vencimiento: date, tipo_dia: str) -> bool:
@@ -0,0 +1,125 @@
+"""
+Recálculo masivo de fechas de vencimiento cuando cambia el calendario de feriados.
+
+Solo se revisan los plazos en días hábiles cuya ventana
+``(fecha_inicio, fecha_vencimiento]`` cruza las fechas modificadas. Las filas se
+recorren por id en lotes, se recalculan con el índice de días hábiles y se
+escriben con ``bulk_update``.
+"""
+
+from datetime import date
+from typing import Any, Dict, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from .cache_dashboard import invalidar_dashboard_global
+from .plazos import calcular_fechas_vencimiento_lote
+
+TAMANO_LOTE_DEFECTO = 5000
+
+
+def plazos_afectados(desde: date, hasta: Optional[date] = None, incluir_vencidos: bool = False):
+    """
+    Obtiene los plazos en días hábiles cuya ventana incluye alguna fecha del rango.
+
+    Args:
+        desde: Primera fecha modificada en el calendario
+        hasta: Última fecha modificada (por defecto igual a ``desde``)
+        incluir_vencidos: Si se deben revisar también los plazos vencidos
+
+    Returns:
+        QuerySet de PlazoJudicial afectados
+    """
+    from plazos.models import PlazoJudicial
+
+    hasta = hasta or desde
+    plazos = PlazoJudicial.objects.filter(
+        tipo_dia='habil',
+        fecha_vencimiento__gte=desde,
+        fecha_inicio__lt=hasta,
+    )
+    if not incluir_vencidos:
+        plazos = plazos.exclude(estado='vencido')
+    return plazos
+
+
+def recalcular_vencimientos(
+    desde: date,
+    hasta: Optional[date] = None,
+    incluir_vencidos: bool = False,
+    tamano_lote: int = TAMANO_LOTE_DEFECTO,
+    dry_run: bool = False,
+    max_muestras: int = 20,
+) -> Dict[str, Any]:
+    """
+    Recalcula la fecha de vencimiento de los plazos afectados por un cambio de feriados.
+
+    Args:
+        desde: Primera fecha modificada en el calendario
+        hasta: Última fecha modificada (por defecto igual a ``desde``)
+        incluir_vencidos: Si se deben revisar también los plazos vencidos
+        tamano_lote: Filas leídas y escritas por lote
+        dry_run: Si es True, calcula los cambios sin guardarlos
+        max_muestras: Cantidad máxima de cambios a incluir en el reporte
+
+    Returns:
+        Dict con el reporte: revisados, actualizados, sin_cambios y una
+        muestra de cambios ``(id, fecha_anterior, fecha_nueva)``
+    """
+    from plazos.models import PlazoJudicial
+
+    plazos = plazos_afectados(desde, hasta, incluir_vencidos).order_by('id')
+
+    revisados = 0
+    actualizados = 0
+    cambios = []
+    ultimo_id = 0
+
+    while True:
+        lote = list(
+            plazos.filter(id__gt=ultimo_id).values_list(
+                'id', 'fecha_inicio', 'dias_plazo', 'fecha_vencimiento'
+            )[:tamano_lote]
+        )
+        if not lote:
+            break
+
+        ultimo_id = lote[-1][0]
+        revisados += len(lote)
+
+        nuevas_fechas = calcular_fechas_vencimiento_lote(
+            [fila[1] for fila in lote],
+            [fila[2] for fila in lote],
+            'habil'
+        )
+
+        ahora = timezone.now()
+        modificados = []
+        for (plazo_id, _, _, fecha_anterior), fecha_nueva in zip(lote, nuevas_fechas):
+            if fecha_nueva is None or fecha_nueva == fecha_anterior:
+                continue
+            modificados.append(
+                PlazoJudicial(id=plazo_id, fecha_vencimiento=fecha_nueva, updated_at=ahora)
+            )
+            if len(cambios) < max_muestras:
+                cambios.append((plazo_id, fecha_anterior, fecha_nueva))
+
+        if modificados and not dry_run:
+            with transaction.atomic():
+                PlazoJudicial.objects.bulk_update(
+                    modificados, ['fecha_vencimiento', 'updated_at'], batch_size=tamano_lote
+                )
+        actualizados += len(modificados)
+
+    if actualizados and not dry_run:
+        # bulk_update no dispara señales
+        invalidar_dashboard_global()
+
+    return {
+        'revisados': revisados,
+        'actualizados': actualizados,
+        'sin_cambios': revisados - actualizados,
+        'cambios': cambios,
+        'dry_run': dry_run,
+    }
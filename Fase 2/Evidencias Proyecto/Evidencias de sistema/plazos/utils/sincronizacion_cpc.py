@@ -0,0 +1,208 @@
+"""
+Sincronización de ``CodigoProcedimiento`` con los artículos de la base local del CPC.
+
+``sincronizar_codigos`` lee los códigos existentes en una consulta, compara en
+memoria y escribe solo lo que cambió: un ``bulk_create`` para los nuevos y un
+``bulk_update`` para los modificados. La usan el comando
+``cargar_cpc_automatico`` y, a través de la cola de ``SincronizacionCPC``, la
+vista ``cargar_codigos_desde_bd`` (el comando ``procesar_exportaciones`` la procesa
+y devuelve a la cola las que quedaron "procesando" por la caída de un worker).
+"""
+
+import logging
+from datetime import timedelta
+from typing import Dict, Iterable
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Campos de CodigoProcedimiento que vienen de la base local del CPC
+CAMPOS_SINCRONIZADOS = [
+    'nombre', 'tipo_documento', 'tipo_procedimiento', 'dias_plazo', 'tipo_dia',
+    'articulo_cpc', 'descripcion', 'observaciones', 'activo',
+]
+
+TAMANO_LOTE_SINCRONIZACION = 500
+
+# Una sincronización "procesando" más antigua que esto se considera abandonada (worker caído)
+TIEMPO_MAXIMO_PROCESO = timedelta(minutes=30)
+
+MAX_INTENTOS = 3
+
+
+def sincronizar_codigos(articulos: Iterable, tamano_lote: int = TAMANO_LOTE_SINCRONIZACION) -> Dict:
+    """
+    Crea o actualiza los códigos de procedimiento de los artículos dados.
+
+    Args:
+        articulos: Artículos de ``CPCDatabase`` (o dicts con ``codigo`` y ``CAMPOS_SINCRONIZADOS``)
+        tamano_lote: Filas por consulta de escritura
+
+    Returns:
+        Dict con los conteos 'creados', 'actualizados' y 'sin_cambios', y las
+        listas 'codigos_creados' y 'codigos_actualizados'
+    """
+    from plazos.models import CodigoProcedimiento
+
+    # Un código repetido se queda con sus últimos datos, como al guardar uno por uno
+    datos_por_codigo = {
+        articulo['codigo']: {campo: articulo[campo] for campo in CAMPOS_SINCRONIZADOS}
+        for articulo in articulos
+    }
+
+    with transaction.atomic():
+        existentes = {
+            codigo.codigo: codigo
+            for codigo in CodigoProcedimiento.objects.filter(codigo__in=list(datos_por_codigo))
+            .only('id', 'codigo', *CAMPOS_SINCRONIZADOS)
+        }
+
+        ahora = timezone.now()
+        nuevos, modificados = [], []
+        for codigo, datos in datos_por_codigo.items():
+            existente = existentes.get(codigo)
+            if existente is None:
+                nuevos.append(CodigoProcedimiento(codigo=codigo, **datos))
+                continue
+            cambios = {campo: valor for campo, valor in datos.items() if getattr(existente, campo) != valor}
+            if cambios:
+                for campo, valor in cambios.items():
+                    setattr(existente, campo, valor)
+                # bulk_update no aplica auto_now
+                existente.updated_at = ahora
+                modificados.append(existente)
+
+        # Si otro proceso insertó el mismo código entre la lectura y la escritura, se actualiza
+        CodigoProcedimiento.objects.bulk_create(
+            nuevos,
+            batch_size=tamano_lote,
+            update_conflicts=True,
+            unique_fields=['codigo'],
+            update_fields=CAMPOS_SINCRONIZADOS + ['updated_at'],
+        )
+        CodigoProcedimiento.objects.bulk_update(
+            modificados, CAMPOS_SINCRONIZADOS + ['updated_at'], batch_size=tamano_lote,
+        )
+
+    return {
+        'creados': len(nuevos),
+        'actualizados': len(modificados),
+        'sin_cambios': len(datos_por_codigo) - len(nuevos) - len(modificados),
+        'codigos_creados': [codigo.codigo for codigo in nuevos],
+        'codigos_actualizados': [codigo.codigo for codigo in modificados],
+    }
+
+
+def encolar_sincronizacion(usuario=None):
+    """
+    Encola una sincronización de los códigos con la base local del CPC.
+
+    Si ya hay una pendiente se reutiliza.
+
+    Args:
+        usuario: Usuario que la solicita
+
+    Returns:
+        Tupla ``(sincronizacion, creada)``
+    """
+    from plazos.models import SincronizacionCPC
+
+    pendiente = SincronizacionCPC.objects.filter(estado='pendiente').first()
+    if pendiente:
+        return pendiente, False
+    try:
+        with transaction.atomic():
+            return SincronizacionCPC.objects.create(solicitado_por=usuario), True
+    except IntegrityError:
+        # Otra petición la encoló entre la consulta y la inserción
+        pendiente = SincronizacionCPC.objects.filter(estado='pendiente').first()
+        if pendiente is None:
+            raise
+        return pendiente, False
+
+
+def reclamar_sincronizacion():
+    """
+    Toma la sincronización pendiente y la marca como "procesando".
+
+    Returns:
+        La sincronización reclamada, o None si no hay pendiente
+    """
+    from plazos.models import SincronizacionCPC
+
+    for sincronizacion_id in SincronizacionCPC.objects.filter(estado='pendiente').values_list('id', flat=True)[:1]:
+        # Solo un proceso logra cambiar el estado
+        if SincronizacionCPC.objects.filter(id=sincronizacion_id, estado='pendiente').update(
+            estado='procesando', iniciado_en=timezone.now(), intentos=F('intentos') + 1,
+        ):
+            return SincronizacionCPC.objects.get(id=sincronizacion_id)
+    return None
+
+
+def procesar_sincronizacion(sincronizacion) -> bool:
+    """
+    Ejecuta una sincronización reclamada y guarda sus conteos.
+
+    Args:
+        sincronizacion: SincronizacionCPC en estado "procesando"
+
+    Returns:
+        True si terminó sin errores
+    """
+    from plazos.scrapers.cpc_database import obtener_articulos_cpc_desde_bd
+
+    try:
+        resumen = sincronizar_codigos(obtener_articulos_cpc_desde_bd())
+    except Exception as error:
+        logger.exception('Error en la sincronización del CPC %s', sincronizacion.pk)
+        sincronizacion.estado = 'error'
+        sincronizacion.error = str(error)[:1000]
+        sincronizacion.finalizado_en = timezone.now()
+        sincronizacion.save(update_fields=['estado', 'error', 'finalizado_en'])
+        return False
+
+    sincronizacion.estado = 'completado'
+    sincronizacion.creados = resumen['creados']
+    sincronizacion.actualizados = resumen['actualizados']
+    sincronizacion.sin_cambios = resumen['sin_cambios']
+    sincronizacion.finalizado_en = timezone.now()
+    sincronizacion.save(update_fields=['estado', 'creados', 'actualizados', 'sin_cambios', 'finalizado_en'])
+    return True
+
+
+def liberar_sincronizaciones_atascadas() -> int:
+    """
+    Devuelve a la cola las sincronizaciones que llevan demasiado tiempo "procesando".
+
+    Las que ya agotaron ``MAX_INTENTOS`` se marcan con error. Como solo puede
+    haber una pendiente, si ya hay otra encolada la atascada también se marca
+    con error: la pendiente hará la misma carga.
+
+    Returns:
+        Cantidad de sincronizaciones liberadas
+    """
+    from plazos.models import SincronizacionCPC
+
+    ahora = timezone.now()
+    atascadas = SincronizacionCPC.objects.filter(
+        estado='procesando', iniciado_en__lt=ahora - TIEMPO_MAXIMO_PROCESO,
+    )
+    atascadas.filter(intentos__gte=MAX_INTENTOS).update(
+        estado='error', error='El proceso se interrumpió en cada intento', finalizado_en=ahora,
+    )
+
+    liberadas = 0
+    for sincronizacion_id in atascadas.filter(intentos__lt=MAX_INTENTOS).values_list('id', flat=True):
+        atascada = SincronizacionCPC.objects.filter(id=sincronizacion_id, estado='procesando')
+        try:
+            with transaction.atomic():
+                liberadas += atascada.update(estado='pendiente', iniciado_en=None)
+        except IntegrityError:
+            atascada.update(
+                estado='error', error='El proceso se interrumpió; la reemplaza la sincronización pendiente',
+                finalizado_en=ahora,
+            )
+    return liberadas
@@ -1,15 +1,23 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse, JsonResponse
-from django.core.paginator import Paginator
-from django.db.models import Q
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.urls import reverse
 from django.utils import timezone
-from datetime import date, timedelta
-from .models import PlazoJudicial, CodigoProcedimiento
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from .models import PlazoJudicial, CodigoProcedimiento, SuscripcionCalendario, TrabajoExportacion
 from .forms import PlazoJudicialForm, FiltroPlazosForm
 from .utils.plazos import es_plazo_urgente, formatear_fecha_chilena
-# from .utils.export import exportar_pdf, exportar_ics
+from .utils.estadisticas import obtener_estadisticas_plazos, obtener_listados_dashboard
+from .utils.cache_dashboard import cache_compartido, obtener_fragmento, obtener_metricas_dashboard
+from .utils.paginacion import paginar_por_cursor
+from .utils.busqueda import buscar_plazos, LIMITE_RESULTADOS
+from .utils.filtros import compilar_filtros, compilar_parametros
+from .utils.ics import generar_ics, estado_feed, obtener_cuerpo_feed
+from .utils.export import generar_csv, nombre_descarga, normalizar_parametros, plazos_exportacion, TIPOS_CONTENIDO
+from .utils.cache_resultados import obtener_ids, plazos_filtrados
+from .utils.cola_exportacion import encolar_exportacion, resumen_trabajo
 import json
 
 
@@ -30,36 +38,21 @@ def index(request):
     if not request.user.is_authenticated:
         return redirect('landing')
     
-    # Filtrar solo plazos del usuario actual
-    plazos_usuario = PlazoJudicial.objects.filter(usuario=request.user)
+    # Estadísticas del usuario (una consulta, en caché por usuario)
+    estadisticas = obtener_estadisticas_plazos(request.user)
+    total_plazos = estadisticas['total']
     
-    # Estadísticas del usuario
-    total_plazos = plazos_usuario.count()
-    plazos_vencidos = plazos_usuario.filter(estado='vencido').count()
-    plazos_corriendo = plazos_usuario.filter(estado='corriendo').count()
-    plazos_urgentes = plazos_usuario.filter(
-        fecha_vencimiento__lte=date.today() + timedelta(days=3),
-        estado__in=['corriendo', 'pendiente']
-    ).count()
-    
-    # Plazos recientes del usuario (últimos 10)
-    plazos_recientes = plazos_usuario.order_by('-created_at')[:10]
-    
-    # Plazos que vencen en los próximos 7 días del usuario
-    plazos_proximos = plazos_usuario.filter(
-        fecha_vencimiento__lte=date.today() + timedelta(days=7),
-        fecha_vencimiento__gte=date.today(),
-        estado__in=['corriendo', 'pendiente']
-    ).order_by('fecha_vencimiento')[:5]
+    # Últimos 10 plazos y los que vencen en los próximos 7 días (una consulta, en caché por usuario)
+    plazos_recientes, plazos_proximos = obtener_listados_dashboard(request.user)
     
     # Verificar si es un usuario nuevo (sin plazos)
     es_usuario_nuevo = total_plazos == 0
     
     context = {
         'total_plazos': total_plazos,
-        'plazos_vencidos': plazos_vencidos,
-        'plazos_corriendo': plazos_corriendo,
-        'plazos_urgentes': plazos_urgentes,
+        'plazos_vencidos': estadisticas['vencidos'],
+        'plazos_corriendo': estadisticas['corriendo'],
+        'plazos_urgentes': estadisticas['urgentes'],
         'plazos_recientes': plazos_recientes,
         'plazos_proximos': plazos_proximos,
         'es_usuario_nuevo': es_usuario_nuevo,
@@ -104,97 +97,46 @@ def calendario(request):
     # Obtener parámetros de filtro
     form_filtro = FiltroPlazosForm(request.GET)
     
-    # Query base - solo plazos del usuario actual
-    plazos = PlazoJudicial.objects.filter(usuario=request.user)
-    
-    # Aplicar filtros
-    if form_filtro.is_valid():
-        # Filtros básicos
-        if form_filtro.cleaned_data.get('tipo_documento'):
-            plazos = plazos.filter(tipo_documento=form_filtro.cleaned_data['tipo_documento'])
-        
-        if form_filtro.cleaned_data.get('procedimiento'):
-            plazos = plazos.filter(procedimiento=form_filtro.cleaned_data['procedimiento'])
-        
-        if form_filtro.cleaned_data.get('estado'):
-            plazos = plazos.filter(estado=form_filtro.cleaned_data['estado'])
-        
-        # Filtros de fecha
-        if form_filtro.cleaned_data.get('fecha_desde'):
-            plazos = plazos.filter(fecha_vencimiento__gte=form_filtro.cleaned_data['fecha_desde'])
-        
-        if form_filtro.cleaned_data.get('fecha_hasta'):
-            plazos = plazos.filter(fecha_vencimiento__lte=form_filtro.cleaned_data['fecha_hasta'])
-        
-        # Búsqueda general avanzada
-        if form_filtro.cleaned_data.get('busqueda'):
-            busqueda = form_filtro.cleaned_data['busqueda']
-            busqueda_exacta = form_filtro.cleaned_data.get('busqueda_exacta', False)
-            incluir_observaciones = form_filtro.cleaned_data.get('incluir_observaciones', True)
-            
-            # Construir query de búsqueda
-            search_queries = Q()
-            
-            if busqueda_exacta:
-                # Búsqueda exacta
-                search_queries |= Q(rol__iexact=busqueda)
-                search_queries |= Q(clave_cliente__iexact=busqueda)
-                if incluir_observaciones:
-                    search_queries |= Q(observaciones__iexact=busqueda)
-            else:
-                # Búsqueda parcial (icontains)
-                search_queries |= Q(rol__icontains=busqueda)
-                search_queries |= Q(clave_cliente__icontains=busqueda)
-                if incluir_observaciones:
-                    search_queries |= Q(observaciones__icontains=busqueda)
-            
-            plazos = plazos.filter(search_queries)
-        
-        # Búsqueda específica
-        if form_filtro.cleaned_data.get('rol'):
-            plazos = plazos.filter(rol__icontains=form_filtro.cleaned_data['rol'])
-        
-        if form_filtro.cleaned_data.get('rut_cliente'):
-            plazos = plazos.filter(rut_cliente__icontains=form_filtro.cleaned_data['rut_cliente'])
-        
-        if form_filtro.cleaned_data.get('clave_cliente'):
-            plazos = plazos.filter(clave_cliente__icontains=form_filtro.cleaned_data['clave_cliente'])
-        
-        # Filtros especiales
-        if form_filtro.cleaned_data.get('solo_urgentes'):
-            plazos = plazos.filter(
-                fecha_vencimiento__lte=date.today() + timedelta(days=3),
-                estado__in=['corriendo', 'pendiente']
-            )
-        
-        if form_filtro.cleaned_data.get('solo_vencidos'):
-            plazos = plazos.filter(estado='vencido')
-        
-        # Ordenamiento
-        ordenar_por = form_filtro.cleaned_data.get('ordenar_por', 'fecha_vencimiento')
-        direccion = form_filtro.cleaned_data.get('direccion_orden', 'asc')
-        
-        # Validar que el campo de ordenamiento no esté vacío
-        if not ordenar_por or ordenar_por == '':
-            ordenar_por = 'fecha_vencimiento'
-        
-        if direccion == 'desc':
-            ordenar_por = f'-{ordenar_por}'
-        
-        plazos = plazos.order_by(ordenar_por, 'fecha_inicio')
-    else:
-        # Ordenamiento por defecto
-        plazos = plazos.order_by('fecha_vencimiento', 'fecha_inicio')
+    # Query base - solo plazos del usuario actual, con los filtros del formulario
+    filtro = compilar_filtros(form_filtro.cleaned_data if form_filtro.is_valid() else None)
+    plazos = filtro.queryset(request.user.pk, consumidor='calendario', ordenar=False)
+    
+    # Parámetros de filtro sin los de navegación, para los enlaces de paginación
+    parametros = request.GET.copy()
+    for parametro in ('cursor', 'page'):
+        parametros.pop(parametro, None)
+    parametros_filtro = parametros.urlencode()
+    
+    # Ids ordenados del filtro, cacheados para las páginas siguientes y las exportaciones
+    resultado = obtener_ids(request.user.pk, filtro)
+    
+    # Total de resultados: el largo de la lista o, si está truncada, una consulta
+    # COUNT cacheada por usuario y filtros
+    total_plazos = resultado.total
+    if total_plazos is None:
+        total_plazos = obtener_fragmento(
+            request.user.pk,
+            'conteo_calendario',
+            plazos.count,
+            variante=filtro.clave,
+        )
     
-    # Paginación
-    paginator = Paginator(plazos, 20)  # 20 plazos por página
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Paginación por cursor: 20 plazos por página
+    page_obj = paginar_por_cursor(
+        plazos,
+        ordenar_por=filtro.ordenar_por,
+        direccion=filtro.direccion,
+        cursor=request.GET.get('cursor'),
+        total=total_plazos,
+        ids=resultado.ids,
+        ids_completos=resultado.completo,
+    )
     
     context = {
         'page_obj': page_obj,
         'form_filtro': form_filtro,
-        'total_plazos': plazos.count(),
+        'total_plazos': total_plazos,
+        'parametros_filtro': parametros_filtro,
     }
     
     return render(request, 'plazos/calendario.html', context)
@@ -263,244 +205,166 @@ def detalle_plazo(request, plazo_id):
     return render(request, 'plazos/detalle_plazo.html', context)
 
 
-@login_required
-def exportar_pdf_view(request):
+def _encolar_exportacion(request, formato):
     """
-    Vista para exportar plazos a PDF.
-    """
-    from django.http import HttpResponse
-    from django.template.loader import render_to_string
-    from datetime import datetime
-    import io
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib import colors
-    from reportlab.lib.units import inch
-    
-    # Obtener plazos seleccionados o aplicar filtros
-    plazos_seleccionados = request.GET.getlist('plazos')
-    
-    if plazos_seleccionados:
-        # Exportar solo los plazos seleccionados
-        plazos = PlazoJudicial.objects.filter(id__in=plazos_seleccionados)
-        titulo = f"Plazos Seleccionados ({len(plazos)} plazos)"
-    else:
-        # Obtener plazos con los mismos filtros que el calendario
-        form_filtro = FiltroPlazosForm(request.GET)
-        plazos = PlazoJudicial.objects.filter(usuario=request.user)
-        
-        if form_filtro.is_valid():
-            if form_filtro.cleaned_data.get('tipo_documento'):
-                plazos = plazos.filter(tipo_documento=form_filtro.cleaned_data['tipo_documento'])
-            if form_filtro.cleaned_data.get('procedimiento'):
-                plazos = plazos.filter(procedimiento=form_filtro.cleaned_data['procedimiento'])
-            if form_filtro.cleaned_data.get('estado'):
-                plazos = plazos.filter(estado=form_filtro.cleaned_data['estado'])
-            if form_filtro.cleaned_data.get('fecha_desde'):
-                plazos = plazos.filter(fecha_vencimiento__gte=form_filtro.cleaned_data['fecha_desde'])
-            if form_filtro.cleaned_data.get('fecha_hasta'):
-                plazos = plazos.filter(fecha_vencimiento__lte=form_filtro.cleaned_data['fecha_hasta'])
-        
-        titulo = "Calendario de Plazos Judiciales"
-    
-    plazos = plazos.order_by('fecha_vencimiento', 'fecha_inicio')
-    
-    # Crear buffer para el PDF
-    buffer = io.BytesIO()
-    
-    # Crear documento PDF con márgenes optimizados
-    # Usar orientación horizontal si hay muchos plazos para mejor visualización
-    if plazos.count() > 10:
-        from reportlab.lib.pagesizes import landscape
-        doc = SimpleDocTemplate(buffer, pagesize=landscape(A4), rightMargin=50, leftMargin=50, topMargin=72, bottomMargin=50)
-    else:
-        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=50, leftMargin=50, topMargin=72, bottomMargin=50)
-    
-    # Estilos
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceAfter=30,
-        alignment=1  # Centrado
-    )
+    Encola la exportación con los filtros (o la selección) de la petición.
     
-    # Contenido del PDF
-    story = []
-    
-    # Título
-    story.append(Paragraph(titulo, title_style))
-    story.append(Spacer(1, 12))
-    
-    # Información de generación
-    fecha_gen = datetime.now().strftime("%d/%m/%Y %H:%M")
-    story.append(Paragraph(f"Generado el: {fecha_gen}", styles['Normal']))
-    story.append(Paragraph(f"Total de plazos: {plazos.count()}", styles['Normal']))
-    story.append(Spacer(1, 20))
-    
-    # Tabla de plazos
-    if plazos.exists():
-        # Encabezados de la tabla con texto más corto
-        data = [['Doc.', 'Procedimiento', 'Inicio', 'Vencimiento', 'Estado', 'RUT']]
-        
-        # Datos de los plazos
-        for plazo in plazos:
-            fecha_inicio = plazo.fecha_inicio.strftime("%d/%m/%Y") if plazo.fecha_inicio else "-"
-            fecha_vencimiento = plazo.fecha_vencimiento.strftime("%d/%m/%Y") if plazo.fecha_vencimiento else "-"
-            
-            data.append([
-                plazo.get_tipo_documento_display(),
-                plazo.get_procedimiento_display(),
-                fecha_inicio,
-                fecha_vencimiento,
-                plazo.get_estado_display(),
-                plazo.rut_cliente
-            ])
-    
-        # Crear tabla con anchos optimizados según orientación
-        if plazos.count() > 10:
-            # Orientación horizontal: más espacio disponible
-            table = Table(data, colWidths=[1.5*inch, 2.5*inch, 1.2*inch, 1.2*inch, 1*inch, 1.5*inch])
-        else:
-            # Orientación vertical: espacio limitado
-            table = Table(data, colWidths=[1.2*inch, 2*inch, 1*inch, 1*inch, 0.8*inch, 1.2*inch])
-        # Aplicar estilos a la tabla
-        table_style = TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('WRAP', (0, 0), (-1, -1), 'CENTER'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ])
-        
-        # Alternar colores de filas para mejor legibilidad
-        for i in range(1, len(data)):
-            if i % 2 == 0:
-                table_style.add('BACKGROUND', (0, i), (-1, i), colors.lightgrey)
-        
-        table.setStyle(table_style)
-    
-        story.append(table)
-    else:
-        story.append(Paragraph("No hay plazos para mostrar con los filtros aplicados.", styles['Normal']))
+    Responde JSON (202) a las peticiones AJAX y, en otro caso, una página que
+    consulta el estado y descarga el archivo cuando está listo.
+    """
+    parametros = normalizar_parametros(request.GET)
+    trabajo, creado = encolar_exportacion(request.user, formato, parametros)
+    url_estado = reverse('estado_exportacion', args=[trabajo.pk])
+    
+    if request.headers.get('x-requested-with') == 'XMLHttpRequest' or 'application/json' in request.headers.get('accept', ''):
+        datos = resumen_trabajo(trabajo, reverse('descargar_exportacion', args=[trabajo.pk]))
+        datos.update({'success': True, 'creado': creado, 'url_estado': url_estado})
+        return JsonResponse(datos, status=202 if creado else 200)
     
-    # Construir PDF
-    doc.build(story)
+    context = {
+        'trabajo': trabajo,
+        'url_estado': url_estado,
+    }
+    return render(request, 'plazos/export/estado_exportacion.html', context)
+
+
+@login_required
+def exportar_pdf_view(request):
+    """
+    Vista para exportar plazos a PDF (se genera en segundo plano).
+    """
+    return _encolar_exportacion(request, 'pdf')
+
+
+@login_required
+def exportar_excel_view(request):
+    """
+    Vista para exportar plazos a Excel (se genera en segundo plano).
+    """
+    return _encolar_exportacion(request, 'xlsx')
+
+
+@login_required
+def exportar_csv_view(request):
+    """
+    Vista para exportar a CSV los plazos filtrados, por streaming.
     
-    # Obtener el contenido del buffer
-    pdf_content = buffer.getvalue()
-    buffer.close()
+    Usa los mismos filtros y orden que el calendario; la memoria es constante
+    aunque se exporten cientos de miles de plazos.
+    """
+    plazos, _ = plazos_exportacion(request.user.pk, normalizar_parametros(request.GET))
     
-    # Crear respuesta HTTP
-    response = HttpResponse(pdf_content, content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="plazos_judiciales_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf"'
+    response = StreamingHttpResponse(generar_csv(plazos), content_type=TIPOS_CONTENIDO['csv'])
+    response['Content-Disposition'] = f'attachment; filename="{nombre_descarga("csv", timezone.localtime())}"'
     
     return response
 
 
+@login_required
+def encolar_exportacion_api(request, formato):
+    """
+    Vista AJAX que encola una exportación en cualquier formato (pdf, ics o xlsx).
+    """
+    if formato not in dict(TrabajoExportacion.FORMATOS):
+        raise Http404('Formato no soportado')
+    return _encolar_exportacion(request, formato)
+
+
+@login_required
+def estado_exportacion(request, trabajo_id):
+    """
+    Vista AJAX con el estado de un trabajo de exportación del usuario.
+    """
+    trabajo = get_object_or_404(TrabajoExportacion, id=trabajo_id, usuario=request.user)
+    datos = resumen_trabajo(trabajo, reverse('descargar_exportacion', args=[trabajo.pk]))
+    datos['success'] = True
+    return JsonResponse(datos)
+
+
+@login_required
+def descargar_exportacion(request, trabajo_id):
+    """
+    Descarga el archivo de una exportación terminada y vigente.
+    """
+    trabajo = get_object_or_404(TrabajoExportacion, id=trabajo_id, usuario=request.user)
+    if not trabajo.descargable:
+        raise Http404('La exportación no está disponible o ya expiró')
+    
+    return FileResponse(
+        trabajo.archivo.open('rb'),
+        as_attachment=True,
+        filename=trabajo.nombre_descarga,
+        content_type=TIPOS_CONTENIDO[trabajo.formato],
+    )
+
+
 @login_required
 def exportar_ics_view(request):
     """
     Vista para exportar plazos a formato iCalendar.
     """
-    from django.http import HttpResponse
-    from datetime import datetime
+    # Mismos filtros que el calendario; la selección también se limita al usuario
+    plazos, _ = plazos_exportacion(request.user.pk, normalizar_parametros(request.GET))
     
-    # Obtener plazos seleccionados o aplicar filtros
-    plazos_seleccionados = request.GET.getlist('plazos')
+    # Generar iCalendar por streaming: memoria constante sin importar la cantidad de plazos
+    response = StreamingHttpResponse(generar_ics(plazos), content_type=TIPOS_CONTENIDO['ics'])
+    response['Content-Disposition'] = f'attachment; filename="{nombre_descarga("ics", timezone.localtime())}"'
     
-    if plazos_seleccionados:
-        # Exportar solo los plazos seleccionados
-        plazos = PlazoJudicial.objects.filter(id__in=plazos_seleccionados)
-    else:
-        # Obtener plazos con los mismos filtros que el calendario
-        form_filtro = FiltroPlazosForm(request.GET)
-        plazos = PlazoJudicial.objects.filter(usuario=request.user)
-        
-        if form_filtro.is_valid():
-            if form_filtro.cleaned_data.get('tipo_documento'):
-                plazos = plazos.filter(tipo_documento=form_filtro.cleaned_data['tipo_documento'])
-            if form_filtro.cleaned_data.get('procedimiento'):
-                plazos = plazos.filter(procedimiento=form_filtro.cleaned_data['procedimiento'])
-            if form_filtro.cleaned_data.get('estado'):
-                plazos = plazos.filter(estado=form_filtro.cleaned_data['estado'])
-            if form_filtro.cleaned_data.get('fecha_desde'):
-                plazos = plazos.filter(fecha_vencimiento__gte=form_filtro.cleaned_data['fecha_desde'])
-            if form_filtro.cleaned_data.get('fecha_hasta'):
-                plazos = plazos.filter(fecha_vencimiento__lte=form_filtro.cleaned_data['fecha_hasta'])
-    
-    plazos = plazos.order_by('fecha_vencimiento', 'fecha_inicio')
-    
-    # Generar iCalendar simple
-    ics_content = "BEGIN:VCALENDAR\n"
-    ics_content += "VERSION:2.0\n"
-    ics_content += "PRODID:-//Calendario Judicial//ES\n"
-    ics_content += "CALSCALE:GREGORIAN\n"
+    return response
+
+
+def feed_ics(request, token):
+    """
+    Feed iCalendar de suscripción (Outlook, Google Calendar) con GET condicional.
     
-    for plazo in plazos:
-        if plazo.fecha_vencimiento:
-            ics_content += "BEGIN:VEVENT\n"
-            ics_content += f"UID:plazo-{plazo.id}@calendario-judicial.local\n"
-            ics_content += f"SUMMARY:{plazo.get_tipo_documento_display()} - {plazo.rol}\n"
-            ics_content += f"DTSTART:{plazo.fecha_vencimiento.strftime('%Y%m%d')}\n"
-            ics_content += f"DTEND:{plazo.fecha_vencimiento.strftime('%Y%m%d')}\n"
-            ics_content += f"DESCRIPTION:Procedimiento: {plazo.get_procedimiento_display()}\\n"
-            ics_content += f"Estado: {plazo.get_estado_display()}\\n"
-            ics_content += f"Clave: {plazo.clave_cliente}\n"
-            ics_content += "END:VEVENT\n"
-    
-    ics_content += "END:VCALENDAR\n"
-    
-    response = HttpResponse(ics_content, content_type='text/calendar; charset=utf-8')
-    response['Content-Disposition'] = f'attachment; filename="plazos_judiciales_{datetime.now().strftime("%Y%m%d_%H%M%S")}.ics"'
+    No requiere sesión: el token secreto de la URL identifica al usuario.
+    """
+    estado = estado_feed(token)
+    if estado is None:
+        raise Http404('Suscripción no encontrada')
+    usuario_id, etag, ultima_modificacion = estado
+    
+    # Solo el ETag decide el 304: eliminar un plazo no cambia necesariamente la fecha máxima
+    no_modificado = get_conditional_response(request, etag=quote_etag(etag))
+    if no_modificado is None:
+        respuesta = StreamingHttpResponse(
+            obtener_cuerpo_feed(usuario_id, etag),
+            content_type='text/calendar; charset=utf-8',
+        )
+        respuesta['Content-Disposition'] = 'inline; filename="plazos_judiciales.ics"'
+    else:
+        respuesta = no_modificado
     
-    return response
+    respuesta['ETag'] = quote_etag(etag)
+    if ultima_modificacion:
+        respuesta['Last-Modified'] = http_date(ultima_modificacion.timestamp())
+    respuesta['Cache-Control'] = 'private, no-cache'
+    return respuesta
 
 
 @login_required
-def actualizar_estados(request):
+def suscripcion_ics(request):
     """
-    Vista AJAX para actualizar estados de plazos.
+    Vista AJAX que entrega la URL de suscripción del usuario (POST la regenera).
     """
+    suscripcion = SuscripcionCalendario.obtener_o_crear(request.user)
     if request.method == 'POST':
-        plazos = PlazoJudicial.objects.filter(
-            estado__in=['pendiente', 'corriendo']
-        )
-        
-        actualizados = 0
-        for plazo in plazos:
-            estado_anterior = plazo.estado
-            plazo.actualizar_estado()
-            if plazo.estado != estado_anterior:
-                actualizados += 1
-        
-        return JsonResponse({
-            'success': True,
-            'actualizados': actualizados,
-            'message': f'Se actualizaron {actualizados} plazos.'
-        })
+        suscripcion.regenerar_token()
     
-    return JsonResponse({'success': False, 'message': 'Método no permitido.'})
+    return JsonResponse({
+        'success': True,
+        'url': request.build_absolute_uri(reverse('feed_ics', args=[suscripcion.token])),
+    })
 
 
 @login_required
 def obtener_plazos_json(request):
     """
     Vista AJAX para obtener plazos en formato JSON (para calendarios dinámicos).
+    
+    Acepta los mismos filtros que el calendario.
     """
-    plazos = PlazoJudicial.objects.filter(usuario=request.user)
+    plazos = plazos_filtrados(request.user.pk, compilar_parametros(request.GET), consumidor='json')
     
     eventos = []
     for plazo in plazos:
@@ -516,6 +380,55 @@ def obtener_plazos_json(request):
     return JsonResponse(eventos, safe=False)
 
 
+@login_required
+def buscar_plazos_api(request):
+    """
+    Vista AJAX de búsqueda de texto completo para la búsqueda avanzada del calendario.
+    """
+    consulta = request.GET.get('q', '').strip()
+    try:
+        limite = min(max(int(request.GET.get('limite', LIMITE_RESULTADOS)), 1), 100)
+    except ValueError:
+        limite = LIMITE_RESULTADOS
+    
+    plazos = buscar_plazos(
+        request.user,
+        consulta,
+        limite=limite,
+        campos=['id', 'tipo_documento', 'procedimiento', 'estado', 'fecha_vencimiento', 'rol'],
+    )
+    
+    return JsonResponse({
+        'query': consulta,
+        'results': [
+            {
+                'id': plazo.id,
+                'tipo_documento': plazo.get_tipo_documento_display(),
+                'procedimiento': plazo.get_procedimiento_display(),
+                'estado': plazo.estado,
+                'fecha_vencimiento': formatear_fecha_chilena(plazo.fecha_vencimiento),
+                'rol': plazo.rol,
+            }
+            for plazo in plazos
+        ],
+    })
+
+
+@login_required
+def metricas_cache_dashboard(request):
+    """
+    Vista AJAX con los aciertos y fallos del caché del dashboard (solo staff).
+    """
+    if not request.user.is_staff:
+        return JsonResponse({'success': False, 'message': 'No autorizado.'}, status=403)
+    
+    return JsonResponse({
+        'success': True,
+        'cache_compartido': cache_compartido(),
+        'metricas': obtener_metricas_dashboard(),
+    })
+
+
 def _obtener_color_estado(estado):
     """
     Obtiene el color CSS para un estado de plazo.
@@ -8,7 +8,7 @@ from django.http import JsonResponse
 from django.core.paginator import Paginator
 from django.db.models import Q
 from .models import CodigoProcedimiento
-from .scrapers.cpc_database import CPCDatabase
+from .utils.sincronizacion_cpc import encolar_sincronizacion
 
 
 @login_required
@@ -64,56 +64,21 @@ def gestionar_codigos_cpc(request):
 def cargar_codigos_desde_bd(request):
     """
     Vista para cargar códigos desde la base de datos local.
+
+    Solo encola la sincronización; la ejecuta el comando ``procesar_exportaciones``.
     """
     if request.method == 'POST':
         try:
-            # Obtener artículos desde la base de datos local
-            db = CPCDatabase()
-            articulos = db.obtener_todos_los_articulos()
-            
-            # Cargar códigos
-            codigos_creados = 0
-            codigos_actualizados = 0
-            
-            for articulo in articulos:
-                codigo, created = CodigoProcedimiento.objects.get_or_create(
-                    codigo=articulo['codigo'],
-                    defaults={
-                        'nombre': articulo['nombre'],
-                        'tipo_documento': articulo['tipo_documento'],
-                        'tipo_procedimiento': articulo['tipo_procedimiento'],
-                        'dias_plazo': articulo['dias_plazo'],
-                        'tipo_dia': articulo['tipo_dia'],
-                        'articulo_cpc': articulo['articulo_cpc'],
-                        'descripcion': articulo['descripcion'],
-                        'observaciones': articulo['observaciones'],
-                        'activo': articulo['activo']
-                    }
+            sincronizacion, creada = encolar_sincronizacion(request.user)
+            if creada:
+                messages.success(
+                    request,
+                    f'Carga de códigos encolada (#{sincronizacion.pk}). Los cambios se verán en unos segundos.'
                 )
-                
-                if created:
-                    codigos_creados += 1
-                else:
-                    # Actualizar si ya existe
-                    codigo.nombre = articulo['nombre']
-                    codigo.tipo_documento = articulo['tipo_documento']
-                    codigo.tipo_procedimiento = articulo['tipo_procedimiento']
-                    codigo.dias_plazo = articulo['dias_plazo']
-                    codigo.tipo_dia = articulo['tipo_dia']
-                    codigo.articulo_cpc = articulo['articulo_cpc']
-                    codigo.descripcion = articulo['descripcion']
-                    codigo.observaciones = articulo['observaciones']
-                    codigo.activo = articulo['activo']
-                    codigo.save()
-                    codigos_actualizados += 1
-            
-            messages.success(
-                request, 
-                f'Códigos cargados exitosamente. Creados: {codigos_creados}, Actualizados: {codigos_actualizados}'
-            )
-            
+            else:
+                messages.info(request, f'Ya hay una carga de códigos en cola (#{sincronizacion.pk}).')
         except Exception as e:
-            messages.error(request, f'Error al cargar códigos: {e}')
+            messages.error(request, f'Error al encolar la carga de códigos: {e}')
     
     return redirect('gestionar_codigos_cpc')
 
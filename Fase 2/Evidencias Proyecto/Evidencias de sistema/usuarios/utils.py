@@ -311,22 +311,19 @@ def obtener_estadisticas_usuario(usuario) -> Dict[str, Any]:
     Returns:
         Dict con estadísticas
     """
-    from plazos.models import PlazoJudicial
+    from plazos.utils.estadisticas import obtener_estadisticas_plazos
     
     if not usuario or not usuario.is_authenticated:
         return {}
     
-    plazos = PlazoJudicial.objects.filter(usuario=usuario)
+    estadisticas = obtener_estadisticas_plazos(usuario)
     
     return {
-        'total_plazos': plazos.count(),
-        'plazos_activos': plazos.filter(estado='corriendo').count(),
-        'plazos_vencidos': plazos.filter(estado='vencido').count(),
-        'plazos_suspendidos': plazos.filter(estado='suspendido').count(),
-        'plazos_urgentes': plazos.filter(
-            fecha_vencimiento__lte=date.today() + timedelta(days=3),
-            estado='corriendo'
-        ).count(),
+        'total_plazos': estadisticas['total'],
+        'plazos_activos': estadisticas['corriendo'],
+        'plazos_vencidos': estadisticas['vencidos'],
+        'plazos_suspendidos': estadisticas['suspendidos'],
+        'plazos_urgentes': estadisticas['urgentes_corriendo'],
         'tipo_usuario': usuario.tipo_usuario,
         'especialidad': usuario.especialidad,
         'fecha_registro': usuario.date_joined,